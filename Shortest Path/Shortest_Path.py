@@ -2,71 +2,93 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from collections import deque
 import random
-import math
 import heapq
+import os
+import sys
+
+# Shared grid/search helpers live next to the pygame visualizers
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'V2'))
+
+from heuristics import HEURISTICS, SQRT2, heuristic_for
+from bucket_queue import make_queue
+from grid_graph import GridGraph, seeded_weights
+from lpa_star import LPAStar
+from bidirectional import bidirectional_bfs, bidirectional_dijkstra
+from connectivity import ConnectivityIndex, walls_to_open
+from engine import ShortestPathTree
+from jump_point import JumpPointSearch
+from patterns import PATTERNS
 
 
 class Graph:
     def __init__(self):
         self.adjacent_list = {}
+        self.edge_weights = set()   # every weight used, kept up to date by add_edge
+        self.expanded = 0   # nodes expanded by the last search
+        self.diagonal = False   # built with diagonal edges (picks the A* heuristic)
 
     def add_vertex(self, vertex):
         if vertex not in self.adjacent_list:
             self.adjacent_list[vertex] = {}
 
-    def add_edge(self, u, v, weight=1):
+    def add_edge(self, u, v, weight=1, directed=False):
         self.add_vertex(u)
         self.add_vertex(v)
         self.adjacent_list[u][v] = weight
-        self.adjacent_list[v][u] = weight  # for undirected graph
+        self.edge_weights.add(weight)
+        if not directed:
+            self.adjacent_list[v][u] = weight  # for undirected graph
 
     def bfs(self, start, end):
         if start not in self.adjacent_list or end not in self.adjacent_list:
             return None
-        queue = deque([[start]])
-        visited = set()
         if start == end:
             return [start]
+        queue = deque([start])
+        prev = {start: None}
+        self.expanded = 0
         while queue:
-            path = queue.popleft()
-            node = path[-1]
-            if node not in visited:
-                visited.add(node)
-                for adj in self.adjacent_list[node]:
-                    new_path = list(path)
-                    new_path.append(adj)
+            node = queue.popleft()
+            self.expanded += 1
+            for adj in self.adjacent_list[node]:
+                if adj not in prev:
+                    prev[adj] = node
                     if adj == end:
-                        return new_path
-                    queue.append(new_path)
+                        return self.build_path(prev, end)
+                    queue.append(adj)
         return None
 
     def dijkstra(self, start, end):
         if start not in self.adjacent_list or end not in self.adjacent_list:
             return None
 
-        distances = {v: float('inf') for v in self.adjacent_list}
-        distances[start] = 0
+        # Only reached nodes get entries, so short queries don't pay O(V) up front
+        distances = {start: 0}
         prev = {}
-        pq = [(0, start)]
+        # Edge weights are integers 1..15, so this is normally a bucket queue
+        pq = make_queue(self.edge_weights)
+        pq.push(0, start)
+        self.expanded = 0
 
         while pq:
-            dist, node = heapq.heappop(pq)
+            dist, node = pq.pop()
 
             if node == end:
                 break
 
             if dist > distances[node]:
                 continue
+            self.expanded += 1
 
             for nbr in self.adjacent_list[node]:
                 # FIX: Use actual edge weight instead of hardcoded 1
                 edge_weight = self.adjacent_list[node][nbr]
                 new_distance = dist + edge_weight
 
-                if new_distance < distances[nbr]:
+                if new_distance < distances.get(nbr, float('inf')):
                     distances[nbr] = new_distance
                     prev[nbr] = node
-                    heapq.heappush(pq, (new_distance, nbr))
+                    pq.push(new_distance, nbr)
 
         # Reconstruct path
         path = []
@@ -80,30 +102,196 @@ class Graph:
 
         return path if path and path[0] == start else None
 
+    def min_weight(self):
+        return min(self.edge_weights, default=1)
+
+    def astar(self, start, end, heuristic='Manhattan'):
+        if start not in self.adjacent_list or end not in self.adjacent_list:
+            return None
+
+        estimate = heuristic_for(heuristic, self.diagonal)
+        min_weight = self.min_weight()
+
+        def h(node):
+            return estimate(abs(node[0] - end[0]), abs(node[1] - end[1]), min_weight)
+
+        distances = {start: 0}
+        prev = {start: None}
+        closed = set()
+        pq = [(h(start), h(start), start)]   # (f, h, node)
+        self.expanded = 0
+
+        while pq:
+            _, _, node = heapq.heappop(pq)
+            if node == end:
+                return self.build_path(prev, end)
+            if node in closed:
+                continue
+            closed.add(node)
+            self.expanded += 1
+
+            for nbr, edge_weight in self.adjacent_list[node].items():
+                new_distance = distances[node] + edge_weight
+                if nbr not in closed and new_distance < distances.get(nbr, float('inf')):
+                    distances[nbr] = new_distance
+                    prev[nbr] = node
+                    heapq.heappush(pq, (new_distance + h(nbr), h(nbr), nbr))
+
+        return None
+
     def dfs(self, start, end):
         if start not in self.adjacent_list or end not in self.adjacent_list:
             return None
 
-        stack = [[start]]
-        visited = set()
+        # Each stack entry is (node, node it was pushed from)
+        stack = [(start, None)]
+        prev = {}
+        self.expanded = 0
 
         while stack:
-            path = stack.pop()
-            node = path[-1]
+            node, came_from = stack.pop()
+            if node in prev:
+                continue
+            prev[node] = came_from
+            self.expanded += 1
 
             if node == end:
-                return path
+                return self.build_path(prev, end)
 
-            if node not in visited:
-                visited.add(node)
-                for neighbor in self.adjacent_list.get(node, []):
-                    if neighbor not in visited:
-                        new_path = list(path)
-                        new_path.append(neighbor)
-                        stack.append(new_path)
+            for neighbor in self.adjacent_list.get(node, []):
+                if neighbor not in prev:
+                    stack.append((neighbor, node))
 
         return None
 
+    def bidirectional_bfs(self, start, end):
+        if start not in self.adjacent_list or end not in self.adjacent_list:
+            return None
+        path, self.expanded = bidirectional_bfs(self.adjacent_list.__getitem__, start, end)
+        return path
+
+    def bidirectional_dijkstra(self, start, end):
+        if start not in self.adjacent_list or end not in self.adjacent_list:
+            return None
+
+        adjacent = self.adjacent_list
+
+        def edges(node):
+            return adjacent[node].items()
+
+        def reverse_edges(node):
+            # Grid neighbors are symmetric, only the costs differ by direction
+            return [(u, adjacent[u][node]) for u in adjacent[node]]
+
+        path, _, self.expanded = bidirectional_dijkstra(edges, reverse_edges, start, end)
+        return path
+
+    def build_path(self, prev, end):
+        """Walk the predecessor map back from end (start maps to None)."""
+        path = []
+        node = end
+        while node is not None:
+            path.append(node)
+            node = prev[node]
+        path.reverse()
+        return path
+
+
+class ImageGrid:
+    """Grid lines and obstacles painted into a single PhotoImage.
+
+    The canvas holds one image item instead of a line item per row and
+    column plus two rectangles per obstacle. set_cell() repaints one
+    edited cell with PhotoImage.put; sync() diffs the whole obstacle set
+    and is only meant for bulk changes.
+    """
+
+    def __init__(self, canvas, cols, rows, size, background='#ecf0f1', line='#bdc3c7',
+                 obstacle='#f1c40f', shadow='#7f8c8d'):
+        self.size = size
+        self.background, self.line = background, line
+        self.obstacle, self.shadow = obstacle, shadow
+        width, height = cols * size, rows * size
+        self.image = tk.PhotoImage(width=width, height=height)
+        self.image.put(background, to=(0, 0, width, height))
+        for x in range(0, width, size):
+            self.image.put(line, to=(x, 0, x + 1, height))
+        for y in range(0, height, size):
+            self.image.put(line, to=(0, y, width, y + 1))
+        self.item = canvas.create_image(0, 0, anchor='nw', image=self.image, tags="grid_image")
+        canvas.tag_lower(self.item)
+        self.obstacles = set()
+
+    def paint_cell(self, x, y, is_obstacle):
+        size, put = self.size, self.image.put
+        left, top = x * size, y * size
+        right, bottom = left + size, top + size
+        put(self.background, to=(left + 1, top + 1, right, bottom))
+        put(self.line, to=(left, top, right, top + 1))
+        put(self.line, to=(left, top, left + 1, bottom))
+        if is_obstacle:
+            # Same look as draw_square: shadow, white outline, body
+            put(self.shadow, to=(left + 4, top + 4, right, bottom))
+            put('white', to=(left + 2, top + 2, right - 2, bottom - 2))
+            put(self.obstacle, to=(left + 3, top + 3, right - 3, bottom - 3))
+
+    def set_cell(self, x, y, is_obstacle):
+        if ((x, y) in self.obstacles) != is_obstacle:
+            self.paint_cell(x, y, is_obstacle)
+            if is_obstacle:
+                self.obstacles.add((x, y))
+            else:
+                self.obstacles.discard((x, y))
+
+    def sync(self, obstacles):
+        """Bring the image in line with the obstacle set, cell by changed cell."""
+        for x, y in obstacles - self.obstacles:
+            self.paint_cell(x, y, True)
+        for x, y in self.obstacles - obstacles:
+            self.paint_cell(x, y, False)
+        self.obstacles = set(obstacles)
+
+
+class CellItemPool:
+    """One (shadow, body) canvas item pair per cell, created on first use.
+
+    Redraws go through itemconfigure only: show() recolors and reveals a
+    cell's pair, hide() hides it. Nothing is deleted and recreated, so
+    toggling one cell costs O(1) canvas calls.
+    """
+
+    def __init__(self, canvas, make_pair, layer):
+        self.canvas = canvas
+        self.make_pair = make_pair   # (x, y) -> (shadow id, body id), created hidden
+        self.layer = layer           # new items go just below this item
+        self.items = {}
+        self.shown = {}              # cell -> fill color currently visible
+
+    def show(self, cell, color):
+        if self.shown.get(cell) == color:
+            return
+        pair = self.items.get(cell)
+        if pair is None:
+            pair = self.items[cell] = self.make_pair(*cell)
+            for item in pair:
+                self.canvas.tag_lower(item, self.layer)
+        shadow, body = pair
+        self.canvas.itemconfigure(shadow, state='normal')
+        self.canvas.itemconfigure(body, fill=color, state='normal')
+        self.shown[cell] = color
+
+    def hide(self, cell):
+        if self.shown.pop(cell, None) is not None:
+            for item in self.items[cell]:
+                self.canvas.itemconfigure(item, state='hidden')
+
+    def sync(self, colors):
+        """Show exactly the cells in colors (cell -> fill), touching only changes."""
+        for cell in self.shown.keys() - colors.keys():
+            self.hide(cell)
+        for cell, color in colors.items():
+            self.show(cell, color)
+
 
 class PathfindingGUI:
     def __init__(self, root):
@@ -126,9 +314,19 @@ class PathfindingGUI:
         self.path = []
         self.dragging = None
         self.graph = Graph()
+        self.planner = None   # LPA* planner behind the live path
+        self.planner_endpoints = None
+        self.image_grid = None   # ImageGrid while "Image Grid" rendering is on
+        self.grid_graph = None   # GridGraph mirror of the obstacles, built on first use
+        self.components = None   # ConnectivityIndex over grid_graph
+        self.tree = None         # ShortestPathTree from start_pos over grid_graph
+        self.weights_seed = None   # seed behind self.weights (one weight per cell)
+        self.weights = None
+        self.graph_stale = True   # rebuild self.graph before the next search
         self.mode = "place_points"
         self.setup_ui()
         self.create_grid()
+        self.set_seed(self.seed_var.get())
 
     def setup_ui(self):
         # Title
@@ -156,6 +354,21 @@ class PathfindingGUI:
                        command=self.change_mode, bg='#2c3e50', fg='#ecf0f1', selectcolor='#34495e',
                        font=('Arial', 11)).pack(side='left', padx=10)
 
+        self.live_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(mode_frame, text="⚡ Live Path", variable=self.live_var,
+                       command=self.toggle_live_path, bg='#2c3e50', fg='#ecf0f1',
+                       selectcolor='#34495e', font=('Arial', 11)).pack(side='left', padx=10)
+
+        self.diagonal_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(mode_frame, text="↗ Diagonal Moves", variable=self.diagonal_var,
+                       command=self.toggle_diagonal, bg='#2c3e50', fg='#ecf0f1',
+                       selectcolor='#34495e', font=('Arial', 11)).pack(side='left', padx=10)
+
+        self.image_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(mode_frame, text="🖼 Image Grid", variable=self.image_var,
+                       command=self.toggle_image_grid, bg='#2c3e50', fg='#ecf0f1',
+                       selectcolor='#34495e', font=('Arial', 11)).pack(side='left', padx=10)
+
         # Control buttons and algorithm select bar
         control_frame = tk.Frame(self.root, bg='#2c3e50')
         control_frame.pack(pady=10)
@@ -199,9 +412,26 @@ class PathfindingGUI:
         algo_label = tk.Label(control_frame, text="Algorithm:", font=('Arial', 12), bg='#2c3e50', fg='white')
         algo_label.grid(row=0, column=5, padx=5)
         algo_menu = ttk.Combobox(control_frame, textvariable=self.algorithm, state="readonly",
-                                 values=["BFS", "DFS", "Dijkstra"], width=10)
+                                 values=["BFS", "DFS", "Dijkstra", "A*", "JPS",
+                                         "Bidirectional BFS", "Bidirectional Dijkstra"], width=20)
         algo_menu.grid(row=0, column=6, padx=5)
 
+        self.heuristic = tk.StringVar(value="Manhattan")
+        heuristic_menu = ttk.Combobox(control_frame, textvariable=self.heuristic, state="readonly",
+                                      values=list(HEURISTICS), width=18)
+        heuristic_menu.grid(row=1, column=6, padx=5, pady=5)
+        heuristic_label = tk.Label(control_frame, text="A* Heuristic:", font=('Arial', 12),
+                                   bg='#2c3e50', fg='white')
+        heuristic_label.grid(row=1, column=5, padx=5, pady=5)
+
+        self.seed_var = tk.IntVar(value=1)
+        seed_label = tk.Label(control_frame, text="Weight Seed:", font=('Arial', 12),
+                              bg='#2c3e50', fg='white')
+        seed_label.grid(row=1, column=3, padx=5, pady=5)
+        seed_box = tk.Spinbox(control_frame, from_=0, to=999999, textvariable=self.seed_var,
+                              width=10, font=('Arial', 11))
+        seed_box.grid(row=1, column=4, padx=5, pady=5)
+
         # Canvas frame with border
         canvas_frame = tk.Frame(self.root, bg='#34495e', relief='ridge', bd=3)
         canvas_frame.pack(pady=20)
@@ -227,9 +457,37 @@ class PathfindingGUI:
 
     def create_grid(self):
         for i in range(0, self.canvas_width, self.grid_size):
-            self.canvas.create_line(i, 0, i, self.canvas_height, fill='#bdc3c7', width=1)
+            self.canvas.create_line(i, 0, i, self.canvas_height, fill='#bdc3c7', width=1,
+                                    tags="grid_line")
         for i in range(0, self.canvas_height, self.grid_size):
-            self.canvas.create_line(0, i, self.canvas_width, i, fill='#bdc3c7', width=1)
+            self.canvas.create_line(0, i, self.canvas_width, i, fill='#bdc3c7', width=1,
+                                    tags="grid_line")
+
+        # Hidden markers that keep the pooled items in drawing order:
+        # obstacles, then start/end, then path circles, then the path line
+        layers = [self.canvas.create_line(0, 0, 0, 0, state='hidden') for _ in range(3)]
+        self.obstacle_items = CellItemPool(
+            self.canvas, lambda x, y: self.draw_square(x, y, '', "obstacle"), layers[0])
+        self.marker_items = CellItemPool(
+            self.canvas, lambda x, y: self.draw_circle(x, y, '', tag="marker"), layers[1])
+        self.path_items = CellItemPool(
+            self.canvas, lambda x, y: self.draw_circle(x, y, '', 0.6, "path"), layers[2])
+        self.path_line = self.canvas.create_line(0, 0, 0, 0, fill='#27ae60', width=4,
+                                                 state='hidden', tags="path")
+
+    def toggle_image_grid(self):
+        """Switch between canvas items and a single PhotoImage for the grid."""
+        if self.image_var.get():
+            self.canvas.itemconfigure("grid_line", state='hidden')
+            self.obstacle_items.sync({})
+            self.image_grid = ImageGrid(self.canvas, self.cols, self.rows, self.grid_size)
+            self.status_var.set("Image grid on: grid and obstacles are drawn into one image.")
+        else:
+            self.canvas.delete("grid_image")
+            self.image_grid = None
+            self.canvas.itemconfigure("grid_line", state='normal')
+        self.redraw_obstacles()
+        self.update_display()
 
     def change_mode(self):
         self.mode = self.mode_var.get()
@@ -250,28 +508,32 @@ class PathfindingGUI:
         center_x = x + self.grid_size / 2
         center_y = y + self.grid_size / 2
         shadow_offset = 2
-        self.canvas.create_oval(center_x - radius + shadow_offset,
-                                center_y - radius + shadow_offset,
-                                center_x + radius + shadow_offset,
-                                center_y + radius + shadow_offset,
-                                fill='#7f8c8d', outline='', tags=tag)
-        return self.canvas.create_oval(center_x - radius, center_y - radius,
+        shadow = self.canvas.create_oval(center_x - radius + shadow_offset,
+                                         center_y - radius + shadow_offset,
+                                         center_x + radius + shadow_offset,
+                                         center_y + radius + shadow_offset,
+                                         fill='#7f8c8d', outline='', state='hidden', tags=tag)
+        body = self.canvas.create_oval(center_x - radius, center_y - radius,
                                        center_x + radius, center_y + radius,
-                                       fill=color, outline='white', width=2, tags=tag)
+                                       fill=color, outline='white', width=2,
+                                       state='hidden', tags=tag)
+        return shadow, body
 
     def draw_square(self, grid_x, grid_y, color, tag=""):
         x, y = self.get_canvas_pos(grid_x, grid_y)
         padding = 2
         shadow_offset = 2
-        self.canvas.create_rectangle(x + padding + shadow_offset,
-                                     y + padding + shadow_offset,
-                                     x + self.grid_size - padding + shadow_offset,
-                                     y + self.grid_size - padding + shadow_offset,
-                                     fill='#7f8c8d', outline='', tags=tag)
-        return self.canvas.create_rectangle(x + padding, y + padding,
+        shadow = self.canvas.create_rectangle(x + padding + shadow_offset,
+                                              y + padding + shadow_offset,
+                                              x + self.grid_size - padding + shadow_offset,
+                                              y + self.grid_size - padding + shadow_offset,
+                                              fill='#7f8c8d', outline='', state='hidden', tags=tag)
+        body = self.canvas.create_rectangle(x + padding, y + padding,
                                             x + self.grid_size - padding,
                                             y + self.grid_size - padding,
-                                            fill=color, outline='white', width=2, tags=tag)
+                                            fill=color, outline='white', width=2,
+                                            state='hidden', tags=tag)
+        return shadow, body
 
     def on_click(self, event):
         grid_x, grid_y = self.get_grid_pos(event.x, event.y)
@@ -293,6 +555,8 @@ class PathfindingGUI:
         # Check if clicking on obstacle - remove it
         if (grid_x, grid_y) in self.obstacles:
             self.obstacles.remove((grid_x, grid_y))
+            self.obstacle_changed((grid_x, grid_y))
+            self.refresh_live_path([(grid_x, grid_y)])
             self.update_display()
             self.status_var.set("Obstacle removed!")
             return
@@ -313,6 +577,7 @@ class PathfindingGUI:
                 self.end_pos = (grid_x, grid_y)
                 self.status_var.set("End point moved!")
 
+        self.refresh_live_path()
         self.update_display()
 
     def handle_obstacle_drawing(self, grid_x, grid_y):
@@ -327,6 +592,8 @@ class PathfindingGUI:
             self.obstacles.add((grid_x, grid_y))
             self.status_var.set(f"Obstacle added at ({grid_x}, {grid_y})")
 
+        self.obstacle_changed((grid_x, grid_y))
+        self.refresh_live_path([(grid_x, grid_y)])
         self.update_display()
 
     def on_drag(self, event):
@@ -339,14 +606,22 @@ class PathfindingGUI:
                 self.start_pos = (grid_x, grid_y)
             elif self.dragging == 'end':
                 self.end_pos = (grid_x, grid_y)
+            # Live preview from the cached tree; LPA* catches up on release
+            self.preview_path()
             self.update_display()
         elif self.mode == "draw_obstacles":
             # Continuous obstacle drawing while dragging
-            if (grid_x, grid_y) != self.start_pos and (grid_x, grid_y) != self.end_pos:
+            if ((grid_x, grid_y) != self.start_pos and (grid_x, grid_y) != self.end_pos
+                    and (grid_x, grid_y) not in self.obstacles):
                 self.obstacles.add((grid_x, grid_y))
+                self.obstacle_changed((grid_x, grid_y))
+                self.refresh_live_path([(grid_x, grid_y)])
                 self.update_display()
 
     def on_release(self, event):
+        if self.dragging:
+            self.refresh_live_path()
+            self.update_display()
         self.dragging = None
         if self.start_pos and self.end_pos:
             self.status_var.set("Ready to find path! Click 'Find Shortest Path' button.")
@@ -361,10 +636,57 @@ class PathfindingGUI:
                 self.end_pos == (grid_x, grid_y) or
                 (grid_x, grid_y) in self.obstacles)
 
+    def toggle_diagonal(self):
+        """Switch between 4- and 8-connected moves; every cached graph has to be rebuilt."""
+        self.drop_grid_caches()
+        self.planner = None
+        self.path = []
+        self.refresh_live_path()
+        self.update_display()
+        moves = "8-connected (diagonals cost √2, no corner cutting)" if self.diagonal_var.get() else "4-connected"
+        self.status_var.set(f"Moves are now {moves}.")
+
+    def toggle_live_path(self):
+        self.planner = None
+        self.path = []
+        self.refresh_live_path()
+        self.update_display()
+        if self.live_var.get():
+            self.status_var.set("Live path on: the cheapest path follows every edit.")
+
+    def refresh_live_path(self, changed=()):
+        """Keep self.path current with LPA*, repairing only around the changed cells."""
+        if not self.live_var.get() or not self.start_pos or not self.end_pos:
+            return
+        self.follow_seed_box()
+        endpoints = (self.start_pos, self.end_pos)
+        if self.planner is None or self.planner_endpoints != endpoints:
+            # New endpoints or weights: start a fresh plan on a mirror of the grid
+            live_graph = GridGraph(self.cols, self.rows, diagonal=self.diagonal_var.get())
+            for x, y in self.obstacles:
+                live_graph.set_obstacle(x, y)
+            live_graph.weights[:] = self.weights
+            live_graph.weights_changed()
+            self.planner = LPAStar(live_graph, self.start_pos, self.end_pos)
+            self.planner_endpoints = endpoints
+        else:
+            for x, y in changed:
+                if (x, y) in self.obstacles:
+                    self.planner.graph.set_obstacle(x, y)
+                else:
+                    self.planner.graph.clear_obstacle(x, y)
+                self.planner.update_cell(x, y)
+        self.planner.compute_shortest_path()
+        self.path = self.planner.path() or []
+
     def clear_obstacles(self):
         """Clear all obstacles"""
         self.obstacles.clear()
+        self.drop_grid_caches()
         self.path = []
+        self.planner = None
+        self.refresh_live_path()
+        self.redraw_obstacles()
         self.update_display()
         self.status_var.set("All obstacles cleared!")
 
@@ -373,137 +695,184 @@ class PathfindingGUI:
             messagebox.showwarning("Warning", "Please place start and end points first!")
             return
         self.obstacles.clear()
-        patterns = ['maze_walls', 'spiral', 'clusters', 'corridors']
-        chosen_pattern = random.choice(patterns)
-        if chosen_pattern == 'maze_walls':
-            self.generate_maze_walls()
-        elif chosen_pattern == 'spiral':
-            self.generate_spiral_obstacles()
-        elif chosen_pattern == 'clusters':
-            self.generate_cluster_obstacles()
-        else:
-            self.generate_corridor_obstacles()
+        chosen_pattern = random.choice(list(PATTERNS))
+        walls = PATTERNS[chosen_pattern](self.cols, self.rows, random)
+        self.obstacles.update(walls - {self.start_pos, self.end_pos})
+        self.drop_grid_caches()
         self.ensure_path_exists()
+        self.planner = None
+        self.path = []
+        self.refresh_live_path()
+        self.redraw_obstacles()
         self.update_display()
         self.status_var.set(f"Generated {len(self.obstacles)} connected obstacles! Pattern: {chosen_pattern.title()}")
 
-    def generate_maze_walls(self):
-        for wall_x in range(5, self.cols, 8):
-            for y in range(1, self.rows - 1):
-                if random.random() < 0.7:
-                    pos = (wall_x, y)
-                    if pos != self.start_pos and pos != self.end_pos:
-                        self.obstacles.add(pos)
-        for wall_y in range(5, self.rows, 6):
-            for x in range(1, self.cols - 1):
-                if random.random() < 0.6:
-                    pos = (x, wall_y)
-                    if pos != self.start_pos and pos != self.end_pos:
-                        self.obstacles.add(pos)
-
-    def generate_spiral_obstacles(self):
-        center_x, center_y = self.cols // 2, self.rows // 2
-        max_radius = min(center_x, center_y) - 2
-        for radius in range(2, max_radius, 3):
-            angles = range(0, 360, 15)
-            for angle in angles:
-                x = center_x + int(radius * math.cos(math.radians(angle)))
-                y = center_y + int(radius * math.sin(math.radians(angle)))
-                if 0 <= x < self.cols and 0 <= y < self.rows:
-                    pos = (x, y)
-                    if pos != self.start_pos and pos != self.end_pos:
-                        self.obstacles.add(pos)
-
-    def generate_cluster_obstacles(self):
-        num_clusters = random.randint(4, 7)
-        for _ in range(num_clusters):
-            cluster_x = random.randint(3, self.cols - 4)
-            cluster_y = random.randint(3, self.rows - 4)
-            cluster_size = random.randint(8, 15)
-            for _ in range(cluster_size):
-                offset_x = random.randint(-3, 3)
-                offset_y = random.randint(-3, 3)
-                x = cluster_x + offset_x
-                y = cluster_y + offset_y
-                if 0 <= x < self.cols and 0 <= y < self.rows:
-                    pos = (x, y)
-                    if pos != self.start_pos and pos != self.end_pos:
-                        self.obstacles.add(pos)
-
-    def generate_corridor_obstacles(self):
-        for corridor_y in [self.rows // 4, 3 * self.rows // 4]:
-            for x in range(self.cols):
-                if random.random() < 0.8:
-                    pos = (x, corridor_y)
-                    if pos != self.start_pos and pos != self.end_pos:
-                        self.obstacles.add(pos)
-                    pos2 = (x, corridor_y + 1 if corridor_y < self.rows - 1 else corridor_y - 1)
-                    if pos2 != self.start_pos and pos2 != self.end_pos:
-                        self.obstacles.add(pos2)
-        for corridor_x in [self.cols // 3, 2 * self.cols // 3]:
-            for y in range(self.rows):
-                if random.random() < 0.7:
-                    pos = (corridor_x, y)
-                    if pos != self.start_pos and pos != self.end_pos:
-                        self.obstacles.add(pos)
-
     def ensure_path_exists(self):
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            self.build_graph()
-            test_path = self.graph.bfs(self.start_pos, self.end_pos)
-            if test_path:
-                break
-            obstacles_to_remove = random.sample(list(self.obstacles),
-                                                min(len(self.obstacles) // 4, 10))
-            for obs in obstacles_to_remove:
-                self.obstacles.remove(obs)
+        """Open the fewest walls needed to join start and end."""
+        components = self.connectivity()
+        if components.connected(self.start_pos, self.end_pos):
+            return
+        for pos in walls_to_open(components.graph, self.start_pos, self.end_pos):
+            self.obstacles.remove(pos)
+            self.obstacle_changed(pos)
+
+    def grid_mirror(self):
+        """GridGraph copy of the obstacles and weights shared by the index and the tree."""
+        if self.grid_graph is None:
+            self.grid_graph = GridGraph(self.cols, self.rows, diagonal=self.diagonal_var.get())
+            for x, y in self.obstacles:
+                self.grid_graph.set_obstacle(x, y)
+            self.grid_graph.weights[:] = self.weights
+            self.grid_graph.weights_changed()
+        return self.grid_graph
+
+    def connectivity(self):
+        """Connected components of the free cells, rebuilt after bulk edits."""
+        if self.components is None:
+            self.components = ConnectivityIndex(self.grid_mirror())
+        return self.components
+
+    def drop_grid_caches(self):
+        self.grid_graph = self.components = self.tree = None
+        self.graph_stale = True
+
+    def obstacle_changed(self, pos):
+        """Mirror one added or removed obstacle into the cached grid structures."""
+        self.draw_obstacle(pos)
+        self.tree = None
+        self.graph_stale = True
+        if self.grid_graph is None:
+            return
+        if pos in self.obstacles:
+            self.grid_graph.set_obstacle(*pos)
+            if self.components:
+                self.components.cell_blocked(*pos)
+        else:
+            self.grid_graph.clear_obstacle(*pos)
+            if self.components:
+                self.components.cell_freed(*pos)
+
+    def preview_path(self):
+        """Path to the end point read off the cached tree from the start point.
+
+        The tree is only rebuilt when the start moves, an obstacle changes
+        or the weight seed does, so dragging the end point costs
+        O(path length). It uses the same weights as "Find Shortest Path".
+        """
+        if not self.start_pos or not self.end_pos:
+            return
+        self.follow_seed_box()
+        graph = self.grid_mirror()
+        if self.start_pos not in graph:
+            self.path = []
+            return
+        if self.tree is None or self.tree.source != self.start_pos:
+            self.tree = ShortestPathTree(graph, self.start_pos)
+        self.path = self.tree.path_to(self.end_pos) or []
+
+    def set_seed(self, seed):
+        """Draw the per-cell weights for seed; the same seed always gives the same weights."""
+        if seed != self.weights_seed:
+            self.weights = seeded_weights(self.cols * self.rows, seed)
+            self.weights_seed = seed
+            self.graph_stale = True
+            self.tree = None
+            self.planner = None   # its g/rhs values were computed for the old weights
+            if self.grid_graph is not None:
+                self.grid_graph.weights[:] = self.weights
+                self.grid_graph.weights_changed()
+
+    def follow_seed_box(self):
+        """Apply the seed box to the weights the previews use."""
+        try:
+            self.set_seed(self.seed_var.get())
+        except tk.TclError:
+            pass   # half-typed seed: keep the current weights
 
     def build_graph(self):
+        """Rebuild self.graph from the obstacles and weights, unless nothing changed."""
+        if not self.graph_stale:
+            return
         self.graph = Graph()
+        self.graph.diagonal = diagonal = self.diagonal_var.get()
         for x in range(self.cols):
             for y in range(self.rows):
                 if (x, y) not in self.obstacles:
                     self.graph.add_vertex((x, y))
 
+        weights = self.weights
+        steps = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        if diagonal:
+            steps += [(1, 1), (-1, 1), (1, -1), (-1, -1)]
         for x in range(self.cols):
             for y in range(self.rows):
                 if (x, y) not in self.obstacles:
-                    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                    for dx, dy in steps:
                         nx, ny = x + dx, y + dy
-                        if (0 <= nx < self.cols and 0 <= ny < self.rows and
+                        if not (0 <= nx < self.cols and 0 <= ny < self.rows and
                                 (nx, ny) not in self.obstacles):
-                            weight = random.randint(1, 15)  # Random weight between 1 and 15
-                            self.graph.add_edge((x, y), (nx, ny), weight)
+                            continue
+                        # Moving into a cell costs that cell's weight
+                        weight = weights[ny * self.cols + nx]
+                        if dx and dy:
+                            # No cutting past a wall corner; the longer step costs sqrt(2) more
+                            if (nx, y) in self.obstacles or (x, ny) in self.obstacles:
+                                continue
+                            weight *= SQRT2
+                        self.graph.add_edge((x, y), (nx, ny), weight, directed=True)
+        self.graph_stale = False
 
     def find_path(self):
         if not self.start_pos or not self.end_pos:
             messagebox.showwarning("Warning", "Please place both start and end points!")
             return
-        self.build_graph()
         algorithm = self.algorithm.get()
+        try:
+            self.set_seed(self.seed_var.get())
+        except tk.TclError:
+            messagebox.showwarning("Warning", "The weight seed must be a whole number!")
+            return
+        if not self.connectivity().connected(self.start_pos, self.end_pos):
+            # Different components: no search can succeed, so don't run one
+            messagebox.showinfo("No Path", "Start and end are not connected!")
+            self.status_var.set("No path found! Try removing some obstacles.")
+            return
+        self.build_graph()
+        searcher = None
         if algorithm == "BFS":
             path = self.graph.bfs(self.start_pos, self.end_pos)
         elif algorithm == "DFS":
             path = self.graph.dfs(self.start_pos, self.end_pos)
+        elif algorithm == "A*":
+            path = self.graph.astar(self.start_pos, self.end_pos, self.heuristic.get())
+        elif algorithm == "JPS":
+            # Jump Point Search needs the grid layout, so it runs on the GridGraph mirror
+            searcher = JumpPointSearch(self.grid_mirror(), diagonal=self.diagonal_var.get())
+            path = searcher.search(self.start_pos, self.end_pos)[0]
+        elif algorithm == "Bidirectional BFS":
+            path = self.graph.bidirectional_bfs(self.start_pos, self.end_pos)
+        elif algorithm == "Bidirectional Dijkstra":
+            path = self.graph.bidirectional_dijkstra(self.start_pos, self.end_pos)
         else:
             path = self.graph.dijkstra(self.start_pos, self.end_pos)
         if path:
             self.path = path
             self.animate_path_finding()
-            self.status_var.set(f"{algorithm} Path found! Length: {len(path)} steps")
+            self.status_var.set(f"{algorithm} Path found! Length: {len(path)} steps, "
+                                f"{(searcher or self.graph).expanded} nodes expanded")
         else:
             messagebox.showinfo("No Path", f"No path found using {algorithm}!")
             self.status_var.set("No path found! Try removing some obstacles.")
 
     def animate_path_finding(self):
-        self.canvas.delete("path")
+        self.path_items.sync({})
+        self.canvas.itemconfigure(self.path_line, state='hidden')
 
         def draw_path_step(step):
             if step < len(self.path):
                 x, y = self.path[step]
                 if (x, y) != self.start_pos and (x, y) != self.end_pos:
-                    self.draw_circle(x, y, '#2ecc71', 0.6, "path")
+                    self.path_items.show((x, y), '#2ecc71')
                 self.root.after(100, lambda: draw_path_step(step + 1))
             else:
                 self.draw_path_lines()
@@ -511,56 +880,59 @@ class PathfindingGUI:
         draw_path_step(0)
 
     def draw_path_lines(self):
+        # The whole path is one line item whose points are replaced in place
         if len(self.path) < 2:
+            self.canvas.itemconfigure(self.path_line, state='hidden')
             return
-        for i in range(len(self.path) - 1):
-            x1, y1 = self.path[i]
-            x2, y2 = self.path[i + 1]
-            canvas_x1, canvas_y1 = self.get_canvas_pos(x1, y1)
-            canvas_x2, canvas_y2 = self.get_canvas_pos(x2, y2)
-            center_x1 = canvas_x1 + self.grid_size / 2
-            center_y1 = canvas_y1 + self.grid_size / 2
-            center_x2 = canvas_x2 + self.grid_size / 2
-            center_y2 = canvas_y2 + self.grid_size / 2
-            self.canvas.create_line(center_x1, center_y1, center_x2, center_y2,
-                                    fill='#27ae60', width=4, tags="path")
+        half = self.grid_size / 2
+        points = []
+        for x, y in self.path:
+            canvas_x, canvas_y = self.get_canvas_pos(x, y)
+            points += [canvas_x + half, canvas_y + half]
+        self.canvas.coords(self.path_line, *points)
+        self.canvas.itemconfigure(self.path_line, state='normal')
 
     def update_display(self):
-        """Update the visual display"""
-        self.canvas.delete("start")
-        self.canvas.delete("end")
-        self.canvas.delete("obstacle")
-        self.canvas.delete("path")
-
-        # Draw obstacles
-        for x, y in self.obstacles:
-            self.draw_square(x, y, '#f1c40f', "obstacle")
-
-        # Draw start point
+        """Update the markers and the path; obstacles are drawn as they change."""
+        # Start and end points
+        markers = {}
         if self.start_pos:
-            self.draw_circle(self.start_pos[0], self.start_pos[1], '#e74c3c', tag="start")
-
-        # Draw end point
+            markers[self.start_pos] = '#e74c3c'
         if self.end_pos:
-            self.draw_circle(self.end_pos[0], self.end_pos[1], '#2c3e50', tag="end")
+            markers[self.end_pos] = '#2c3e50'
+        self.marker_items.sync(markers)
+
+        # Path, if it exists
+        self.path_items.sync({(x, y): '#2ecc71' for x, y in self.path
+                              if (x, y) != self.start_pos and (x, y) != self.end_pos})
+        self.draw_path_lines()
+
+    def draw_obstacle(self, pos):
+        """Show or hide the obstacle at one cell after a single edit."""
+        if self.image_grid:
+            self.image_grid.set_cell(*pos, pos in self.obstacles)
+        elif pos in self.obstacles:
+            self.obstacle_items.show(pos, '#f1c40f')
+        else:
+            self.obstacle_items.hide(pos)
 
-        # Redraw path if it exists
-        if self.path:
-            for x, y in self.path:
-                if (x, y) != self.start_pos and (x, y) != self.end_pos:
-                    self.draw_circle(x, y, '#2ecc71', 0.6, "path")
-            self.draw_path_lines()
+    def redraw_obstacles(self):
+        """Bring every obstacle in line with self.obstacles, after bulk changes."""
+        if self.image_grid:
+            self.image_grid.sync(self.obstacles)
+        else:
+            self.obstacle_items.sync(dict.fromkeys(self.obstacles, '#f1c40f'))
 
     def reset_all(self):
         """Reset everything"""
         self.start_pos = None
         self.end_pos = None
         self.obstacles = set()
+        self.drop_grid_caches()
         self.path = []
-        self.canvas.delete("start")
-        self.canvas.delete("end")
-        self.canvas.delete("obstacle")
-        self.canvas.delete("path")
+        self.planner = None
+        self.redraw_obstacles()
+        self.update_display()
         self.status_var.set("Reset complete! Select mode and click to place start point (red).")
 
     def show_algorithm_explanation(self):
@@ -573,8 +945,10 @@ class PathfindingGUI:
 1️⃣ Start at the red point (start position)
 2️⃣ {"Explore neighbors level by level" if self.algorithm.get() == "BFS" else
         "Explore one path deeply" if self.algorithm.get() == "DFS" else
+        "Expand the cell with the lowest cost + estimated distance to the goal" if self.algorithm.get() == "A*" else
+        "Jump along straight runs, stopping only where the path could turn" if self.algorithm.get() == "JPS" else
         "Find path with lowest total weight"}
-3️⃣ {"Ignore weights, find shortest path" if self.algorithm.get() == "BFS" else
+3️⃣ {"Ignore weights, find shortest path" if self.algorithm.get() in ("BFS", "JPS") else
         "Ignore weights, find any path" if self.algorithm.get() == "DFS" else
         "Consider weights, find lowest cost path"}
 4️⃣ Find the black point (end position)
@@ -584,6 +958,10 @@ class PathfindingGUI:
 • BFS: Shortest path by steps (ignores weights)
 • DFS: Any valid path (ignores weights)  
 • Dijkstra: Shortest path by total weight
+• A*: Same path cost as Dijkstra, guided towards the goal by a heuristic
+• JPS: Shortest path by steps (ignores weights), expanding only jump points
+• Bidirectional BFS/Dijkstra: Search from both ends and stop once the
+  two frontiers can no longer improve the best meeting point
 
 ⏱️ COMPLEXITY:
 • Time: O(V + E)
@@ -591,6 +969,8 @@ class PathfindingGUI:
 
 ✅ {"Shortest path by steps (BFS)" if self.algorithm.get() == "BFS" else
         "Any valid path (DFS)" if self.algorithm.get() == "DFS" else
+        "Shortest path by total weight (A*)" if self.algorithm.get() == "A*" else
+        "Shortest path by steps (JPS)" if self.algorithm.get() == "JPS" else
         "Shortest path by total weight (Dijkstra)"}! 🎉
 
 🎯 HOW TO USE:
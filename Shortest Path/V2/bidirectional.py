@@ -0,0 +1,119 @@
+import heapq
+
+INF = float('inf')
+SIDES = ('forward', 'backward')
+
+# Both searches work on any hashable node type: forward(u) yields (v, cost)
+# for edges u -> v, backward(v) yields (u, cost) for edges u -> v.
+# animate(node, side, state) is called with side in SIDES and state
+# 'visited' (expanded) or 'frontier' (first discovered).
+
+
+def join_paths(parents, meet):
+    """Forward chain start..meet followed by the backward chain after meet."""
+    forward, backward = parents
+    path = []
+    node = meet
+    while node is not None:
+        path.append(node)
+        node = forward[node]
+    path.reverse()
+    node = backward[meet]
+    while node is not None:
+        path.append(node)
+        node = backward[node]
+    return path
+
+
+def bidirectional_bfs(neighbors, start, end, animate=None):
+    """Unweighted search from both ends; returns (path, expanded).
+
+    The side with the smaller frontier expands one whole layer at a time.
+    Meetings are collected over the full layer and the shortest one wins,
+    which keeps the result a shortest path.
+    """
+    if start == end:
+        return [start], 0
+    depth = ({start: 0}, {end: 0})
+    parents = ({start: None}, {end: None})
+    frontiers = ([start], [end])
+    expanded = 0
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, other = depth[side], depth[1 - side]
+        best, meet = INF, None
+        layer = []
+        for node in frontiers[side]:
+            expanded += 1
+            if animate:
+                animate(node, SIDES[side], 'visited')
+            for adj in neighbors(node):
+                if adj not in mine:
+                    mine[adj] = mine[node] + 1
+                    parents[side][adj] = node
+                    layer.append(adj)
+                    if animate:
+                        animate(adj, SIDES[side], 'frontier')
+                if adj in other and mine[adj] + other[adj] < best:
+                    best, meet = mine[adj] + other[adj], adj
+        if meet is not None:
+            return join_paths(parents, meet), expanded
+        frontiers = (layer, frontiers[1]) if side == 0 else (frontiers[0], layer)
+
+    return None, expanded
+
+
+def bidirectional_dijkstra(forward, backward, start, end, animate=None, stats=None):
+    """Weighted search from both ends; returns (path, cost, expanded).
+
+    If stats is given, its pushes attribute is set to the number of
+    heap pushes on both sides.
+
+    The side with the smaller queue minimum is expanded next. mu is the
+    best start-to-end cost seen through any node reached by both sides;
+    once the two queue minimums add up to at least mu, no better path
+    exists and the search stops.
+    """
+    if start == end:
+        if stats is not None:
+            stats.pushes = 0
+        return [start], 0, 0
+    dist = ({start: 0}, {end: 0})
+    parents = ({start: None}, {end: None})
+    settled = (set(), set())
+    queues = ([(0, start)], [(0, end)])
+    edges = (forward, backward)
+    mu, meet = INF, None
+    expanded, pushes = 0, 2
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= mu:
+            break
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        cost, node = heapq.heappop(queues[side])
+        if node in settled[side]:
+            continue
+        settled[side].add(node)
+        expanded += 1
+        if animate:
+            animate(node, SIDES[side], 'visited')
+
+        mine, other = dist[side], dist[1 - side]
+        for adj, weight in edges[side](node):
+            new_cost = cost + weight
+            if new_cost < mine.get(adj, INF):
+                if adj not in mine and animate:
+                    animate(adj, SIDES[side], 'frontier')
+                mine[adj] = new_cost
+                parents[side][adj] = node
+                heapq.heappush(queues[side], (new_cost, adj))
+                pushes += 1
+            if adj in other and mine[adj] + other[adj] < mu:
+                mu, meet = mine[adj] + other[adj], adj
+
+    if stats is not None:
+        stats.pushes = pushes
+    if meet is None:
+        return None, None, expanded
+    return join_paths(parents, meet), mu, expanded
@@ -0,0 +1,65 @@
+import heapq
+
+# Largest edge weight that still gets a bucket queue; grid weights are 1..15
+MAX_BUCKET_WEIGHT = 255
+
+
+class BucketQueue:
+    """Circular bucket queue for Dijkstra with small integer weights (Dial's algorithm).
+
+    Every queued cost lies in [current, current + max_weight], so
+    max_weight + 1 buckets indexed by cost modulo their count are enough.
+    A lower cost moves the item to its new bucket instead of queueing a
+    duplicate, and push/pop are O(1) with no tuple comparisons.
+    """
+
+    def __init__(self, max_weight):
+        self.buckets = [{} for _ in range(max_weight + 1)]
+        self.queued = {}   # item -> cost it is queued at
+        self.cost = 0      # cost of the bucket being drained
+
+    def push(self, cost, item):
+        buckets = self.buckets
+        old = self.queued.get(item)
+        if old is not None:
+            if old <= cost:
+                return
+            del buckets[old % len(buckets)][item]
+        buckets[cost % len(buckets)][item] = None
+        self.queued[item] = cost
+
+    def pop(self):
+        buckets = self.buckets
+        count = len(buckets)
+        while not buckets[self.cost % count]:
+            self.cost += 1
+        item, _ = buckets[self.cost % count].popitem()
+        del self.queued[item]
+        return self.cost, item
+
+    def __len__(self):
+        return len(self.queued)
+
+
+class HeapQueue:
+    """Binary heap with the same push/pop interface, for arbitrary weights."""
+
+    def __init__(self):
+        self.heap = []
+
+    def push(self, cost, item):
+        heapq.heappush(self.heap, (cost, item))
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+
+def make_queue(weights):
+    """Pick a bucket queue when every weight is a small non-negative integer."""
+    weights = list(weights)
+    if all(isinstance(w, int) and 0 <= w <= MAX_BUCKET_WEIGHT for w in weights):
+        return BucketQueue(max(weights, default=1))
+    return HeapQueue()
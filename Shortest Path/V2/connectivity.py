@@ -0,0 +1,112 @@
+from collections import deque
+
+
+class DisjointSet:
+    """Union-find over 0..size-1 with union by rank and path halving."""
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.rank = bytearray(size)   # ranks stay below log2(size)
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.rank[a] < self.rank[b]:
+            a, b = b, a
+        self.parent[b] = a
+        if self.rank[a] == self.rank[b]:
+            self.rank[a] += 1
+        return True
+
+
+class ConnectivityIndex:
+    """Connected components of the free cells of a GridGraph.
+
+    connected() answers "is there any path?" in near O(1), so searches
+    between cells in different components can be skipped outright.
+    Freeing a cell merges components in place (cell_freed). A new wall can
+    split a component, which union-find cannot undo, so cell_blocked()
+    only marks the index stale and the next query rebuilds it.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.rebuild()
+
+    def rebuild(self):
+        graph = self.graph
+        cols, size, obstacles = graph.cols, graph.size, graph.obstacles
+        sets = DisjointSet(size)
+        for i in range(size):
+            if obstacles[i]:
+                continue
+            # Right and down neighbors only, so every edge is joined once
+            if (i + 1) % cols and not obstacles[i + 1]:
+                sets.union(i, i + 1)
+            if i + cols < size and not obstacles[i + cols]:
+                sets.union(i, i + cols)
+        self.sets = sets
+        self.stale = False
+
+    def connected(self, a, b):
+        """True if free cells a and b, given as (x, y), are joined by some path."""
+        graph = self.graph
+        if a not in graph or b not in graph:
+            return False
+        if self.stale:
+            self.rebuild()
+        return self.sets.find(graph.index(a)) == self.sets.find(graph.index(b))
+
+    def cell_freed(self, x, y):
+        """Call after graph.clear_obstacle(x, y)."""
+        if not self.stale:
+            i = self.graph.index((x, y))
+            for j in self.graph.neighbors(i):
+                self.sets.union(i, j)
+
+    def cell_blocked(self, x, y):
+        """Call after graph.set_obstacle(x, y)."""
+        self.stale = True
+
+
+def walls_to_open(graph, start, end):
+    """Fewest obstacle cells whose removal connects start and end.
+
+    0-1 BFS where stepping onto a wall costs 1 and onto a free cell 0;
+    returns the walls on the cheapest route as (x, y) tuples.
+    """
+    cols, rows, obstacles = graph.cols, graph.rows, graph.obstacles
+    source, target = graph.index(start), graph.index(end)
+    cost = [graph.size + 1] * graph.size
+    parent = [-1] * graph.size
+    cost[source] = obstacles[source]
+    parent[source] = source
+    queue = deque([source])
+
+    while queue:
+        node = queue.popleft()
+        if node == target:
+            break
+        x, y = node % cols, node // cols
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < cols and 0 <= ny < rows:
+                j = ny * cols + nx
+                new_cost = cost[node] + obstacles[j]
+                if new_cost < cost[j]:
+                    cost[j] = new_cost
+                    parent[j] = node
+                    if obstacles[j]:
+                        queue.append(j)
+                    else:
+                        queue.appendleft(j)
+
+    return [cell for cell in graph.trace_path(parent, source, target)
+            if obstacles[graph.index(cell)]]
@@ -0,0 +1,163 @@
+"""Contraction hierarchy over a static GridGraph.
+
+Free cells are contracted one at a time in order of importance. Whenever
+removing a cell v would break the shortest path u -> v -> w between two
+remaining neighbors, a shortcut u -> w is added. A query then only has
+to move upward in that order: a forward Dijkstra from the source and a
+backward one from the target, both over edges to higher-ranked cells,
+meet at the top of the shortest path. Shortcuts remember the cell they
+skip, so paths unpack back into grid moves.
+
+The hierarchy is a snapshot: rebuild it after walls or weights change.
+"""
+import heapq
+
+from bidirectional import join_paths
+
+INF = float('inf')
+
+# Witness searches give up after settling this many cells; a missed
+# witness only costs an unneeded shortcut, never a wrong answer
+WITNESS_SETTLE_LIMIT = 60
+
+
+class ContractionHierarchy:
+    def __init__(self, graph):
+        self.graph = graph
+        self.rank = {}       # cell index -> contraction order
+        self.up = {}         # up[u]: (v, cost) for edges u -> v with v ranked higher
+        self.down = {}       # down[v]: (u, cost) for edges u -> v with u ranked higher
+        self.middle = {}     # (u, w) -> the cell the shortcut u -> w skips
+        self.shortcuts = 0
+        self.build()
+
+    def build(self):
+        graph = self.graph
+        free = [i for i in range(graph.size) if not graph.obstacles[i]]
+        # Working copy of the remaining graph, edges get added and removed
+        out = {i: dict(graph.edges(i)) for i in free}
+        into = {i: dict(graph.reverse_edges(i)) for i in free}
+        deleted = dict.fromkeys(free, 0)   # contracted neighbors, spreads contraction out
+
+        def shortcuts_for(v):
+            needed = []
+            for u, to_v in into[v].items():
+                targets = {w: to_v + from_v for w, from_v in out[v].items() if w != u}
+                if not targets:
+                    continue
+                witness = witness_costs(out, u, v, max(targets.values()))
+                needed.extend((u, w, cost) for w, cost in targets.items()
+                              if witness.get(w, INF) > cost)
+            return needed
+
+        def priority(v, needed):
+            # Edge difference plus contracted neighbors
+            return len(needed) - len(into[v]) - len(out[v]) + deleted[v]
+
+        queue = []
+        for v in free:
+            queue.append((priority(v, shortcuts_for(v)), v))
+        heapq.heapify(queue)
+
+        while queue:
+            _, v = heapq.heappop(queue)
+            needed = shortcuts_for(v)
+            current = priority(v, needed)
+            # Lazy update: priorities go stale as neighbors get contracted
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            for u, w, cost in needed:
+                if cost < out[u].get(w, INF):
+                    out[u][w] = into[w][u] = cost
+                    self.middle[(u, w)] = v
+                    self.shortcuts += 1
+            self.rank[v] = len(self.rank)
+            # Everything still attached to v is contracted later, so ranks higher
+            self.up[v] = list(out[v].items())
+            self.down[v] = list(into[v].items())
+            for w in out.pop(v):
+                del into[w][v]
+                deleted[w] += 1
+            for u in into.pop(v):
+                del out[u][v]
+                deleted[u] += 1
+
+    def edge_count(self):
+        return sum(map(len, self.up.values())) + sum(map(len, self.down.values()))
+
+    def query(self, source, target):
+        """(path, cost, expanded) between two cell indices, like the engine searches."""
+        graph = self.graph
+        if graph.obstacles[source] or graph.obstacles[target]:
+            return None, None, 0
+        dist = ({source: 0}, {target: 0})
+        parents = ({source: None}, {target: None})
+        queues = ([(0, source)], [(0, target)])
+        edges = (self.up, self.down)
+        best, meet = INF, None
+        expanded = 0
+
+        while queues[0] or queues[1]:
+            for side in (0, 1):
+                queue = queues[side]
+                if not queue:
+                    continue
+                cost, node = heapq.heappop(queue)
+                if cost > dist[side][node]:
+                    continue
+                if cost >= best:
+                    queue.clear()   # nothing left on this side can improve best
+                    continue
+                expanded += 1
+                other = dist[1 - side].get(node)
+                if other is not None and cost + other < best:
+                    best, meet = cost + other, node
+                side_dist, side_parent = dist[side], parents[side]
+                for neighbor, weight in edges[side][node]:
+                    new_cost = cost + weight
+                    if new_cost < side_dist.get(neighbor, INF):
+                        side_dist[neighbor] = new_cost
+                        side_parent[neighbor] = node
+                        heapq.heappush(queue, (new_cost, neighbor))
+
+        if meet is None:
+            return None, None, expanded
+        path = self.unpack(join_paths(parents, meet))
+        return [graph.coords(i) for i in path], best, expanded
+
+    def unpack(self, path):
+        """Expand every shortcut on an upward/downward path into grid moves."""
+        cells = [path[0]]
+        for a, b in zip(path, path[1:]):
+            stack = [(a, b)]
+            while stack:
+                u, w = stack.pop()
+                v = self.middle.get((u, w))
+                if v is None:
+                    cells.append(w)
+                else:
+                    stack.append((v, w))
+                    stack.append((u, v))
+        return cells
+
+
+def witness_costs(out, source, skip, limit):
+    """Costs of paths from source that avoid skip, up to limit (a bounded Dijkstra)."""
+    dist = {source: 0}
+    queue = [(0, source)]
+    settled = 0
+    while queue:
+        cost, node = heapq.heappop(queue)
+        if cost > dist[node]:
+            continue
+        if cost > limit or settled == WITNESS_SETTLE_LIMIT:
+            break
+        settled += 1
+        for neighbor, weight in out[node].items():
+            new_cost = cost + weight
+            if neighbor != skip and new_cost < dist.get(neighbor, INF):
+                dist[neighbor] = new_cost
+                heapq.heappush(queue, (new_cost, neighbor))
+    return dist
@@ -0,0 +1,108 @@
+"""Many-to-many shortest path costs on a GridGraph.
+
+distance_matrix(graph, sources, targets) runs one multi-target Dijkstra
+per source instead of one search per (source, target) pair, and spreads
+the sources over a process pool. The workers read the obstacle and
+weight arrays from shared memory, so the grid is not pickled per task.
+Needs NumPy for the result matrix.
+"""
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from grid_graph import GridGraph
+
+INF = float('inf')
+
+# Below this many sources the pool costs more than it saves
+MIN_PARALLEL_SOURCES = 8
+
+
+def multi_target_costs(graph, source, targets):
+    """Costs from source to every cell in targets from a single Dijkstra run.
+
+    The search stops as soon as the last reachable target is settled;
+    unreachable targets (or a blocked source) get INF.
+    """
+    if source not in graph:
+        return [INF] * len(targets)
+    ws = graph.workspace()
+    gen = ws.begin()
+    dist, seen, closed = ws.dist, ws.seen, ws.closed
+    root = graph.index(source)
+    dist[root], seen[root] = 0, gen
+    remaining = {graph.index(t) for t in targets if t in graph}
+    pq = graph.priority_queue()
+    pq.push(0, root)
+
+    while pq and remaining:
+        cost, node = pq.pop()
+        if closed[node] == gen:
+            continue
+        closed[node] = gen
+        remaining.discard(node)
+        for neighbor, weight in graph.edges(node):
+            new_cost = cost + weight
+            if closed[neighbor] != gen and (seen[neighbor] != gen or new_cost < dist[neighbor]):
+                dist[neighbor], seen[neighbor] = new_cost, gen
+                pq.push(new_cost, neighbor)
+
+    return [ws.cost(graph.index(t)) if t in graph else INF for t in targets]
+
+
+# Set in each worker by init_worker
+worker_graph = None
+worker_targets = None
+worker_blocks = None
+
+
+def init_worker(cols, rows, diagonal, obstacles_name, weights_name, targets):
+    global worker_graph, worker_targets, worker_blocks
+    obstacles = shared_memory.SharedMemory(name=obstacles_name)
+    weights = shared_memory.SharedMemory(name=weights_name)
+    graph = GridGraph(cols, rows, diagonal=diagonal)
+    # Views straight onto the shared blocks, nothing is copied
+    graph.obstacles = obstacles.buf[:graph.size]
+    graph.weights = weights.buf[:graph.size * 2].cast('H')
+    worker_graph, worker_targets = graph, targets
+    worker_blocks = (obstacles, weights)   # keep the blocks mapped
+
+
+def solve_row(source):
+    return multi_target_costs(worker_graph, source, worker_targets)
+
+
+def distance_matrix(graph, sources, targets, processes=None):
+    """NumPy array m with m[i, j] the cheapest cost from sources[i] to targets[j].
+
+    Cells are (x, y) tuples; unreachable pairs are inf. processes=1 runs
+    in this process; otherwise up to processes workers (default: CPU
+    count) each take a share of the sources.
+    """
+    sources, targets = list(sources), list(targets)
+    matrix = np.full((len(sources), len(targets)), np.inf)
+    if not sources or not targets:
+        return matrix
+    processes = min(processes or os.cpu_count() or 1, len(sources))
+    if processes == 1 or len(sources) < MIN_PARALLEL_SOURCES:
+        for i, source in enumerate(sources):
+            matrix[i] = multi_target_costs(graph, source, targets)
+        return matrix
+
+    obstacles = shared_memory.SharedMemory(create=True, size=graph.size)
+    weights = shared_memory.SharedMemory(create=True, size=graph.size * 2)
+    try:
+        obstacles.buf[:graph.size] = graph.obstacles
+        weights.buf[:graph.size * 2] = memoryview(graph.weights).cast('B')
+        init_args = (graph.cols, graph.rows, graph.diagonal, obstacles.name, weights.name, targets)
+        with Pool(processes, initializer=init_worker, initargs=init_args) as pool:
+            chunk = max(1, len(sources) // (processes * 4))
+            for i, row in enumerate(pool.imap(solve_row, sources, chunksize=chunk)):
+                matrix[i] = row
+    finally:
+        obstacles.close()
+        obstacles.unlink()
+        weights.close()
+        weights.unlink()
+    return matrix
@@ -0,0 +1,304 @@
+"""Headless pathfinding on a GridGraph: nothing in here imports pygame or tkinter.
+
+find_path() runs one of ALGORITHMS and returns a SearchResult with the
+path, its cost and the number of expanded nodes. With record_trace=True
+the result also lists, in order, every (index, state) event of the search
+so a visualizer can replay it afterwards:
+
+    'visited'       node expanded (taken off the open list)
+    'frontier'      node discovered for the first time
+    'visited_end'   same, for the search running back from the end
+    'frontier_end'  (bidirectional algorithms only)
+"""
+import heapq
+from collections import deque
+
+from jump_point import JumpPointSearch
+from bidirectional import bidirectional_bfs, bidirectional_dijkstra
+
+VISITED, FRONTIER = 'visited', 'frontier'
+VISITED_END, FRONTIER_END = 'visited_end', 'frontier_end'
+
+
+class SearchResult:
+    def __init__(self, path=None, cost=None, expanded=0, trace=None):
+        self.path = path          # list of (x, y) from start to end, or None
+        self.cost = cost          # total weight (weighted searches) or step count
+        self.expanded = expanded
+        self.pushes = None        # priority queue pushes (QUEUE_ALGORITHMS only)
+        self.trace = trace        # list of (index, state) or None
+
+    @property
+    def found(self):
+        return self.path is not None
+
+
+def dijkstra(graph, source, target, trace=None, stats=None):
+    # Distances and parents live in the graph's reusable workspace: nothing
+    # is allocated or cleared per query beyond the nodes actually reached
+    ws = graph.workspace()
+    gen = ws.begin()
+    dist, parent, seen, closed = ws.dist, ws.parent, ws.seen, ws.closed
+    dist[source], parent[source], seen[source] = 0, source, gen
+    pq = graph.priority_queue()
+    pq.push(0, source)
+    expanded, pushes = 0, 1
+
+    while pq:
+        cost, node = pq.pop()
+        if node == target:
+            if stats is not None:
+                stats.pushes = pushes
+            return graph.trace_path(parent, source, target), cost, expanded
+        if closed[node] == gen:
+            continue
+        closed[node] = gen
+        expanded += 1
+        if trace is not None:
+            trace.append((node, VISITED))
+
+        for neighbor, weight in graph.edges(node):
+            new_cost = cost + weight
+            if closed[neighbor] != gen and (seen[neighbor] != gen or new_cost < dist[neighbor]):
+                if trace is not None and seen[neighbor] != gen:
+                    trace.append((neighbor, FRONTIER))
+                dist[neighbor], parent[neighbor], seen[neighbor] = new_cost, node, gen
+                pq.push(new_cost, neighbor)
+                pushes += 1
+
+    if stats is not None:
+        stats.pushes = pushes
+    return None, None, expanded
+
+
+def astar(graph, source, target, trace=None, heuristic='Manhattan', landmarks=None, stats=None):
+    h = graph.heuristic_to(target, heuristic)
+    if landmarks is not None:
+        # Both bounds are admissible, so their maximum is too
+        grid_h, landmark_h = h, landmarks.heuristic_to(target, graph)
+
+        def h(i):
+            return max(grid_h(i), landmark_h(i))
+    ws = graph.workspace()
+    gen = ws.begin()
+    dist, parent, seen, closed = ws.dist, ws.parent, ws.seen, ws.closed
+    dist[source], parent[source], seen[source] = 0, source, gen
+    # Entries are (f, h, node): on equal f prefer the node closer to the goal
+    pq = [(h(source), h(source), source)]
+    expanded, pushes = 0, 1
+
+    while pq:
+        _, _, node = heapq.heappop(pq)
+        if node == target:
+            if stats is not None:
+                stats.pushes = pushes
+            return graph.trace_path(parent, source, target), dist[target], expanded
+        if closed[node] == gen:
+            continue
+        closed[node] = gen
+        expanded += 1
+        if trace is not None:
+            trace.append((node, VISITED))
+
+        for neighbor, weight in graph.edges(node):
+            new_cost = dist[node] + weight
+            if closed[neighbor] != gen and (seen[neighbor] != gen or new_cost < dist[neighbor]):
+                if trace is not None and seen[neighbor] != gen:
+                    trace.append((neighbor, FRONTIER))
+                dist[neighbor], parent[neighbor], seen[neighbor] = new_cost, node, gen
+                estimate = h(neighbor)
+                heapq.heappush(pq, (new_cost + estimate, estimate, neighbor))
+                pushes += 1
+
+    if stats is not None:
+        stats.pushes = pushes
+    return None, None, expanded
+
+
+def bfs(graph, source, target, trace=None):
+    queue = deque([source])
+    # parent[i] is set when i is first discovered; -1 means undiscovered
+    parent = [-1] * graph.size
+    parent[source] = source
+    expanded = 0
+
+    while queue:
+        node = queue.popleft()
+        expanded += 1
+        if trace is not None:
+            trace.append((node, VISITED))
+        if node == target:
+            path = graph.trace_path(parent, source, target)
+            return path, len(path) - 1, expanded
+
+        for adj in graph.neighbors(node):
+            if parent[adj] == -1:
+                parent[adj] = node
+                queue.append(adj)
+                if trace is not None:
+                    trace.append((adj, FRONTIER))
+
+    return None, None, expanded
+
+
+def dfs(graph, source, target, trace=None):
+    # Each stack entry is (node, node it was pushed from)
+    stack = [(source, source)]
+    parent = [-1] * graph.size
+    seen = bytearray(graph.size)
+    seen[source] = 1
+    expanded = 0
+
+    while stack:
+        node, came_from = stack.pop()
+        if parent[node] != -1:
+            continue
+        parent[node] = came_from
+        expanded += 1
+        if trace is not None:
+            trace.append((node, VISITED))
+        if node == target:
+            path = graph.trace_path(parent, source, target)
+            return path, len(path) - 1, expanded
+
+        for neighbor in graph.neighbors(node):
+            if parent[neighbor] == -1:
+                stack.append((neighbor, node))
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    if trace is not None:
+                        trace.append((neighbor, FRONTIER))
+
+    return None, None, expanded
+
+
+def jps(graph, source, target, trace=None, stats=None):
+    # Jump Point Search ignores weights, like BFS
+    searcher = JumpPointSearch(graph, diagonal=graph.diagonal)
+
+    def on_expand(cell):
+        trace.append((graph.index(cell), VISITED))
+    path, cost = searcher.search(graph.coords(source), graph.coords(target),
+                                 on_expand if trace is not None else None)
+    if stats is not None:
+        stats.pushes = searcher.pushes
+    return path, cost, searcher.expanded
+
+
+def side_recorder(trace):
+    if trace is None:
+        return None
+    states = {('forward', 'visited'): VISITED, ('forward', 'frontier'): FRONTIER,
+              ('backward', 'visited'): VISITED_END, ('backward', 'frontier'): FRONTIER_END}
+
+    def record(node, side, state):
+        trace.append((node, states[side, state]))
+    return record
+
+
+def bidirectional_bfs_search(graph, source, target, trace=None):
+    path, expanded = bidirectional_bfs(graph.neighbors, source, target, side_recorder(trace))
+    if path is None:
+        return None, None, expanded
+    return [graph.coords(i) for i in path], len(path) - 1, expanded
+
+
+def bidirectional_dijkstra_search(graph, source, target, trace=None, stats=None):
+    path, cost, expanded = bidirectional_dijkstra(
+        graph.edges, graph.reverse_edges, source, target, side_recorder(trace), stats)
+    if path is None:
+        return None, None, expanded
+    return [graph.coords(i) for i in path], cost, expanded
+
+
+class ShortestPathTree:
+    """Cheapest paths from one source cell to every other cell.
+
+    One full Dijkstra run fills costs and parent pointers; after that
+    path_to() only walks parents, so moving the end point costs
+    O(path length) instead of a new search. Build a new tree when the
+    source moves or the graph changes.
+    """
+
+    def __init__(self, graph, source):
+        self.graph = graph
+        self.source = source
+        root = graph.index(source)
+        costs = [float('inf')] * graph.size
+        costs[root] = 0
+        parent = [-1] * graph.size
+        parent[root] = root
+        pq = graph.priority_queue()
+        pq.push(0, root)
+        closed = bytearray(graph.size)
+        self.expanded = 0
+
+        while pq:
+            cost, node = pq.pop()
+            if closed[node]:
+                continue
+            closed[node] = 1
+            self.expanded += 1
+            for neighbor, weight in graph.edges(node):
+                new_cost = cost + weight
+                if new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    parent[neighbor] = node
+                    pq.push(new_cost, neighbor)
+
+        self.costs = costs
+        self.parent = parent
+
+    def cost_to(self, cell):
+        if cell not in self.graph:
+            return None
+        cost = self.costs[self.graph.index(cell)]
+        return None if cost == float('inf') else cost
+
+    def path_to(self, cell):
+        """Path from the source to cell as (x, y) tuples, or None if unreachable."""
+        if self.cost_to(cell) is None:
+            return None
+        return self.graph.trace_path(self.parent, self.graph.index(self.source),
+                                     self.graph.index(cell))
+
+
+ALGORITHMS = {
+    'Dijkstra': dijkstra,
+    'A*': astar,
+    'DFS': dfs,
+    'BFS': bfs,
+    'JPS': jps,
+    'Bidirectional BFS': bidirectional_bfs_search,
+    'Bidirectional Dijkstra': bidirectional_dijkstra_search,
+}
+
+# Algorithms whose cost is a total weight rather than a step count
+WEIGHTED_ALGORITHMS = ['Dijkstra', 'A*', 'Bidirectional Dijkstra']
+
+# Algorithms with a priority queue; find_path fills in their SearchResult.pushes
+QUEUE_ALGORITHMS = ['Dijkstra', 'A*', 'JPS', 'Bidirectional Dijkstra']
+
+
+def find_path(graph, algorithm, start, end, heuristic='Manhattan', record_trace=False,
+              components=None, landmarks=None):
+    """Run ALGORITHMS[algorithm] between two (x, y) cells of graph.
+
+    components is an optional ConnectivityIndex over graph; when it says
+    the two cells are not connected no search is run at all. landmarks
+    (a landmarks.Landmarks built for graph, or for a layout it only
+    differs from at the endpoints) tightens the A* heuristic.
+    """
+    result = SearchResult(trace=[] if record_trace else None)
+    if start not in graph or end not in graph:
+        return result
+    if components is not None and not components.connected(start, end):
+        return result
+
+    search = ALGORITHMS[algorithm]
+    options = {'heuristic': heuristic, 'landmarks': landmarks} if search is astar else {}
+    if algorithm in QUEUE_ALGORITHMS:
+        options['stats'] = result
+    result.path, result.cost, result.expanded = search(
+        graph, graph.index(start), graph.index(end), result.trace, **options)
+    return result
@@ -0,0 +1,119 @@
+"""Flow fields: one search for any number of agents heading to the same goal.
+
+FlowField(graph, goal) computes the integration field (cost from every
+cell to the goal) with a single reverse search, then a direction field
+holding each cell's next step along a cheapest path. After that an
+agent anywhere on the grid reads its move in O(1) with next_step().
+
+When every cell has the same weight the integration field is a plain
+breadth-first wave, which NumPy grows for the whole grid at once; the
+direction field is vectorized too. Without NumPy, with mixed weights or
+on an 8-connected grid, both fall back to a reverse Dijkstra and a loop
+over the cells.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:   # optional, only makes the fields faster
+    np = None
+
+from landmarks import distance_table
+
+INF = float('inf')
+NO_STEP = -1   # next[] entry for the goal, walls and cells that can't reach it
+
+
+class FlowField:
+    def __init__(self, graph, goal):
+        self.graph = graph
+        self.goal = graph.index(goal)
+        if np is not None and not graph.diagonal:
+            cost = wavefront(graph, self.goal) if uniform(graph) else distance_table(
+                graph, self.goal, reverse=True)
+            self.cost, self.next = vector_directions(graph, cost)
+        else:
+            self.cost = distance_table(graph, self.goal, reverse=True)
+            self.next = loop_directions(graph, self.cost)
+
+    def cost_to_goal(self, cell):
+        return self.cost[self.graph.index(cell)]
+
+    def next_step(self, cell):
+        """The cell an agent at cell should move to, None at the goal or if it is cut off."""
+        step = self.next[self.graph.index(cell)]
+        return None if step == NO_STEP else self.graph.coords(step)
+
+    def path_from(self, cell):
+        """Follow the direction field from cell to the goal."""
+        if self.cost_to_goal(cell) == INF:
+            return None
+        path = [cell]
+        step = self.next_step(cell)
+        while step is not None:
+            path.append(step)
+            step = self.next_step(step)
+        return path
+
+
+def uniform(graph):
+    """True if every free cell has the same weight."""
+    weights = np.frombuffer(graph.weights, dtype=np.uint16)
+    free = np.frombuffer(graph.obstacles, dtype=np.uint8) == 0
+    return not free.any() or weights[free].min() == weights[free].max()
+
+
+def wavefront(graph, goal):
+    """Integration field on a uniform-weight grid: the BFS wave, one NumPy step per ring."""
+    rows, cols = graph.rows, graph.cols
+    free = np.frombuffer(graph.obstacles, dtype=np.uint8).reshape(rows, cols) == 0
+    cost = np.full((rows, cols), np.inf)
+    if not free.flat[goal]:
+        return cost.ravel()
+    weight = float(graph.weights[goal])
+    frontier = np.zeros((rows, cols), dtype=bool)
+    frontier.flat[goal] = True
+    reached = frontier.copy()
+    cost.flat[goal] = 0
+    step = 0
+    while frontier.any():
+        step += 1
+        grown = np.zeros_like(frontier)
+        grown[:, 1:] |= frontier[:, :-1]
+        grown[:, :-1] |= frontier[:, 1:]
+        grown[1:, :] |= frontier[:-1, :]
+        grown[:-1, :] |= frontier[1:, :]
+        frontier = grown & free & ~reached
+        reached |= frontier
+        cost[frontier] = step * weight
+    return cost.ravel()
+
+
+def vector_directions(graph, cost):
+    """(cost, next) as flat arrays, with next picked by NumPy for the whole grid."""
+    rows, cols = graph.rows, graph.cols
+    field = np.asarray(cost, dtype=float).reshape(rows, cols)
+    weights = np.frombuffer(graph.weights, dtype=np.uint16).reshape(rows, cols)
+    # Moving into a neighbor costs its weight, then its own cost to the goal
+    through = np.pad(field + weights, 1, constant_values=np.inf)
+    candidates = np.stack([
+        through[1:-1, 2:],    # right
+        through[1:-1, :-2],   # left
+        through[2:, 1:-1],    # down
+        through[:-2, 1:-1],   # up
+    ])
+    best = candidates.argmin(axis=0)   # ties go to the first, like GridGraph.neighbors
+    offsets = np.array([1, -1, cols, -cols])
+    steps = np.arange(graph.size).reshape(rows, cols) + offsets[best]
+    blocked = ~np.isfinite(field) | ~np.isfinite(candidates.min(axis=0)) | (field == 0)
+    steps[blocked] = NO_STEP
+    return array('d', field.ravel().tobytes()), array('q', steps.astype(np.int64).ravel().tobytes())
+
+
+def loop_directions(graph, cost):
+    steps = array('q', [NO_STEP]) * graph.size
+    for i in range(graph.size):
+        if cost[i] in (0, INF):
+            continue
+        steps[i] = min(graph.edges(i), key=lambda edge: cost[edge[0]] + edge[1])[0]
+    return steps
@@ -0,0 +1,201 @@
+import random
+from array import array
+
+from bucket_queue import HeapQueue, make_queue
+from heuristics import SQRT2, heuristic_for
+from workspace import SearchWorkspace
+
+
+def seeded_weights(size, seed, low=1, high=15):
+    """Flat array of size cell weights drawn from random.Random(seed)."""
+    rng = random.Random(seed)
+    return array('H', [rng.randint(low, high) for _ in range(size)])
+
+
+class GridGraph:
+    """Grid graph stored as flat arrays instead of a dict of dicts.
+
+    Cell (x, y) lives at index y * cols + x. Walls are kept in a bytearray
+    bitmap and cell weights in a flat array, so neighbors are computed with
+    index arithmetic and no edge is ever stored. Moving into a cell costs
+    that cell's weight.
+
+    With diagonal=True the grid is 8-connected: a diagonal move costs
+    sqrt(2) times the weight of the cell it enters and is only allowed
+    when both orthogonal cells beside it are free (no cutting corners).
+    """
+
+    def __init__(self, cols, rows, weight=1, diagonal=False):
+        self.cols = cols
+        self.rows = rows
+        self.size = cols * rows
+        self.obstacles = bytearray(self.size)
+        self.weights = array('H', [weight]) * self.size
+        self.diagonal = diagonal
+        self.heaviest = None          # cached max_weight()
+        self.lightest = None          # cached min_weight()
+        self.search_workspace = None  # SearchWorkspace reused by engine searches
+
+    def index(self, vertex):
+        x, y = vertex
+        return y * self.cols + x
+
+    def coords(self, i):
+        y, x = divmod(i, self.cols)
+        return (x, y)
+
+    def in_bounds(self, vertex):
+        x, y = vertex
+        return 0 <= x < self.cols and 0 <= y < self.rows
+
+    def __contains__(self, vertex):
+        return self.in_bounds(vertex) and not self.obstacles[self.index(vertex)]
+
+    def __len__(self):
+        return self.size - sum(self.obstacles)
+
+    def vertices(self):
+        for i in range(self.size):
+            if not self.obstacles[i]:
+                yield self.coords(i)
+
+    # Edges are implicit, so editing a cell is O(1): nothing else to patch
+    def set_obstacle(self, x, y):
+        i = y * self.cols + x
+        # Walls don't count towards min_weight(): rescan only if this may have been the minimum
+        if not self.obstacles[i] and self.weights[i] == self.lightest:
+            self.lightest = None
+        self.obstacles[i] = 1
+
+    def clear_obstacle(self, x, y):
+        i = y * self.cols + x
+        self.obstacles[i] = 0
+        if self.lightest is not None and self.weights[i] < self.lightest:
+            self.lightest = self.weights[i]
+
+    def set_weight(self, x, y, weight):
+        self.weights[y * self.cols + x] = weight
+        # Cached bounds only need to stay bounds, so they can only widen here
+        if self.heaviest is not None and weight > self.heaviest:
+            self.heaviest = weight
+        if self.lightest is not None and weight < self.lightest:
+            self.lightest = weight
+
+    def randomize_weights(self, seed, low=1, high=15):
+        """Replace every weight with a reproducible one; the same seed gives the same grid."""
+        self.weights = seeded_weights(self.size, seed, low, high)
+        self.weights_changed()
+
+    def max_weight(self):
+        """Largest cell weight, cached between searches.
+
+        Call weights_changed() after writing to self.weights directly.
+        """
+        if self.heaviest is None:
+            self.heaviest = max(self.weights, default=1)
+        return self.heaviest
+
+    def weights_changed(self):
+        self.heaviest = self.lightest = None
+
+    def workspace(self):
+        """Preallocated search state shared by the searches run on this graph."""
+        if self.search_workspace is None or self.search_workspace.size != self.size:
+            self.search_workspace = SearchWorkspace(self.size)
+        return self.search_workspace
+
+    def min_weight(self):
+        """Cheapest passable cell weight, the per-step lower bound for heuristics (cached)."""
+        if self.lightest is None:
+            obstacles = self.obstacles
+            lightest = min((w for i, w in enumerate(self.weights) if not obstacles[i]), default=None)
+            if lightest is None:
+                return 1   # all walls: nothing to cache that clear_obstacle() could lower
+            self.lightest = lightest
+        return self.lightest
+
+    def priority_queue(self):
+        """Open list for Dijkstra-style searches: a bucket queue while step costs are small integers."""
+        if self.diagonal:
+            return HeapQueue()   # sqrt(2) steps
+        return make_queue((self.max_weight(),))
+
+    def heuristic_to(self, target, name='Manhattan'):
+        """Return h(i), the named heuristic's estimate from index i to target."""
+        estimate = heuristic_for(name, self.diagonal)
+        min_weight = self.min_weight()
+        cols = self.cols
+        tx, ty = self.coords(target)
+
+        def h(i):
+            y, x = divmod(i, cols)
+            return estimate(abs(x - tx), abs(y - ty), min_weight)
+        return h
+
+    def neighbors(self, i):
+        """Free neighbors of index i: right, left, down, up, then the diagonals if enabled."""
+        cols = self.cols
+        obstacles = self.obstacles
+        x = i % cols
+        result = []
+        right = x < cols - 1 and not obstacles[i + 1]
+        left = x > 0 and not obstacles[i - 1]
+        down = i + cols < self.size and not obstacles[i + cols]
+        up = i >= cols and not obstacles[i - cols]
+        if right:
+            result.append(i + 1)
+        if left:
+            result.append(i - 1)
+        if down:
+            result.append(i + cols)
+        if up:
+            result.append(i - cols)
+        if self.diagonal:
+            # Both cells beside a diagonal step must be open
+            if down and right and not obstacles[i + cols + 1]:
+                result.append(i + cols + 1)
+            if down and left and not obstacles[i + cols - 1]:
+                result.append(i + cols - 1)
+            if up and right and not obstacles[i - cols + 1]:
+                result.append(i - cols + 1)
+            if up and left and not obstacles[i - cols - 1]:
+                result.append(i - cols - 1)
+        return result
+
+    def surrounding(self, i):
+        """In-bounds cells next to index i, walls included (their moves depend on i)."""
+        x, y = self.coords(i)
+        steps = ((1, 0), (-1, 0), (0, 1), (0, -1))
+        if self.diagonal:
+            # Opening or closing i also decides which diagonals pass beside it
+            steps += ((1, 1), (-1, 1), (1, -1), (-1, -1))
+        return [(y + dy) * self.cols + x + dx for dx, dy in steps
+                if 0 <= x + dx < self.cols and 0 <= y + dy < self.rows]
+
+    def edges(self, i):
+        """(neighbor, cost) pairs leaving index i."""
+        weights = self.weights
+        if not self.diagonal:
+            return [(j, weights[j]) for j in self.neighbors(i)]
+        # Compare coordinates: on a 2-column grid a diagonal is also 1 index away
+        y, x = divmod(i, self.cols)
+        return [(j, weights[j] * SQRT2 if j % self.cols != x and j // self.cols != y else weights[j])
+                for j in self.neighbors(i)]
+
+    def reverse_edges(self, i):
+        """(predecessor, cost) pairs entering index i; every move into i costs its weight."""
+        weight = self.weights[i]
+        if not self.diagonal:
+            return [(j, weight) for j in self.neighbors(i)]
+        y, x = divmod(i, self.cols)
+        return [(j, weight * SQRT2 if j % self.cols != x and j // self.cols != y else weight)
+                for j in self.neighbors(i)]
+
+    def trace_path(self, parent, source, target):
+        """Rebuild the coordinate path from source to target out of a parent array."""
+        path = [target]
+        while target != source:
+            target = parent[target]
+            path.append(target)
+        path.reverse()
+        return [self.coords(i) for i in path]
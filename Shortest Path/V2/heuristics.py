@@ -0,0 +1,49 @@
+import math
+
+SQRT2 = math.sqrt(2)
+
+# Each heuristic takes the absolute x/y offsets to the goal and the cheapest
+# cell weight on the grid. Every step costs at least that weight (1..15), so
+# all three stay admissible and A* still returns the lowest-cost path.
+
+
+def manhattan(dx, dy, min_weight=1):
+    """Step count on a 4-connected grid."""
+    return dx + dy
+
+
+def octile(dx, dy, min_weight=1):
+    """Step count when diagonal moves cost sqrt(2)."""
+    return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+
+def weighted_manhattan(dx, dy, min_weight=1):
+    """Manhattan distance scaled by the cheapest weight, tighter on heavy grids."""
+    return min_weight * (dx + dy)
+
+
+def weighted_octile(dx, dy, min_weight=1):
+    """Octile distance scaled by the cheapest weight."""
+    return min_weight * octile(dx, dy)
+
+
+HEURISTICS = {
+    'Manhattan': manhattan,
+    'Octile': octile,
+    'Weighted Manhattan': weighted_manhattan,
+    'Weighted Octile': weighted_octile,
+}
+
+# With diagonal moves a Manhattan estimate can overshoot the real cost,
+# so 8-connected searches use the octile version instead
+DIAGONAL_HEURISTICS = {
+    'Manhattan': 'Octile',
+    'Weighted Manhattan': 'Weighted Octile',
+}
+
+
+def heuristic_for(name, diagonal=False):
+    """The named heuristic, or its octile counterpart when diagonal moves are allowed."""
+    if diagonal:
+        name = DIAGONAL_HEURISTICS.get(name, name)
+    return HEURISTICS[name]
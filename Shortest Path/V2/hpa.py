@@ -0,0 +1,244 @@
+"""Hierarchical pathfinding (HPA*) for very large grids.
+
+The grid is cut into square clusters. Where two neighboring clusters
+share a run of open cells along their border, one or two entrances are
+placed on it, and every entrance is linked to the other entrances of
+its cluster by the cost of the best path inside that cluster. A query
+links the start and goal into that abstract graph, runs A* over it and
+refines each abstract edge back into grid moves with a local search
+limited to one cluster. Endpoints in the same or neighboring clusters
+skip all that and get a plain flat A* search.
+
+Nothing is built up front. An entrance's in-cluster costs are computed
+the first time the abstract search expands it, and cell_changed() drops
+them again. The abstract A* is guided by Weighted Manhattan (Manhattan
+times the cheapest cell weight). Once any cell weighs 1, as on the
+benchmark grids, that is plain Manhattan, far below the real costs. So
+on weighted maps it expands most entrances, and a cold query pays for
+nearly the whole grid: building 4096x4096 in 32x32 clusters took 147 s,
+eight times a flat A* query. The win is on every later query, about
+3 s against 18 s flat.
+
+Paths are not optimal. On a 4-connected grid a path costs at most the
+optimal cost plus (cluster_size + 1) * max_weight for each cluster
+border the optimal path crosses. Each such crossing may have to slide
+along the border to an entrance and back: at most half a run of open
+border cells each way, where a run is at most cluster_size long.
+Measured: within about 4% of optimal on long benchmark queries
+(256x256 to 4096x4096, 16x16 and 32x32 clusters), but up to 2.4x on
+short queries over small grids with 3-8 cell clusters.
+"""
+import heapq
+
+from engine import astar
+
+INF = float('inf')
+
+# Border runs at least this long get an entrance at each end instead of one in the middle
+ENTRANCE_SPLIT = 6
+
+
+class HierarchicalGrid:
+    def __init__(self, graph, cluster_size=32):
+        self.graph = graph
+        self.cluster_size = cluster_size
+        self.borders = {}     # (cluster, right or lower neighbor) -> [(a, b)] crossing cell pairs
+        self.crossings = {}   # cluster -> {entrance: [(cell across the border, cost)]}
+        self.intra = {}       # cluster -> {entrance: [(other entrance, cost)]}, per entrance on demand
+        self.paths = {}       # cluster -> {(a, b): local path}, filled by refinement
+        self.expanded = 0     # abstract nodes (grid cells for a flat query) expanded by the last query
+
+    def cluster_of(self, i):
+        y, x = divmod(i, self.graph.cols)
+        return (x // self.cluster_size, y // self.cluster_size)
+
+    def bounds(self, cluster):
+        """(x0, y0, x1, y1) of a cluster, half-open and clipped to the grid."""
+        size = self.cluster_size
+        x0, y0 = cluster[0] * size, cluster[1] * size
+        return x0, y0, min(x0 + size, self.graph.cols), min(y0 + size, self.graph.rows)
+
+    def adjacent(self, cluster):
+        cx, cy = cluster
+        x0, y0, x1, y1 = self.bounds(cluster)
+        result = []
+        if x1 < self.graph.cols:
+            result.append((cx + 1, cy))
+        if x0 > 0:
+            result.append((cx - 1, cy))
+        if y1 < self.graph.rows:
+            result.append((cx, cy + 1))
+        if y0 > 0:
+            result.append((cx, cy - 1))
+        return result
+
+    def border(self, c, d):
+        """Crossing pairs (cell in c, cell in d) between two neighboring clusters."""
+        key = (c, d) if c < d else (d, c)
+        if key not in self.borders:
+            self.borders[key] = self.find_entrances(*key)
+        if key[0] == c:
+            return self.borders[key]
+        return [(b, a) for a, b in self.borders[key]]
+
+    def find_entrances(self, c, d):
+        # d is the right or lower neighbor of c
+        graph = self.graph
+        cols, obstacles = graph.cols, graph.obstacles
+        x0, y0, x1, y1 = self.bounds(c)
+        if d[0] > c[0]:
+            pairs = [(y * cols + x1 - 1, y * cols + x1) for y in range(y0, y1)]
+        else:
+            pairs = [((y1 - 1) * cols + x, y1 * cols + x) for x in range(x0, x1)]
+        entrances = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and not obstacles[a] and not obstacles[b]:
+                run.append((a, b))
+                continue
+            if len(run) >= ENTRANCE_SPLIT:
+                entrances += [run[0], run[-1]]
+            elif run:
+                entrances.append(run[len(run) // 2])
+            run = []
+        return entrances
+
+    def cluster_crossings(self, cluster):
+        if cluster not in self.crossings:
+            weights = self.graph.weights
+            links = {}
+            for other in self.adjacent(cluster):
+                for a, b in self.border(cluster, other):
+                    links.setdefault(a, []).append((b, weights[b]))
+            self.crossings[cluster] = links
+        return self.crossings[cluster]
+
+    def entrance_edges(self, cluster, a):
+        """Costs from entrance a to the other entrances of its cluster (cached until cell_changed)."""
+        edges = self.intra.setdefault(cluster, {})
+        if a not in edges:
+            dist = self.local_search(a, cluster)[0]
+            edges[a] = [(b, dist[b]) for b in self.cluster_crossings(cluster) if b != a and b in dist]
+        return edges[a]
+
+    def local_search(self, root, cluster, reverse=False, stop=None):
+        """Dijkstra from root that never leaves cluster; returns (dist, parent) dicts.
+
+        reverse=True follows edges backwards, so dist holds costs *to* root.
+        """
+        graph = self.graph
+        cols = graph.cols
+        x0, y0, x1, y1 = self.bounds(cluster)
+        edges = graph.reverse_edges if reverse else graph.edges
+        dist, parent = {root: 0}, {root: None}
+        pq = [(0, root)]
+        while pq:
+            cost, node = heapq.heappop(pq)
+            if cost > dist[node]:
+                continue
+            if node == stop:
+                break
+            for neighbor, weight in edges(node):
+                y, x = divmod(neighbor, cols)
+                new_cost = cost + weight
+                if x0 <= x < x1 and y0 <= y < y1 and new_cost < dist.get(neighbor, INF):
+                    dist[neighbor], parent[neighbor] = new_cost, node
+                    heapq.heappush(pq, (new_cost, neighbor))
+        return dist, parent
+
+    def local_path(self, a, b, cluster, cache=True):
+        paths = self.paths.setdefault(cluster, {})
+        if (a, b) in paths:
+            return paths[(a, b)]
+        parent = self.local_search(a, cluster, stop=b)[1]
+        path = [b]
+        while path[-1] != a:
+            path.append(parent[path[-1]])
+        path.reverse()
+        if cache:
+            paths[(a, b)] = path
+        return path
+
+    def cell_changed(self, x, y):
+        """Forget everything built from cell (x, y) after its wall or weight changed."""
+        cluster = (x // self.cluster_size, y // self.cluster_size)
+        x0, y0, x1, y1 = self.bounds(cluster)
+        stale = [cluster]
+        for other in self.adjacent(cluster):
+            # Only a cell on the shared edge can move that border's entrances
+            on_edge = ((other[0] > cluster[0] and x == x1 - 1) or (other[0] < cluster[0] and x == x0)
+                       or (other[1] > cluster[1] and y == y1 - 1) or (other[1] < cluster[1] and y == y0))
+            if on_edge:
+                self.borders.pop((cluster, other) if cluster < other else (other, cluster), None)
+                stale.append(other)
+        for c in stale:
+            self.crossings.pop(c, None)
+            self.intra.pop(c, None)
+            self.paths.pop(c, None)
+
+    def find_path(self, source, target):
+        """(path, cost, expanded) between two cell indices, like the engine searches."""
+        graph = self.graph
+        self.expanded = 0
+        if graph.obstacles[source] or graph.obstacles[target]:
+            return None, None, 0
+        start_cluster, goal_cluster = self.cluster_of(source), self.cluster_of(target)
+        if (abs(start_cluster[0] - goal_cluster[0]) <= 1
+                and abs(start_cluster[1] - goal_cluster[1]) <= 1):
+            # Too close for entrances to pay off, and where detours hurt most
+            path, cost, self.expanded = astar(graph, source, target, heuristic='Weighted Manhattan')
+            return path, cost, self.expanded
+
+        # Hook the endpoints into the abstract graph with local searches
+        reach = self.local_search(source, start_cluster)[0]
+        start_links = [(e, reach[e]) for e in self.cluster_crossings(start_cluster) if e in reach]
+        if target in reach:
+            start_links.append((target, reach[target]))
+        back = self.local_search(target, goal_cluster, reverse=True)[0]
+        goal_links = {e: back[e] for e in self.cluster_crossings(goal_cluster) if e in back}
+
+        h = graph.heuristic_to(target, 'Weighted Manhattan')
+        dist, parent = {source: 0}, {source: None}
+        closed = set()
+        pq = [(h(source), source)]
+        while pq:
+            _, node = heapq.heappop(pq)
+            if node == target:
+                break
+            if node in closed:
+                continue
+            closed.add(node)
+            self.expanded += 1
+            cost = dist[node]
+            cluster = self.cluster_of(node)
+            edges = start_links if node == source else self.entrance_edges(cluster, node)
+            edges = edges + self.cluster_crossings(cluster).get(node, [])
+            if node in goal_links:
+                edges.append((target, goal_links[node]))
+            for neighbor, weight in edges:
+                new_cost = cost + weight
+                if neighbor not in closed and new_cost < dist.get(neighbor, INF):
+                    dist[neighbor], parent[neighbor] = new_cost, node
+                    heapq.heappush(pq, (new_cost + h(neighbor), neighbor))
+        else:
+            return None, None, self.expanded
+
+        abstract = [target]
+        while parent[abstract[-1]] is not None:
+            abstract.append(parent[abstract[-1]])
+        abstract.reverse()
+        return [graph.coords(i) for i in self.refine(abstract)], dist[target], self.expanded
+
+    def refine(self, abstract):
+        """Turn an abstract path into grid cells."""
+        source, target = abstract[0], abstract[-1]
+        cells = [source]
+        for a, b in zip(abstract, abstract[1:]):
+            cluster = self.cluster_of(a)
+            if cluster != self.cluster_of(b):
+                cells.append(b)   # a border crossing is a single move
+            else:
+                # Entrance-to-entrance paths are reused; ones from this query's endpoints are not
+                cache = a != source and b != target
+                cells += self.local_path(a, b, cluster, cache)[1:]
+        return cells
@@ -0,0 +1,152 @@
+import heapq
+
+from heuristics import manhattan, octile
+
+
+class JumpPointSearch:
+    """Jump Point Search on a uniform-cost GridGraph (cell weights are ignored).
+
+    Straight runs of cells are skipped by "jumping" until a forced
+    neighbor or the goal is reached, so only the jump points go through
+    the open list. With diagonal=False moves are 4-connected; with
+    diagonal=True diagonals cost sqrt(2) and may not cut wall corners.
+    Path costs match BFS (4-connected) or octile Dijkstra (8-connected).
+    """
+
+    def __init__(self, graph, diagonal=False):
+        self.graph = graph
+        self.diagonal = diagonal
+        self.expanded = 0
+        self.pushes = 0
+
+    def free(self, x, y):
+        graph = self.graph
+        return (0 <= x < graph.cols and 0 <= y < graph.rows
+                and not graph.obstacles[y * graph.cols + x])
+
+    def directions(self, x, y, parent):
+        """Directions worth exploring from (x, y) given the jump point it came from."""
+        free = self.free
+        if parent is None:
+            steps = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+            if self.diagonal:
+                steps += [(dx, dy) for dx in (1, -1) for dy in (1, -1)
+                          if free(x + dx, y) and free(x, y + dy)]
+            return steps
+
+        px, py = parent
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        if not self.diagonal:
+            # Horizontal moves may turn vertical; vertical moves keep going
+            if dx:
+                return [(dx, 0), (0, 1), (0, -1)]
+            return [(0, dy), (1, 0), (-1, 0)]
+
+        if dx and dy:
+            steps = [(dx, 0), (0, dy)]
+            if free(x + dx, y) and free(x, y + dy):
+                steps.append((dx, dy))
+            return steps
+        if dx:
+            steps = [(dx, 0), (0, 1), (0, -1)]
+            if free(x + dx, y):
+                steps += [(dx, side) for side in (1, -1) if free(x, y + side)]
+            return steps
+        steps = [(0, dy), (1, 0), (-1, 0)]
+        if free(x, y + dy):
+            steps += [(side, dy) for side in (1, -1) if free(x + side, y)]
+        return steps
+
+    def jump(self, x, y, dx, dy, goal):
+        """Walk from (x, y) in direction (dx, dy); return the next jump point or None."""
+        free = self.free
+        while True:
+            x += dx
+            y += dy
+            if not free(x, y):
+                return None
+            if (x, y) == goal:
+                return (x, y)
+            if dx and dy:
+                # A diagonal step stops wherever a straight jump would find something
+                if self.jump(x, y, dx, 0, goal) or self.jump(x, y, 0, dy, goal):
+                    return (x, y)
+                if not (free(x + dx, y) and free(x, y + dy)):
+                    return None
+            elif dx:
+                if ((free(x, y - 1) and not free(x - dx, y - 1)) or
+                        (free(x, y + 1) and not free(x - dx, y + 1))):
+                    return (x, y)
+            else:
+                if ((free(x - 1, y) and not free(x - 1, y - dy)) or
+                        (free(x + 1, y) and not free(x + 1, y - dy))):
+                    return (x, y)
+                if not self.diagonal:
+                    # 4-connected: vertical runs must check for horizontal jump points
+                    if self.jump(x, y, 1, 0, goal) or self.jump(x, y, -1, 0, goal):
+                        return (x, y)
+
+    def distance(self, a, b):
+        dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+        return octile(dx, dy) if self.diagonal else manhattan(dx, dy)
+
+    def search(self, start, end, on_expand=None):
+        """Return (path, cost) between two (x, y) cells, or (None, None).
+
+        on_expand(cell) is called for every jump point taken off the open list.
+        """
+        self.expanded = 0
+        self.pushes = 0
+        if start not in self.graph or end not in self.graph:
+            return None, None
+
+        g = {start: 0}
+        parent = {start: None}
+        closed = set()
+        pq = [(self.distance(start, end), start)]
+        self.pushes = 1
+
+        while pq:
+            _, node = heapq.heappop(pq)
+            if node == end:
+                return self.expand_path(parent, end), g[end]
+            if node in closed:
+                continue
+            closed.add(node)
+            self.expanded += 1
+            if on_expand and node != start:
+                on_expand(node)
+
+            x, y = node
+            for dx, dy in self.directions(x, y, parent[node]):
+                point = self.jump(x, y, dx, dy, end)
+                if point is None or point in closed:
+                    continue
+                new_g = g[node] + self.distance(node, point)
+                if new_g < g.get(point, float('inf')):
+                    g[point] = new_g
+                    parent[point] = node
+                    heapq.heappush(pq, (new_g + self.distance(point, end), point))
+                    self.pushes += 1
+
+        return None, None
+
+    def expand_path(self, parent, end):
+        """Fill in the straight/diagonal runs between consecutive jump points."""
+        points = []
+        node = end
+        while node is not None:
+            points.append(node)
+            node = parent[node]
+        points.reverse()
+
+        path = [points[0]]
+        for (x, y), (nx, ny) in zip(points, points[1:]):
+            dx = (nx > x) - (nx < x)
+            dy = (ny > y) - (ny < y)
+            while (x, y) != (nx, ny):
+                x += dx
+                y += dy
+                path.append((x, y))
+        return path
@@ -0,0 +1,228 @@
+"""ALT (A*, Landmarks, Triangle inequality) preprocessing for a fixed grid.
+
+A handful of landmark cells is picked far apart and exact distance
+tables are stored from and to each of them. For any cell v and goal t
+the triangle inequality gives two admissible lower bounds per landmark
+L (moving into a cell costs its weight, so edges are directed):
+
+    d(v, t) >= d(L, t) - d(L, v)      and      d(v, t) >= d(v, L) - d(t, L)
+
+Landmarks.heuristic_to(t) returns the largest of them, which is often
+far tighter than Manhattan distance on mazes. Tables are saved to disk
+as raw arrays keyed by maze_hash(), so later runs on the same layout
+skip the preprocessing. Only cache layouts that really repeat: every
+new hash costs a full build and a new file.
+"""
+import hashlib
+import os
+from array import array
+
+from grid_graph import GridGraph
+from heuristics import SQRT2
+
+
+INF = float('inf')
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pathfinding-landmarks')
+
+
+def maze_hash(graph):
+    """Fingerprint of the grid size, move set, walls and weights."""
+    shape = f'{graph.cols}x{graph.rows}' + ('-diagonal' if graph.diagonal else '')
+    digest = hashlib.sha1(shape.encode())
+    digest.update(bytes(graph.obstacles))
+    digest.update(array('H', graph.weights).tobytes())
+    return digest.hexdigest()
+
+
+def only_endpoints_differ(graph, stock, endpoints):
+    """True if graph is stock except for endpoint cells that got cheaper.
+
+    Landmarks built for stock then serve searches on graph between those
+    endpoints (see Landmarks.heuristic_to), so one cache entry covers
+    every start/end pair on a stock layout.
+    """
+    if graph.size != stock.size or graph.diagonal != stock.diagonal:
+        return False
+    if graph.obstacles != stock.obstacles:
+        return False
+    for i in range(stock.size):
+        if stock.obstacles[i] or graph.weights[i] == stock.weights[i]:
+            continue
+        if i not in endpoints or graph.weights[i] > stock.weights[i]:
+            return False
+    return True
+
+
+def distance_table(graph, root, reverse=False):
+    """Exact cost from root to every cell (to root, with reverse=True)."""
+    dist = array('d', [INF]) * graph.size
+    dist[root] = 0
+    edges = graph.reverse_edges if reverse else graph.edges
+    pq = graph.priority_queue()
+    pq.push(0, root)
+    closed = bytearray(graph.size)
+    while pq:
+        cost, node = pq.pop()
+        if closed[node]:
+            continue
+        closed[node] = 1
+        for neighbor, weight in edges(node):
+            new_cost = cost + weight
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                pq.push(new_cost, neighbor)
+    return dist
+
+
+class Landmarks:
+    def __init__(self, landmarks, forward, backward, weights):
+        self.landmarks = landmarks   # cell indices
+        self.forward = forward       # forward[k][v] = d(landmark k, v)
+        self.backward = backward     # backward[k][v] = d(v, landmark k)
+        self.weights = weights       # cell weights of the graph the tables were built on
+
+    @classmethod
+    def build(cls, graph, count=8):
+        """Pick count landmarks by farthest-point selection and fill their tables.
+
+        Each new landmark is the free cell farthest from all landmarks
+        chosen so far (cells another component can't reach are skipped).
+        """
+        weights = array('H', graph.weights)
+        free = [i for i in range(graph.size) if not graph.obstacles[i]]
+        if not free:
+            return cls([], [], [], weights)
+        landmarks, forward, backward = [], [], []
+        nearest = None
+        # Seed with the reachable cell farthest from the middle free cell
+        # (free[0] could sit in a tiny walled-off pocket)
+        table = distance_table(graph, free[len(free) // 2])
+        candidate = max((i for i in free if table[i] != INF), key=table.__getitem__)
+        while len(landmarks) < min(count, len(free)):
+            landmarks.append(candidate)
+            table = distance_table(graph, candidate)
+            forward.append(table)
+            backward.append(distance_table(graph, candidate, reverse=True))
+            if nearest is None:
+                nearest = array('d', table)
+            else:
+                for i in free:
+                    if table[i] < nearest[i]:
+                        nearest[i] = table[i]
+            reachable = [i for i in free if nearest[i] != INF and i not in landmarks]
+            if not reachable:
+                break
+            candidate = max(reachable, key=nearest.__getitem__)
+        return cls(landmarks, forward, backward, weights)
+
+    @classmethod
+    def load_or_build(cls, graph, count=8, cache_dir=CACHE_DIR):
+        """Landmarks for graph from cache_dir, building and saving them on a miss."""
+        path = os.path.join(cache_dir, f'{maze_hash(graph)}-{count}.bin')
+        try:
+            return cls.load(path, graph.size)
+        except (OSError, EOFError, ValueError):
+            pass   # missing, truncated or not ours: rebuild
+        landmarks = cls.build(graph, count)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            landmarks.save(path)
+        except OSError:
+            pass   # a read-only cache only costs the preprocessing next time
+        return landmarks
+
+    def save(self, path):
+        """Raw arrays: (count, size), landmark indices, weights, then the tables."""
+        with open(path, 'wb') as f:
+            array('q', [len(self.landmarks), len(self.weights)]).tofile(f)
+            array('q', self.landmarks).tofile(f)
+            self.weights.tofile(f)
+            for table in self.forward + self.backward:
+                table.tofile(f)
+
+    @classmethod
+    def load(cls, path, size):
+        """Read a file written by save() for a graph of size cells; ValueError if it doesn't fit."""
+        with open(path, 'rb') as f:
+            header = array('q')
+            header.fromfile(f, 2)
+            count, stored_size = header
+            if stored_size != size or not 0 <= count <= size:
+                raise ValueError(f"{path}: tables for {stored_size} cells, expected {size}")
+            expected = 16 + 8 * count + 2 * size + 2 * count * 8 * size
+            if os.fstat(f.fileno()).st_size != expected:
+                raise ValueError(f"{path}: wrong length")
+            landmarks = array('q')
+            landmarks.fromfile(f, count)
+            if any(not 0 <= i < size for i in landmarks):
+                raise ValueError(f"{path}: landmark outside the grid")
+            weights = array('H')
+            weights.fromfile(f, size)
+            tables = []
+            for _ in range(2 * count):
+                table = array('d')
+                table.fromfile(f, size)
+                tables.append(table)
+        return cls(list(landmarks), tables[:count], tables[count:], weights)
+
+    def heuristic_to(self, target, graph=None):
+        """Return h(i), the best landmark lower bound on the cost from i to target.
+
+        graph, the grid being searched, may differ from the one the
+        tables were built on by being cheaper to enter at the source and
+        target (the visualizers leave both endpoints at weight 1). The
+        bounds are then lowered by what entering target saves, so they
+        stay admissible; the source is closed before anything re-enters it.
+        """
+        slack = 0
+        if graph is not None and graph.weights[target] < self.weights[target]:
+            slack = self.weights[target] - graph.weights[target]
+            if graph.diagonal:
+                slack *= SQRT2
+        terms = [(fwd, bwd, fwd[target], bwd[target])
+                 for fwd, bwd in zip(self.forward, self.backward)]
+
+        def h(i):
+            best = 0
+            for fwd, bwd, from_landmark, to_landmark in terms:
+                if from_landmark != INF and fwd[i] != INF:
+                    best = max(best, from_landmark - fwd[i])
+                if bwd[i] != INF and to_landmark != INF:
+                    best = max(best, bwd[i] - to_landmark)
+            return max(0, best - slack)
+        return h
+
+
+def stock_maze(graph, maze, weights=None):
+    """graph's shape with a border wall, the walls of maze and, if given, its weights."""
+    cols, rows = graph.cols, graph.rows
+    stock = GridGraph(cols, rows, diagonal=graph.diagonal)
+    for x in range(cols):
+        stock.set_obstacle(x, 0)
+        stock.set_obstacle(x, rows - 1)
+    for y in range(rows):
+        stock.set_obstacle(0, y)
+        stock.set_obstacle(cols - 1, y)
+    for y, row in enumerate(maze[:rows]):
+        for x, wall in enumerate(row[:cols]):
+            if wall:
+                stock.set_obstacle(x, y)
+    if weights is not None:
+        for y, row in enumerate(weights[:rows]):
+            for x, weight in enumerate(row[:cols]):
+                if not stock.obstacles[stock.index((x, y))]:
+                    stock.weights[stock.index((x, y))] = weight
+        stock.weights_changed()
+    return stock
+
+
+def for_stock_maze(graph, maze, weights, start, end):
+    """ALT tables when graph is the stock maze (see stock_maze) between start and end, else None.
+
+    Drawn walls or random weights would give a new layout (and a new
+    cache file) on every run, so those searches keep the plain heuristic.
+    """
+    stock = stock_maze(graph, maze, weights)
+    if not only_endpoints_differ(graph, stock, (stock.index(start), stock.index(end))):
+        return None
+    return Landmarks.load_or_build(stock)
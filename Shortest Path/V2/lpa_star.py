@@ -0,0 +1,104 @@
+import heapq
+
+INF = float('inf')
+
+
+class LPAStar:
+    """Lifelong Planning A* (LPA*) between a fixed start and goal on a GridGraph.
+
+    g/rhs values survive between searches, so after a cell is edited only
+    the vertices whose distance actually changed are expanded again. Edit
+    the graph (set_obstacle, clear_obstacle, set_weight), call
+    update_cell() for that cell, then compute_shortest_path().
+
+    The heuristic is built once from the current weights, so keep the
+    default Manhattan one if edits may lower the cheapest weight below 1.
+    """
+
+    def __init__(self, graph, start, goal, heuristic='Manhattan'):
+        self.graph = graph
+        self.heuristic = heuristic
+        self.reset(start, goal)
+
+    def reset(self, start, goal):
+        """Forget all search state and plan between new endpoints."""
+        graph = self.graph
+        self.start = graph.index(start)
+        self.goal = graph.index(goal)
+        self.h = graph.heuristic_to(self.goal, self.heuristic)
+        self.g = [INF] * graph.size
+        self.rhs = [INF] * graph.size
+        self.queue = []
+        self.queued = {}   # node -> key it is currently queued with
+        self.expanded = 0
+        self.rhs[self.start] = 0
+        self.push(self.start)
+
+    def key(self, u):
+        m = min(self.g[u], self.rhs[u])
+        return (m + self.h(u), m)
+
+    def push(self, u):
+        key = self.key(u)
+        self.queued[u] = key
+        heapq.heappush(self.queue, (key[0], key[1], u))
+
+    def update_vertex(self, u):
+        graph = self.graph
+        if u != self.start:
+            if graph.obstacles[u]:
+                self.rhs[u] = INF
+            else:
+                g = self.g
+                self.rhs[u] = min((g[p] + cost for p, cost in graph.reverse_edges(u)), default=INF)
+        self.queued.pop(u, None)
+        if self.g[u] != self.rhs[u]:
+            self.push(u)
+
+    def update_cell(self, x, y):
+        """Tell the planner that cell (x, y) changed on the graph."""
+        v = self.graph.index((x, y))
+        self.update_vertex(v)
+        for s in self.graph.surrounding(v):
+            self.update_vertex(s)
+
+    def compute_shortest_path(self):
+        """Repair g values until the goal is consistent; returns its cost."""
+        graph = self.graph
+        g, rhs, queue, queued = self.g, self.rhs, self.queue, self.queued
+        goal = self.goal
+        while queue:
+            k1, k2, u = queue[0]
+            if queued.get(u) != (k1, k2):
+                heapq.heappop(queue)   # stale entry
+                continue
+            if (k1, k2) >= self.key(goal) and rhs[goal] == g[goal]:
+                break
+            heapq.heappop(queue)
+            del queued[u]
+            self.expanded += 1
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+            else:
+                g[u] = INF
+                self.update_vertex(u)
+            for s in graph.neighbors(u):
+                self.update_vertex(s)
+        return g[goal]
+
+    @property
+    def cost(self):
+        return self.g[self.goal]
+
+    def path(self):
+        """Current shortest path as (x, y) tuples, or None if the goal is cut off."""
+        if self.g[self.goal] == INF:
+            return None
+        graph, g = self.graph, self.g
+        node = self.goal
+        path = [node]
+        while node != self.start:
+            node = min(graph.reverse_edges(node), key=lambda edge: g[edge[0]] + edge[1])[0]
+            path.append(node)
+        path.reverse()
+        return [graph.coords(i) for i in path]
@@ -0,0 +1,58 @@
+"""Readers for the MovingAI benchmark formats (https://movingai.com/benchmarks/).
+
+A .map file is a small header (type, height, width, then "map")
+followed by one text row per grid row. '.', 'G' and 'S' are passable;
+'@', 'O', 'T' and 'W' are walls here. A .scen file lists one query
+per line: bucket, map name, map size, start x/y, goal x/y and the
+optimal length the benchmark was published with.
+"""
+from grid_graph import GridGraph
+
+PASSABLE = '.GS'
+
+
+class Scenario:
+    def __init__(self, bucket, map_name, start, goal, optimal):
+        self.bucket = bucket
+        self.map_name = map_name
+        self.start = start        # (x, y)
+        self.goal = goal          # (x, y)
+        self.optimal = optimal    # published optimal length (8-connected, octile)
+
+
+def load_map(path):
+    """GridGraph with the walls of a .map file and every weight 1."""
+    with open(path) as f:
+        header = {}
+        for line in f:
+            line = line.strip()
+            if line == 'map':
+                break
+            key, _, value = line.partition(' ')
+            header[key] = value
+        else:
+            raise ValueError(f"{path}: no 'map' line in the header")
+        cols, rows = int(header['width']), int(header['height'])
+        graph = GridGraph(cols, rows)
+        for y in range(rows):
+            row = f.readline().rstrip('\r\n')
+            if len(row) < cols:
+                raise ValueError(f"{path}: row {y} is shorter than width {cols}")
+            for x in range(cols):
+                if row[x] not in PASSABLE:
+                    graph.set_obstacle(x, y)
+    return graph
+
+
+def load_scenarios(path):
+    """Scenarios of a .scen file, in file order."""
+    scenarios = []
+    with open(path) as f:
+        for line in f:
+            fields = line.split('\t') if '\t' in line else line.split()
+            if len(fields) < 9 or fields[0].startswith('version'):
+                continue
+            bucket, map_name = int(fields[0]), fields[1]
+            sx, sy, gx, gy = map(int, fields[4:8])
+            scenarios.append(Scenario(bucket, map_name, (sx, sy), (gx, gy), float(fields[8])))
+    return scenarios
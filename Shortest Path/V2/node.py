@@ -13,5 +13,5 @@ class node:
         self.is_obsetecle = False
         self.weight = 1 
     def show(self, color, thickness):
-        self.pygame.draw.rect(self.screen, color, (self.pixel_x, self.pixel_y, self.w, self.h), thickness)
-        self.pygame.display.update() 
\ No newline at end of file
+        # Callers push the changed area with pygame.display.update() themselves
+        self.pygame.draw.rect(self.screen, color, (self.pixel_x, self.pixel_y, self.w, self.h), thickness) 
\ No newline at end of file
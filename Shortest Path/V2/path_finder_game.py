@@ -4,178 +4,48 @@ import random
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-from collections import deque
-import heapq
 from node import node
 from data import fixed_maze, fixed_weights
-
-class Graph:
-    def __init__(self, grid, cols, rows):
-        self.adjacent_list = {}
+from grid_graph import GridGraph
+from heuristics import HEURISTICS
+import engine
+import playback
+from landmarks import for_stock_maze
+from flow_field import FlowField, INF
+
+class Graph(GridGraph):
+    def __init__(self, grid, cols, rows, diagonal=False):
+        super().__init__(cols, rows, diagonal=diagonal)
         self.grid = grid
-        self.cols = cols
-        self.rows = rows
         self.build_graph()
 
-    def add_vertex(self, vertex):
-        if vertex not in self.adjacent_list:
-            self.adjacent_list[vertex] = {}
-    def add_edge(self, u, v, weight=1):
-        self.add_vertex(u)
-        self.add_vertex(v)
-        self.adjacent_list[u][v] = weight
-        self.adjacent_list[v][u] = weight  
-
     def build_graph(self):
-        self.adjacent_list.clear()   # built_in fun()
-        self.add_vertices()
-        self.add_edges()
- 
-    def add_vertices(self):
-        for x in range(self.cols):
-            for y in range(self.rows):
-                if not self.grid[x][y].is_obsetecle:
-                    self.add_vertex((x, y))
-
-    def add_edges(self):
         for x in range(self.cols):
+            column = self.grid[x]
             for y in range(self.rows):
-                if not self.grid[x][y].is_obsetecle:
-                    # Check and add edge to right neighbor
-                    if x < self.cols - 1 and not self.grid[x + 1][y].is_obsetecle:
-                        self.add_edge((x, y), (x + 1, y), self.grid[x + 1][y].weight)
-                    # Check and add edge to left neighbor
-                    if x > 0 and not self.grid[x - 1][y].is_obsetecle:
-                        self.add_edge((x, y), (x - 1, y), self.grid[x - 1][y].weight)
-                    # Check and add edge to bottom neighbor
-                    if y < self.rows - 1 and not self.grid[x][y + 1].is_obsetecle:
-                        self.add_edge((x, y), (x, y + 1), self.grid[x][y + 1].weight)
-                    # Check and add edge to top neighbor
-                    if y > 0 and not self.grid[x][y - 1].is_obsetecle:
-                        self.add_edge((x, y), (x, y - 1), self.grid[x][y - 1].weight)
-
-    def dijkstra(self, start, end, open_set, closed_set, show_steps, teal, purple):
-        if start not in self.adjacent_list or end not in self.adjacent_list:
-            return None, None
-
-        costs = {v: float('inf') for v in self.adjacent_list}
-        costs[start] = 0
-        visited = {}
-        pq = [(0, start)]
-        open_set.add(start)
-
-        while pq:
-            weight, node = heapq.heappop(pq)
-            if node == end:
-                path = []
-                cur = end
-                while cur in visited:
-                    path.insert(0, cur)
-                    cur = visited[cur]
-                if path:
-                    path.insert(0, start)
-                return path, costs[end]
-
-            open_set.discard(node)
-            closed_set.add(node)
-            if show_steps and node != start:
-                self.grid[node[0]][node[1]].show(purple, 0)
-
-            for nbr in self.adjacent_list[node]:
-                if nbr not in closed_set:
-                    edge_weight = self.adjacent_list[node][nbr]
-                    new_cost = costs[node] + edge_weight
-                    if new_cost < costs[nbr]:
-                        costs[nbr] = new_cost
-                        visited[nbr] = node
-                        heapq.heappush(pq, (new_cost, nbr))
-                        if nbr not in open_set:
-                            open_set.add(nbr)
-                            if show_steps:
-                                self.grid[nbr[0]][nbr[1]].show(teal, 0)
-        return None, None
-
-    def bfs(self, start, end, open_set, closed_set, show_steps, teal, purple):
-        if start not in self.adjacent_list or end not in self.adjacent_list:
-            return None, None
-
-        queue = deque([[start]])
-        visited = set()
-        distances = {start: 0}
-        open_set.add(start)
-
-        while queue:
-            path = queue.popleft()
-            node = path[-1]
-            if node not in visited:
-                visited.add(node)
-                closed_set.add(node)
-                open_set.discard(node)
-                if show_steps and node != start:
-                    self.grid[node[0]][node[1]].show(purple, 0)
-
-                if node == end:
-                    return path, distances[node]
-
-                for adj in self.adjacent_list[node]:
-                    if adj not in visited:
-                        new_path = list(path)
-                        new_path.append(adj)
-                        queue.append(new_path)
-                        distances[adj] = distances[node] + 1
-                        open_set.add(adj)
-                        if show_steps:
-                            self.grid[adj[0]][adj[1]].show(teal, 0)
-        return None, None
-
-    def dfs(self, start, end, open_set, closed_set, show_steps, teal, purple):
-        if start not in self.adjacent_list or end not in self.adjacent_list:
-            return None, None
-
-        stack = [[start]]
-        visited = set()
-        open_set.add(start)
-
-        while stack:
-            path = stack.pop()
-            node = path[-1]
-
-            if node == end:
-                return path, len(path)
-
-            if node not in visited:
-                visited.add(node)
-                open_set.discard(node)
-                closed_set.add(node)
-                if show_steps and node != start:
-                    self.grid[node[0]][node[1]].show(purple, 0)
-
-                for neighbor in self.adjacent_list.get(node, []):
-                    if neighbor not in visited:
-                        new_path = list(path)
-                        new_path.append(neighbor)
-                        stack.append(new_path)
-                        if neighbor not in open_set:
-                            open_set.add(neighbor)
-                            if show_steps:
-                                self.grid[neighbor[0]][neighbor[1]].show(teal, 0)
-
-        return None, None
+                i = y * self.cols + x
+                self.obstacles[i] = column[y].is_obsetecle
+                self.weights[i] = column[y].weight
+        self.weights_changed()
 
 class PathfindingGameUI:
     def __init__(self, window,list):
         self.window = window
         self.window.title("Pathfinding Visualizer")
-        self.window.geometry("400x400")
+        self.window.geometry("400x440")
 
         # Tkinter variables
         self.tkvar = tk.StringVar()
         self.tkvar2 = tk.StringVar()
         self.tkvar3 = tk.StringVar()
+        self.tkvar4 = tk.StringVar()
         self.var = tk.IntVar()
+        self.diagonal_var = tk.IntVar()   # 8-connected moves
 
         # Choices
-        self.algo_choose = ['Dijkstra', 'DFS', 'BFS']
+        self.algo_choose = list(engine.ALGORITHMS)
+        self.weighted_algos = engine.WEIGHTED_ALGORITHMS
+        self.heuristic_choices = list(HEURISTICS)
         self.obsetcel_shape = ['Blank', 'Fixed Maze', 'Random']
         self.weight_choices = ['All Weights 1', 'Fixed Weights', 'Random Weights']
 
@@ -183,11 +53,13 @@ class PathfindingGameUI:
         self.tkvar.set('Dijkstra')
         self.tkvar2.set('Blank')
         self.tkvar3.set('All Weights 1')
+        self.tkvar4.set('Manhattan')
 
         # Track user choices
         self.option = self.tkvar.get()
         self.m_option = self.tkvar2.get()
         self.w_option = self.tkvar3.get()
+        self.h_option = self.tkvar4.get()
 
         # Start and end coordinates
         self.start =list[0][0]
@@ -209,7 +81,10 @@ class PathfindingGameUI:
         # Show steps checkbox
         self.showPath = ttk.Checkbutton(self.window, text='Show Steps :', 
                                       onvalue=1, offvalue=0, variable=self.var)
-        self.showPath.grid(columnspan=2, row=2, pady=3)
+        self.showPath.grid(row=2, column=0, pady=3)
+        self.diagonalBox = ttk.Checkbutton(self.window, text='Diagonal Moves :',
+                                           onvalue=1, offvalue=0, variable=self.diagonal_var)
+        self.diagonalBox.grid(row=2, column=1, pady=3)
 
         # Algorithm selection
         tk.Label(self.window, text="Algorithm:").grid(row=3, pady=3, padx=3)
@@ -217,37 +92,45 @@ class PathfindingGameUI:
                                      command=self.choose_algo)
         self.popupMenu.grid(row=3, column=1, pady=3)
 
+        # A* heuristic selection (only used by A*)
+        tk.Label(self.window, text="Heuristic:").grid(row=4, pady=3, padx=3)
+        self.hMenu = tk.OptionMenu(self.window, self.tkvar4, *self.heuristic_choices, 
+                                 command=self.change_heuristic)
+        self.hMenu.grid(row=4, column=1, pady=3)
+        self.hMenu.configure(state='disabled')
+
         # Weight type selection
-        tk.Label(self.window, text="Weight:").grid(row=4, pady=3, padx=3)
+        tk.Label(self.window, text="Weight:").grid(row=5, pady=3, padx=3)
         self.wMenu = tk.OptionMenu(self.window, self.tkvar3, *self.weight_choices, 
                                  command=self.change_weight)
-        self.wMenu.grid(row=4, column=1, pady=3)
+        self.wMenu.grid(row=5, column=1, pady=3)
 
         # Maze type selection
-        tk.Label(self.window, text="Starting Layout:").grid(row=5, pady=3, padx=3)
+        tk.Label(self.window, text="Starting Layout:").grid(row=6, pady=3, padx=3)
         self.mMenu = tk.OptionMenu(self.window, self.tkvar2, *self.obsetcel_shape, 
                                  command=self.choose_obtescel)
-        self.mMenu.grid(row=5, column=1, pady=3)
+        self.mMenu.grid(row=6, column=1, pady=3)
 
         # Instructions
         tk.Label(self.window, text="1 ≤ x ≤ 48 and 1 ≤ y ≤ 48").grid(
-            row=6, column=0, columnspan=2, pady=3)
-        tk.Label(self.window, text="Use cursor to draw walls.").grid(
             row=7, column=0, columnspan=2, pady=3)
-        tk.Label(self.window, text="Press 'SPACE' to start.").grid(
+        tk.Label(self.window, text="Use cursor to draw walls.").grid(
             row=8, column=0, columnspan=2, pady=3)
+        tk.Label(self.window, text="Press 'SPACE' to start.").grid(
+            row=9, column=0, columnspan=2, pady=3)
 
         # Submit button
         self.submit = tk.Button(self.window, text="let's go❕⚡", command=self.onsubmit)
-        self.submit.grid(columnspan=2, row=9, pady=10)
+        self.submit.grid(columnspan=2, row=10, pady=10)
 
     def choose_algo(self, event=None, *args):
         self.option = self.tkvar.get()
         print("Algorithm:", self.option)
-        if self.option != 'Dijkstra':
+        if self.option not in self.weighted_algos:
             self.wMenu.configure(state='disabled')
         else:
-            self.wMenu.configure(state='normal') # if any algo insteade of dijkstra the eight option is disabled 
+            self.wMenu.configure(state='normal') # weights only matter for dijkstra and A*
+        self.hMenu.configure(state='normal' if self.option == 'A*' else 'disabled')
 
     def choose_obtescel(self, event=None, *args):
         self.m_option = self.tkvar2.get()
@@ -257,6 +140,9 @@ class PathfindingGameUI:
         self.w_option = self.tkvar3.get()
         print("Weight Mode:", self.w_option)
 
+    def change_heuristic(self, event=None, *args):
+        self.h_option = self.tkvar4.get()
+
     def onsubmit(self):
         try:
             st = self.startBox.get().split(',')
@@ -320,6 +206,14 @@ class PathfindingVisualizer:
         self.white = (255, 255, 255)   # Background color
         self.green = (50, 255, 50)     # Start node color
         self.red = (255, 50, 50)       # End node color
+        self.orange = (255, 140, 0)    # Visited from the end (bidirectional)
+        self.peach = (255, 200, 120)   # Open set of the search from the end
+        self.field_near = (255, 236, 150)  # Flow field: cheap to reach the end
+        self.field_far = (90, 40, 120)     # Flow field: most expensive reachable cell
+        self.flow_field = None             # toggled with F before the search starts
+
+        # Trace playback speed (see playback.py)
+        self.cells_per_frame = playback.cells_per_frame(50)
         
         self.weight_colors = [
     [(255 - i * 17, 255 - i * 17, 255 - i * 17), 0] for i in range(15)
@@ -452,25 +346,43 @@ class PathfindingVisualizer:
 
     def run_pathfinding(self):
         """Execute the selected pathfinding algorithm"""
-        open_set = set()
-        closed_set = set()
-        path, cost = None, None    # initailiing the varibels 
-        
-
         start_pos = (self.start_node.x, self.start_node.y)
         end_pos = (self.end_node.x, self.end_node.y)
 
-        if self.ui.option == 'Dijkstra':
-            path, cost = self.graph.dijkstra(start_pos, end_pos, open_set, closed_set, 
-                                           self.ui.var.get(), self.teal, self.purple)
-        elif self.ui.option == 'BFS':
-            path, cost = self.graph.bfs(start_pos, end_pos, open_set, closed_set, 
-                                      self.ui.var.get(), self.teal, self.purple)
-        elif self.ui.option == 'DFS':
-            path, cost = self.graph.dfs(start_pos, end_pos, open_set, closed_set, 
-                                      self.ui.var.get(), self.teal, self.purple)
-
-        return path, cost
+        # Random weights are never a stock layout, so they skip the landmark lookup
+        landmarks = None
+        if (self.ui.option == 'A*' and self.ui.m_option == 'Fixed Maze'
+                and self.ui.w_option != 'Random Weights'):
+            weights = fixed_weights if self.ui.w_option == 'Fixed Weights' else None
+            landmarks = for_stock_maze(self.graph, fixed_maze, weights, start_pos, end_pos)
+
+        result = engine.find_path(self.graph, self.ui.option, start_pos, end_pos,
+                                  heuristic=self.ui.h_option,
+                                  record_trace=bool(self.ui.var.get()),
+                                  landmarks=landmarks)
+        self.expanded = result.expanded
+        if result.trace:
+            self.play_trace(result.trace)
+
+        return result.path, result.cost
+
+    def play_trace(self, trace):
+        """Replay the search recorded by the engine"""
+        colors = {engine.VISITED: self.purple, engine.FRONTIER: self.teal,
+                  engine.VISITED_END: self.orange, engine.FRONTIER_END: self.peach}
+        endpoints = (self.start_node, self.end_node)
+        clock = pygame.time.Clock()
+        for frame in playback.frames(trace, self.cells_per_frame):
+            dirty = []
+            for i, state in frame:
+                x, y = self.graph.coords(i)
+                cell = self.grid[x][y]
+                if cell not in endpoints:
+                    cell.show(colors[state], 0)
+                    dirty.append((cell.pixel_x, cell.pixel_y, cell.w, cell.h))
+            pygame.display.update(dirty)   # one flip per frame
+            pygame.event.pump()
+            clock.tick(playback.FPS)
 
     def display_path(self, path):
         """Display the final path"""
@@ -479,12 +391,40 @@ class PathfindingVisualizer:
             for (x, y) in path[1:-1]:
                 self.grid[x][y].show(self.blue, 0)
             self.end_node.show(self.red, 0)
+            pygame.display.update()
+
+    def toggle_flow_field(self):
+        """Shade cells by their cost to the end node (F), or put the normal colors back"""
+        self.flow_field = None if self.flow_field else FlowField(
+            self.graph, (self.end_node.x, self.end_node.y))
+        field = self.flow_field
+        far = max((c for c in field.cost if c != INF), default=0) if field else 0
+        for x in range(self.cols):
+            for y in range(self.rows):
+                cell = self.grid[x][y]
+                cost = field.cost_to_goal((x, y)) if field else INF
+                if cell in (self.start_node, self.end_node) or cell.is_obsetecle:
+                    continue
+                if cost != INF:
+                    t = cost / far if far else 0
+                    cell.show(tuple(int(a + (b - a) * t) for a, b in
+                                    zip(self.field_near, self.field_far)), 0)
+                elif cell.weight > 1:
+                    color_info = self.weight_colors[cell.weight - 1]
+                    cell.show(color_info[0], color_info[1])
+                else:
+                    cell.show(self.white, 0)
+                    cell.show(self.black, 1)
+        pygame.display.update()
 
     def show_result(self, path, cost):
+        if isinstance(cost, float):
+            cost = round(cost, 2)   # diagonal steps cost sqrt(2)
         if path:
             message = (f'The shortest distance/least weighted path is {cost}' 
-                    if self.ui.option == 'Dijkstra' 
+                    if self.ui.option in self.ui.weighted_algos 
                     else f'The shortest distance to the path is {cost} blocks away')
+            message += f' ({self.expanded} nodes expanded)'
             
             root = tk.Tk()
             root.wm_withdraw()
@@ -512,6 +452,12 @@ class PathfindingVisualizer:
         '''
         if self.ui.start is None or self.ui.end is None: #>>>>>>>>>> donnot continue 
             return
+        self.graph.diagonal = bool(self.ui.diagonal_var.get())
+        # The chosen settings stay on screen in the title bar; the heuristic only matters to A*
+        settings = [self.ui.option, self.ui.m_option, self.ui.w_option]
+        if self.ui.option == 'A*':
+            settings.insert(1, self.ui.h_option)
+        pygame.display.set_caption("Pathfinding Visualizer: " + ", ".join(settings))
         self.start_node = self.grid[self.ui.start[0]][self.ui.start[1]] #============>>>>>>>> from window.tk
         self.end_node = self.grid[self.ui.end[0]][self.ui.end[1]]  
         
@@ -547,6 +493,7 @@ grid = [
         # Show start and end nodes
         self.start_node.show(self.green, 0)
         self.end_node.show(self.red, 0)
+        pygame.display.update()
         
         # Main interaction loop
         running = True
@@ -559,6 +506,8 @@ grid = [
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE and not pathfinding_started:
                         pathfinding_started = True
+                        if self.flow_field:
+                            self.toggle_flow_field()
                         path, cost = self.run_pathfinding()
                         self.display_path(path)
                         
@@ -571,6 +520,8 @@ grid = [
                             return   # Exit current instance
                         elif action == "exit":
                             running = False
+                    elif event.key == pygame.K_f and not pathfinding_started:
+                        self.toggle_flow_field()
                 
         pygame.quit()
         sys.exit()
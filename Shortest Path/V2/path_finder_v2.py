@@ -1,241 +1,75 @@
+import argparse
 import pygame
 import sys
 import random
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-from collections import deque
-import heapq
-import time
+from grid_graph import GridGraph
+from lpa_star import LPAStar
+from heuristics import HEURISTICS
+import engine
+import playback
+from landmarks import for_stock_maze
+from flow_field import FlowField, INF
+from grid_renderer import make_renderer
 
 # Node class
 class Node:
-    def __init__(self, pygame_instance, screen, w, h, rows, cols, x, y):
-        self.pygame = pygame_instance
-        self.screen = screen
-        self.w = w
-        self.h = h
-        self.rows = rows
-        self.cols = cols
+    def __init__(self, renderer, x, y):
+        self.renderer = renderer
         self.x = x
         self.y = y
         self.is_obstacle = False
         self.weight = 1
         self.color = None
         
-    def show(self, color, border_width=0):
+    def show(self, color):
+        # Drawn on the next GridRenderer.flush(), and only if the color changed
         self.color = color
-        x_pixel = self.x * self.w
-        y_pixel = self.y * self.h
-        
-        if border_width > 0:
-            # Draw border
-            self.pygame.draw.rect(self.screen, (0, 0, 0), 
-                                (x_pixel, y_pixel, self.w, self.h), border_width)
-        else:
-            # Fill the cell
-            self.pygame.draw.rect(self.screen, color, 
-                                (x_pixel, y_pixel, self.w, self.h))
-            # Add subtle border for better visibility
-            self.pygame.draw.rect(self.screen, (200, 200, 200), 
-                                (x_pixel, y_pixel, self.w, self.h), 1)
-
-# Fixed maze and weights data
-fixed_maze = [
-    [1] * 50 if i == 0 or i == 49 else 
-    [1] + [0] * 48 + [1] if 1 <= i <= 48 else []
-    for i in range(50)
-]
-
-# Add some internal walls to the fixed maze
-for i in range(5, 45, 10):
-    for j in range(5, 45):
-        if j != 25:  # Leave gaps for paths
-            fixed_maze[i][j] = 1
-
-fixed_weights = [
-    [random.randint(1, 15) for _ in range(50)]
-    for _ in range(50)
-]
-
-class Graph:
-    def __init__(self, grid, cols, rows):
-        self.adjacent_list = {}
+        self.renderer.paint(self.x, self.y, color)
+
+# Fixed maze and weights data, sized to the grid (--size, 50 by default)
+def make_fixed_maze(size):
+    maze = [
+        [1] * size if i == 0 or i == size - 1 else
+        [1] + [0] * (size - 2) + [1]
+        for i in range(size)
+    ]
+    # Add some internal walls to the fixed maze
+    for i in range(5, size - 5, 10):
+        for j in range(5, size - 5):
+            if j != size // 2:  # Leave gaps for paths
+                maze[i][j] = 1
+    return maze
+
+def make_fixed_weights(size):
+    # Seeded so the layout really is fixed between runs (landmark tables are cached by it)
+    rng = random.Random(50)
+    return [[rng.randint(1, 15) for _ in range(size)] for _ in range(size)]
+
+class Graph(GridGraph):
+    def __init__(self, grid, cols, rows, diagonal=False):
+        super().__init__(cols, rows, diagonal=diagonal)
         self.grid = grid
-        self.cols = cols
-        self.rows = rows
         self.build_graph()
 
-    def add_vertex(self, vertex):
-        if vertex not in self.adjacent_list:
-            self.adjacent_list[vertex] = {}
-    
-    def add_edge(self, u, v, weight=1):
-        self.add_vertex(u)
-        self.add_vertex(v)
-        self.adjacent_list[u][v] = weight
-        self.adjacent_list[v][u] = weight  
-
     def build_graph(self):
-        self.adjacent_list.clear()
-        self.add_vertices()
-        self.add_edges()
- 
-    def add_vertices(self):
+        # Copy the node grid into the flat obstacle/weight arrays
         for x in range(self.cols):
+            column = self.grid[x]
             for y in range(self.rows):
-                if not self.grid[x][y].is_obstacle:
-                    self.add_vertex((x, y))
-
-    def add_edges(self):
-        for x in range(self.cols):
-            for y in range(self.rows):
-                if not self.grid[x][y].is_obstacle:
-                    # Check all four directions
-                    directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-                    for dx, dy in directions:
-                        nx, ny = x + dx, y + dy
-                        if (0 <= nx < self.cols and 0 <= ny < self.rows and 
-                            not self.grid[nx][ny].is_obstacle):
-                            self.add_edge((x, y), (nx, ny), self.grid[nx][ny].weight)
-
-    def dijkstra(self, start, end, visualizer):
-        if start not in self.adjacent_list or end not in self.adjacent_list:
-            return None, None
-
-        costs = {v: float('inf') for v in self.adjacent_list}
-        costs[start] = 0
-        visited = {}
-        pq = [(0, start)]
-        open_set = set([start])
-        closed_set = set()
-
-        while pq:
-            current_cost, node = heapq.heappop(pq)
-            
-            if node == end:
-                path = []
-                cur = end
-                while cur in visited:
-                    path.insert(0, cur)
-                    cur = visited[cur]
-                if path:
-                    path.insert(0, start)
-                return path, costs[end]
-
-            if node in closed_set:
-                continue
-                
-            open_set.discard(node)
-            closed_set.add(node)
-            
-            # Animate visited node
-            if node != start and visualizer.show_steps:
-                visualizer.animate_node(node, visualizer.purple, "visited")
-
-            for neighbor in self.adjacent_list[node]:
-                if neighbor not in closed_set:
-                    edge_weight = self.adjacent_list[node][neighbor]
-                    new_cost = costs[node] + edge_weight
-                    
-                    if new_cost < costs[neighbor]:
-                        costs[neighbor] = new_cost
-                        visited[neighbor] = node
-                        heapq.heappush(pq, (new_cost, neighbor))
-                        
-                        if neighbor not in open_set:
-                            open_set.add(neighbor)
-                            # Animate frontier node
-                            if visualizer.show_steps:
-                                visualizer.animate_node(neighbor, visualizer.teal, "frontier")
-        
-        return None, None
-
-    def bfs(self, start, end, visualizer):
-        if start not in self.adjacent_list or end not in self.adjacent_list:
-            return None, None
-
-        queue = deque([[start]])
-        visited = set()
-        distances = {start: 0}
-        open_set = set([start])
-        closed_set = set()
-
-        while queue:
-            path = queue.popleft()
-            node = path[-1]
-            
-            if node not in visited:
-                visited.add(node)
-                closed_set.add(node)
-                open_set.discard(node)
-                
-                # Animate visited node
-                if node != start and visualizer.show_steps:
-                    visualizer.animate_node(node, visualizer.purple, "visited")
-
-                if node == end:
-                    return path, distances[node]
-
-                for adj in self.adjacent_list[node]:
-                    if adj not in visited:
-                        new_path = list(path)
-                        new_path.append(adj)
-                        queue.append(new_path)
-                        distances[adj] = distances[node] + 1
-                        
-                        if adj not in open_set:
-                            open_set.add(adj)
-                            # Animate frontier node
-                            if visualizer.show_steps:
-                                visualizer.animate_node(adj, visualizer.teal, "frontier")
-        
-        return None, None
-
-    def dfs(self, start, end, visualizer):
-        if start not in self.adjacent_list or end not in self.adjacent_list:
-            return None, None
-
-        stack = [[start]]
-        visited = set()
-        open_set = set([start])
-        closed_set = set()
-
-        while stack:
-            path = stack.pop()
-            node = path[-1]
-
-            if node == end:
-                return path, len(path)
-
-            if node not in visited:
-                visited.add(node)
-                open_set.discard(node)
-                closed_set.add(node)
-                
-                # Animate visited node
-                if node != start and visualizer.show_steps:
-                    visualizer.animate_node(node, visualizer.purple, "visited")
-
-                for neighbor in self.adjacent_list.get(node, []):
-                    if neighbor not in visited:
-                        new_path = list(path)
-                        new_path.append(neighbor)
-                        stack.append(new_path)
-                        
-                        if neighbor not in open_set:
-                            open_set.add(neighbor)
-                            # Animate frontier node
-                            if visualizer.show_steps:
-                                visualizer.animate_node(neighbor, visualizer.teal, "frontier")
-
-        return None, None
+                i = y * self.cols + x
+                self.obstacles[i] = column[y].is_obstacle
+                self.weights[i] = column[y].weight
+        self.weights_changed()
 
 class PathfindingGameUI:
-    def __init__(self, window):
+    def __init__(self, window, size=50):
         self.window = window
+        self.size = size
         self.window.title("🎯 Pathfinding Visualizer Configuration")
-        self.window.geometry("500x600")
+        self.window.geometry("500x815")
         self.window.configure(bg='#f0f0f0')
         
         # Make window non-resizable but centered
@@ -247,16 +81,20 @@ class PathfindingGameUI:
         self.maze_var = tk.StringVar(value='Blank')
         self.weight_var = tk.StringVar(value='All Weights 1')
         self.show_steps_var = tk.IntVar(value=1)
+        self.diagonal_var = tk.IntVar(value=0)
         self.animation_speed_var = tk.IntVar(value=50)
+        self.heuristic_var = tk.StringVar(value='Manhattan')
 
         # Choices
-        self.algorithms = ['Dijkstra', 'DFS', 'BFS']
+        self.algorithms = list(engine.ALGORITHMS)
+        self.weighted_algorithms = engine.WEIGHTED_ALGORITHMS
+        self.heuristics = list(HEURISTICS)
         self.maze_types = ['Blank', 'Fixed Maze', 'Random']
         self.weight_types = ['All Weights 1', 'Fixed Weights', 'Random Weights']
 
         # Start and end coordinates
         self.start = (5, 5)
-        self.end = (45, 45)
+        self.end = (size - 5, size - 5)
 
         self.setup_ui()
 
@@ -304,7 +142,7 @@ class PathfindingGameUI:
                 bg='#f0f0f0', fg='#e74c3c').pack(side='left')
         self.end_entry = tk.Entry(end_frame, font=('Arial', 10), width=15)
         self.end_entry.pack(side='right')
-        self.end_entry.insert(0, "45,45")
+        self.end_entry.insert(0, f"{self.size - 5},{self.size - 5}")
 
         # Algorithm section
         algo_frame = tk.LabelFrame(main_frame, text="🧠 Algorithm", 
@@ -317,6 +155,15 @@ class PathfindingGameUI:
                                command=self.on_algorithm_change)
             rb.pack(anchor='w', padx=10, pady=2)
 
+        heuristic_frame = tk.Frame(algo_frame, bg='#f0f0f0')
+        heuristic_frame.pack(fill='x', padx=10, pady=5)
+
+        tk.Label(heuristic_frame, text="A* Heuristic:", font=('Arial', 10),
+                bg='#f0f0f0').pack(side='left')
+        self.heuristic_combo = ttk.Combobox(heuristic_frame, textvariable=self.heuristic_var,
+                                           values=self.heuristics, state='disabled', width=20)
+        self.heuristic_combo.pack(side='left', padx=5)
+
         # Settings section
         settings_frame = tk.LabelFrame(main_frame, text="⚙️ Settings", 
                                       font=('Arial', 12, 'bold'), bg='#f0f0f0', fg='#34495e')
@@ -329,6 +176,9 @@ class PathfindingGameUI:
         tk.Checkbutton(steps_frame, text="Show Animation Steps", 
                       variable=self.show_steps_var, font=('Arial', 10), 
                       bg='#f0f0f0').pack(anchor='w')
+        tk.Checkbutton(steps_frame, text="Diagonal Moves (8-connected, no corner cutting)",
+                      variable=self.diagonal_var, font=('Arial', 10),
+                      bg='#f0f0f0').pack(anchor='w')
 
         # Animation speed
         speed_frame = tk.Frame(settings_frame, bg='#f0f0f0')
@@ -366,11 +216,13 @@ class PathfindingGameUI:
         info_frame.pack(fill='x', pady=10)
 
         instructions = [
-            "• Coordinates range: 1 ≤ x,y ≤ 48",
+            f"• Coordinates range: 1 ≤ x,y ≤ {self.size - 2}",
             "• Use mouse to draw/erase walls in the visualizer",
             "• Press SPACE to start the pathfinding",
+            "• Press L for a live shortest path, F for the flow field",
             "• Green = Start, Red = End, Black = Walls",
-            "• Light Blue = Frontier, Purple = Visited, Blue = Path"
+            "• Light Blue = Frontier, Purple = Visited, Blue = Path",
+            "• Orange = searched from the end (bidirectional)"
         ]
 
         for instruction in instructions:
@@ -388,13 +240,16 @@ class PathfindingGameUI:
         self.start_button.pack()
 
     def on_algorithm_change(self):
-        # Disable weight options for non-Dijkstra algorithms
-        if self.algorithm_var.get() != 'Dijkstra':
+        # Disable weight options for unweighted algorithms
+        if self.algorithm_var.get() not in self.weighted_algorithms:
             self.weight_combo.configure(state='disabled')
             self.weight_var.set('All Weights 1')
         else:
             self.weight_combo.configure(state='readonly')
 
+        self.heuristic_combo.configure(
+            state='readonly' if self.algorithm_var.get() == 'A*' else 'disabled')
+
     def on_submit(self):
         try:
             # Parse coordinates
@@ -407,9 +262,10 @@ class PathfindingGameUI:
             start_x, start_y = int(start_coords[0]), int(start_coords[1])
             end_x, end_y = int(end_coords[0]), int(end_coords[1])
             
-            # Validate coordinates
-            if not (1 <= start_x <= 48 and 1 <= start_y <= 48 and 
-                    1 <= end_x <= 48 and 1 <= end_y <= 48):
+            # Validate coordinates (the outer ring is wall)
+            last = self.size - 2
+            if not (1 <= start_x <= last and 1 <= start_y <= last and
+                    1 <= end_x <= last and 1 <= end_y <= last):
                 raise ValueError("Coordinates out of range")
                 
             self.start = (start_x, start_y)
@@ -421,10 +277,10 @@ class PathfindingGameUI:
             
         except ValueError as e:
             messagebox.showerror("Input Error", 
-                               "Please enter valid coordinates (x,y) between 1 and 48!")
+                               f"Please enter valid coordinates (x,y) between 1 and {self.size - 2}!")
 
 class PathfindingVisualizer:
-    def __init__(self):
+    def __init__(self, size=50):
         pygame.init()
         
         # Screen settings
@@ -433,9 +289,11 @@ class PathfindingVisualizer:
         self.screen = pygame.display.set_mode((self.screen_w, self.screen_h))
         pygame.display.set_caption("🎯 Pathfinding Visualizer")
         
-        # Grid settings
-        self.cols = 50
-        self.rows = 50
+        # Grid settings; from 100x100 up make_renderer picks the NumPy renderer
+        self.cols = size
+        self.rows = size
+        self.fixed_maze = make_fixed_maze(size)
+        self.fixed_weights = make_fixed_weights(size)
         self.cell_w = self.screen_w / self.cols
         self.cell_h = self.screen_h / self.rows
         
@@ -447,6 +305,16 @@ class PathfindingVisualizer:
         self.white = (236, 240, 241)      # Background
         self.green = (46, 204, 113)       # Start node
         self.red = (231, 76, 60)          # End node
+        self.orange = (230, 126, 34)      # Visited from the end (bidirectional)
+        self.peach = (245, 176, 65)       # Frontier from the end (bidirectional)
+        self.field_near = (249, 231, 159) # Flow field: cheap to reach the end
+        self.field_far = (108, 52, 131)   # Flow field: most expensive reachable cell
+        self.trace_colors = {
+            engine.VISITED: self.purple,
+            engine.FRONTIER: self.teal,
+            engine.VISITED_END: self.orange,
+            engine.FRONTIER_END: self.peach,
+        }
         self.gray = (149, 165, 166)       # Grid lines
         
         # Weight colors (lighter to darker gray/blue)
@@ -456,8 +324,9 @@ class PathfindingVisualizer:
             self.weight_colors.append((intensity, intensity, min(255, intensity + 20)))
         
         # Animation settings
-        self.animation_delay = 0.05
+        self.cells_per_frame = 1
         self.show_steps = True
+        self.diagonal = False   # 8-connected moves, chosen in the config dialog
         
         # Initialize
         self.grid = []
@@ -466,6 +335,17 @@ class PathfindingVisualizer:
         self.start_node = None
         self.end_node = None
         self.clock = pygame.time.Clock()
+        self.renderer = make_renderer(self.screen, self.cols, self.rows,
+                                      self.white, self.gray)
+        
+        # Live path (LPA*), toggled with L while drawing walls
+        self.planner = None
+        self.live_path = []
+        self.expanded = 0
+        
+        # Flow field to the end node, toggled with F; rebuilt once a wall stroke ends
+        self.flow_field = None
+        self.flow_field_stale = False
         
         self.create_grid()
 
@@ -474,33 +354,20 @@ class PathfindingVisualizer:
         for x in range(self.cols):
             row = []
             for y in range(self.rows):
-                node = Node(pygame, self.screen, self.cell_w, self.cell_h, 
-                           self.rows, self.cols, x, y)
+                node = Node(self.renderer, x, y)
                 row.append(node)
             self.grid.append(row)
         
-        self.graph = Graph(self.grid, self.cols, self.rows)
+        self.graph = Graph(self.grid, self.cols, self.rows, self.diagonal)
 
     def setup_ui(self):
         window = tk.Tk()
-        self.ui = PathfindingGameUI(window)
+        self.ui = PathfindingGameUI(window, self.cols)
         window.mainloop()
 
     def draw_grid(self):
-        self.screen.fill(self.white)
-        
-        # Draw all cells
-        for x in range(self.cols):
-            for y in range(self.rows):
-                self.grid[x][y].show(self.white, 0)
-        
-        # Draw grid lines
-        for x in range(self.cols + 1):
-            pygame.draw.line(self.screen, self.gray, 
-                           (x * self.cell_w, 0), (x * self.cell_w, self.screen_h), 1)
-        for y in range(self.rows + 1):
-            pygame.draw.line(self.screen, self.gray, 
-                           (0, y * self.cell_h), (self.screen_w, y * self.cell_h), 1)
+        # Back to an empty grid; cells that are already white are skipped
+        self.renderer.clear()
 
     def draw_borders(self):
         for i in range(self.rows):
@@ -508,7 +375,7 @@ class PathfindingVisualizer:
             for border_cell in [(0, i), (self.cols-1, i), (i, 0), (i, self.rows-1)]:
                 if 0 <= border_cell[0] < self.cols and 0 <= border_cell[1] < self.rows:
                     self.grid[border_cell[0]][border_cell[1]].is_obstacle = True
-                    self.grid[border_cell[0]][border_cell[1]].show(self.black, 0)
+                    self.grid[border_cell[0]][border_cell[1]].show(self.black)
 
     def apply_maze_layout(self):
         if self.ui.maze_var.get() == 'Random':
@@ -517,15 +384,14 @@ class PathfindingVisualizer:
                     if (random.choice([1, 2, 3, 4, 5]) == 2 and 
                         (i, j) != self.ui.start and (i, j) != self.ui.end):
                         self.grid[i][j].is_obstacle = True
-                        self.grid[i][j].show(self.black, 0)
+                        self.grid[i][j].show(self.black)
         elif self.ui.maze_var.get() == 'Fixed Maze':
             for i in range(self.cols):
                 for j in range(self.rows):
-                    if (j < len(fixed_maze) and i < len(fixed_maze[j]) and
-                        fixed_maze[j][i] == 1 and 
+                    if (self.fixed_maze[j][i] == 1 and
                         (i, j) != self.ui.start and (i, j) != self.ui.end):
                         self.grid[i][j].is_obstacle = True
-                        self.grid[i][j].show(self.black, 0)
+                        self.grid[i][j].show(self.black)
 
     def apply_weights(self):
         if self.ui.weight_var.get() == 'Random Weights':
@@ -536,32 +402,19 @@ class PathfindingVisualizer:
                         weight = random.randint(1, 15)
                         self.grid[i][j].weight = weight
                         color = self.weight_colors[weight-1]
-                        self.grid[i][j].show(color, 0)
+                        self.grid[i][j].show(color)
         elif self.ui.weight_var.get() == 'Fixed Weights':
             for i in range(self.cols):
                 for j in range(self.rows):
                     if (not self.grid[i][j].is_obstacle and 
-                        (i, j) != self.ui.start and (i, j) != self.ui.end and
-                        j < len(fixed_weights) and i < len(fixed_weights[j])):
-                        weight = fixed_weights[j][i]
+                        (i, j) != self.ui.start and (i, j) != self.ui.end):
+                        weight = self.fixed_weights[j][i]
                         self.grid[i][j].weight = weight
                         color = self.weight_colors[weight-1]
-                        self.grid[i][j].show(color, 0)
+                        self.grid[i][j].show(color)
 
-    def animate_node(self, pos, color, node_type):
-        if not self.show_steps:
-            return
-            
-        x, y = pos
-        self.grid[x][y].show(color, 0)
-        
-        # Update display
-        pygame.display.update()
-        
-        # Control animation speed
-        time.sleep(self.animation_delay)
-        
-        # Handle events to prevent freezing
+    def handle_quit(self):
+        # Keep the window responsive while a trace is playing
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -573,32 +426,49 @@ class PathfindingVisualizer:
         
         # Set animation parameters
         self.show_steps = bool(self.ui.show_steps_var.get())
-        self.animation_delay = (101 - self.ui.animation_speed_var.get()) / 1000.0
-
-        path, cost = None, None
-
-        if self.ui.algorithm_var.get() == 'Dijkstra':
-            path, cost = self.graph.dijkstra(start_pos, end_pos, self)
-        elif self.ui.algorithm_var.get() == 'BFS':
-            path, cost = self.graph.bfs(start_pos, end_pos, self)
-        elif self.ui.algorithm_var.get() == 'DFS':
-            path, cost = self.graph.dfs(start_pos, end_pos, self)
-
-        return path, cost
+        self.cells_per_frame = playback.cells_per_frame(self.ui.animation_speed_var.get())
+
+        # Random weights are never a stock layout, so they skip the landmark lookup
+        landmarks = None
+        weight_mode = self.ui.weight_var.get()
+        if (self.ui.algorithm_var.get() == 'A*' and self.ui.maze_var.get() == 'Fixed Maze'
+                and weight_mode != 'Random Weights'):
+            weights = self.fixed_weights if weight_mode == 'Fixed Weights' else None
+            landmarks = for_stock_maze(self.graph, self.fixed_maze, weights, start_pos, end_pos)
+
+        # Search headless first, then replay the recorded trace
+        result = engine.find_path(self.graph, self.ui.algorithm_var.get(), start_pos, end_pos,
+                                  heuristic=self.ui.heuristic_var.get(),
+                                  record_trace=self.show_steps, landmarks=landmarks)
+        self.expanded = result.expanded
+        if result.trace:
+            self.play_trace(result.trace)
+
+        return result.path, result.cost
+
+    def play_trace(self, trace):
+        # Draw cells_per_frame trace entries, then flip only their rects
+        endpoints = (self.ui.start, self.ui.end)
+        for frame in playback.frames(trace, self.cells_per_frame):
+            for i, state in frame:
+                x, y = self.graph.coords(i)
+                if (x, y) not in endpoints:
+                    self.grid[x][y].show(self.trace_colors[state])
+            self.renderer.flush()
+            self.handle_quit()
+            self.clock.tick(playback.FPS)
 
     def display_path(self, path):
         if path:
-            # Animate path drawing
-            for i, (x, y) in enumerate(path):
-                if i == 0:
-                    self.grid[x][y].show(self.green, 0)  # Start
-                elif i == len(path) - 1:
-                    self.grid[x][y].show(self.red, 0)    # End
-                else:
-                    self.grid[x][y].show(self.blue, 0)   # Path
-                
-                pygame.display.update()
-                time.sleep(0.1)  # Path animation delay
+            # Animate path drawing, a few cells per frame on long paths
+            colors = [self.green] + [self.blue] * (len(path) - 2) + [self.red]
+            cells = list(zip(path, colors))
+            for frame in playback.frames(cells, playback.path_cells_per_frame(path)):
+                for (x, y), color in frame:
+                    self.grid[x][y].show(color)
+                self.renderer.flush()
+                self.handle_quit()
+                self.clock.tick(playback.FPS)
 
     def handle_mouse_input(self):
         mouse_pos = pygame.mouse.get_pos()
@@ -611,23 +481,105 @@ class PathfindingVisualizer:
             if (0 < grid_x < self.cols-1 and 0 < grid_y < self.rows-1 and
                 (grid_x, grid_y) != self.ui.start and (grid_x, grid_y) != self.ui.end):
                 
-                if mouse_pressed[0]:  # Left click - add wall
-                    self.grid[grid_x][grid_y].is_obstacle = True
-                    self.grid[grid_x][grid_y].show(self.black, 0)
-                elif mouse_pressed[2]:  # Right click - remove wall
-                    self.grid[grid_x][grid_y].is_obstacle = False
-                    self.grid[grid_x][grid_y].show(self.white, 0)
+                node = self.grid[grid_x][grid_y]
+                if mouse_pressed[0] and not node.is_obstacle:  # Left click - add wall
+                    node.is_obstacle = True
+                    node.show(self.black)
+                    self.graph.set_obstacle(grid_x, grid_y)
+                elif mouse_pressed[2] and node.is_obstacle:  # Right click - remove wall
+                    node.is_obstacle = False
+                    node.weight = 1
+                    node.show(self.white)
+                    self.graph.clear_obstacle(grid_x, grid_y)
+                    self.graph.set_weight(grid_x, grid_y, 1)
+                else:
+                    return
                 
-                # Rebuild graph when walls change
-                self.graph.build_graph()
+                # Only the painted cell changed: patch it instead of rebuilding
+                self.renderer.flush()
+
+                if self.planner:
+                    self.planner.update_cell(grid_x, grid_y)
+                    self.update_live_path()
+                if self.flow_field:
+                    self.flow_field_stale = True
+
+    def refresh_flow_field(self):
+        """Rebuild a stale flow field once the mouse is released, not per painted cell"""
+        if self.flow_field_stale and not any(pygame.mouse.get_pressed()):
+            self.flow_field_stale = False
+            if self.flow_field:
+                self.flow_field = FlowField(self.graph, self.ui.end)
+                self.show_flow_field()
+
+    def cell_color(self, x, y):
+        node = self.grid[x][y]
+        if (x, y) == self.ui.start:
+            return self.green
+        if (x, y) == self.ui.end:
+            return self.red
+        if node.is_obstacle:
+            return self.black
+        if node.weight > 1:
+            return self.weight_colors[node.weight - 1]
+        return self.white
+
+    def toggle_live_path(self):
+        if self.planner:
+            self.planner = None
+        else:
+            self.planner = LPAStar(self.graph, self.ui.start, self.ui.end)
+        self.update_live_path()
+
+    def update_live_path(self):
+        """Repair the live path with LPA* and redraw only the cells that changed"""
+        new_path = []
+        if self.planner:
+            self.planner.compute_shortest_path()
+            new_path = self.planner.path() or []
+
+        old_cells = set(self.live_path[1:-1])
+        new_cells = set(new_path[1:-1])
+        for x, y in old_cells - new_cells:
+            self.grid[x][y].show(self.cell_color(x, y))
+        for x, y in new_cells - old_cells:
+            self.grid[x][y].show(self.blue)
+        self.live_path = new_path
+        self.renderer.flush()
+
+    def toggle_flow_field(self):
+        self.flow_field_stale = False
+        self.flow_field = None if self.flow_field else FlowField(self.graph, self.ui.end)
+        self.show_flow_field()
+
+    def show_flow_field(self):
+        """Shade every reachable cell by its cost to the end, or restore the normal colors"""
+        field = self.flow_field
+        far = max((c for c in field.cost if c != INF), default=0) if field else 0
+        for x in range(self.cols):
+            for y in range(self.rows):
+                cost = field.cost_to_goal((x, y)) if field else INF
+                if cost == INF or (x, y) in (self.ui.start, self.ui.end):
+                    self.grid[x][y].show(self.cell_color(x, y))
+                else:
+                    t = cost / far if far else 0
+                    self.grid[x][y].show(tuple(int(a + (b - a) * t) for a, b in
+                                               zip(self.field_near, self.field_far)))
+        # Keep the live path on top
+        for x, y in self.live_path[1:-1]:
+            self.grid[x][y].show(self.blue)
+        self.renderer.flush()
 
     def show_result(self, path, cost):
+        if isinstance(cost, float):
+            cost = round(cost, 2)   # diagonal steps cost sqrt(2)
         if path:
             algorithm = self.ui.algorithm_var.get()
-            if algorithm == 'Dijkstra':
+            if algorithm in self.ui.weighted_algorithms:
                 message = f"Shortest weighted path found!\nTotal cost: {cost}"
             else:
                 message = f"Path found using {algorithm}!\nPath length: {cost} steps"
+            message += f"\nNodes expanded: {self.expanded}"
             
             root = tk.Tk()
             root.withdraw()
@@ -649,6 +601,7 @@ class PathfindingVisualizer:
         
         if not hasattr(self.ui, 'start'):
             return
+        self.diagonal = self.graph.diagonal = bool(self.ui.diagonal_var.get())
 
         # Set start and end nodes
         self.start_node = self.grid[self.ui.start[0]][self.ui.start[1]]
@@ -662,9 +615,11 @@ class PathfindingVisualizer:
         self.graph.build_graph()
 
         # Show start and end nodes
-        self.start_node.show(self.green, 0)
-        self.end_node.show(self.red, 0)
+        self.start_node.show(self.green)
+        self.end_node.show(self.red)
 
+        # First frame: the whole grid surface goes to the display once
+        self.renderer.flush()
         pygame.display.update()
 
         # Main game loop
@@ -679,6 +634,12 @@ class PathfindingVisualizer:
                     if event.key == pygame.K_SPACE and not pathfinding_started:
                         pathfinding_started = True
                         
+                        # Clear the live preview and flow field before the real search runs
+                        self.planner = None
+                        self.update_live_path()
+                        if self.flow_field:
+                            self.toggle_flow_field()
+                        
                         # Run pathfinding
                         path, cost = self.run_pathfinding()
                         
@@ -690,7 +651,7 @@ class PathfindingVisualizer:
                         
                         if action == "restart":
                             pygame.quit()
-                            visualizer = PathfindingVisualizer()
+                            visualizer = PathfindingVisualizer(self.cols)
                             visualizer.run()
                             return
                         else:
@@ -707,23 +668,42 @@ class PathfindingVisualizer:
                         # Reset start and end nodes
                         self.start_node = self.grid[self.ui.start[0]][self.ui.start[1]]
                         self.end_node = self.grid[self.ui.end[0]][self.ui.end[1]]
-                        self.start_node.show(self.green, 0)
-                        self.end_node.show(self.red, 0)
+                        self.start_node.show(self.green)
+                        self.end_node.show(self.red)
                         
                         # Reset pathfinding state
                         pathfinding_started = False
+                        self.live_path = []
+                        self.flow_field = None
+                        if self.planner:
+                            self.planner = LPAStar(self.graph, self.ui.start, self.ui.end)
+                            self.update_live_path()
                         
-                        pygame.display.update()
+                        # Only cells that differ from the previous run are redrawn
+                        self.renderer.flush()
+                    elif event.key == pygame.K_l and not pathfinding_started:
+                        self.toggle_live_path()
+                    elif event.key == pygame.K_f and not pathfinding_started:
+                        self.toggle_flow_field()
                 
                 # Handle mouse input for drawing/erasing walls
                 if not pathfinding_started:
                     self.handle_mouse_input()
+            self.refresh_flow_field()
             
             # Cap the frame rate
-            self.clock.tick(60)
+            self.clock.tick(playback.FPS)
 
         pygame.quit()
 
+def main():
+    parser = argparse.ArgumentParser(description="Pygame pathfinding visualizer")
+    parser.add_argument('--size', type=int, default=50,
+                        help="cells per side (at least 12); 100 and up draw through NumPy if installed")
+    args = parser.parse_args()
+    if args.size < 12:
+        parser.error("--size must be at least 12")
+    PathfindingVisualizer(args.size).run()
+
 if __name__ == "__main__":
-    visualizer = PathfindingVisualizer()
-    visualizer.run()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Obstacle patterns of the Tk GUI's "Random Obstacles" button.
+
+Each generator takes the grid size and a random source (the random
+module, or a random.Random for reproducible layouts) and returns the set
+of wall cells. Callers remove the start and end cells themselves.
+"""
+import math
+
+
+def maze_walls(cols, rows, rng):
+    walls = set()
+    for wall_x in range(5, cols, 8):
+        for y in range(1, rows - 1):
+            if rng.random() < 0.7:
+                walls.add((wall_x, y))
+    for wall_y in range(5, rows, 6):
+        for x in range(1, cols - 1):
+            if rng.random() < 0.6:
+                walls.add((x, wall_y))
+    return walls
+
+
+def spiral(cols, rows, rng):
+    walls = set()
+    center_x, center_y = cols // 2, rows // 2
+    max_radius = min(center_x, center_y) - 2
+    for radius in range(2, max_radius, 3):
+        for angle in range(0, 360, 15):
+            x = center_x + int(radius * math.cos(math.radians(angle)))
+            y = center_y + int(radius * math.sin(math.radians(angle)))
+            if 0 <= x < cols and 0 <= y < rows:
+                walls.add((x, y))
+    return walls
+
+
+def clusters(cols, rows, rng):
+    walls = set()
+    for _ in range(rng.randint(4, 7)):
+        cluster_x = rng.randint(3, cols - 4)
+        cluster_y = rng.randint(3, rows - 4)
+        for _ in range(rng.randint(8, 15)):
+            x = cluster_x + rng.randint(-3, 3)
+            y = cluster_y + rng.randint(-3, 3)
+            if 0 <= x < cols and 0 <= y < rows:
+                walls.add((x, y))
+    return walls
+
+
+def corridors(cols, rows, rng):
+    walls = set()
+    for corridor_y in [rows // 4, 3 * rows // 4]:
+        for x in range(cols):
+            if rng.random() < 0.8:
+                walls.add((x, corridor_y))
+                walls.add((x, corridor_y + 1 if corridor_y < rows - 1 else corridor_y - 1))
+    for corridor_x in [cols // 3, 2 * cols // 3]:
+        for y in range(rows):
+            if rng.random() < 0.7:
+                walls.add((corridor_x, y))
+    return walls
+
+
+PATTERNS = {
+    'maze_walls': maze_walls,
+    'spiral': spiral,
+    'clusters': clusters,
+    'corridors': corridors,
+}
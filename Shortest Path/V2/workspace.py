@@ -0,0 +1,37 @@
+from array import array
+
+INF = float('inf')
+MAX_GENERATION = 2 ** 32 - 1
+
+
+class SearchWorkspace:
+    """Per-node search state that is reset in O(1) between queries.
+
+    dist and parent are allocated once for the graph size. An entry only
+    counts if the node's seen stamp equals the current generation, so
+    begin() bumps the generation instead of refilling the arrays and a
+    query costs in proportion to the nodes it touches. closed stamps mark
+    settled nodes the same way.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.dist = [INF] * size
+        self.parent = [-1] * size
+        self.seen = array('L', [0]) * size     # generation dist/parent were written in
+        self.closed = array('L', [0]) * size   # generation the node was settled in
+        self.generation = 0
+
+    def begin(self):
+        """Start a new query and return its generation stamp."""
+        self.generation += 1
+        if self.generation == MAX_GENERATION:
+            # Stamps are about to wrap: clear them once and start over
+            self.seen = array('L', [0]) * self.size
+            self.closed = array('L', [0]) * self.size
+            self.generation = 1
+        return self.generation
+
+    def cost(self, i):
+        """Cost of node i found by the current query, INF if it was not reached."""
+        return self.dist[i] if self.seen[i] == self.generation else INF
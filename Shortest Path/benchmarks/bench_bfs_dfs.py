@@ -0,0 +1,100 @@
+"""Compare copy-the-path BFS/DFS with the parent-pointer versions.
+
+The old searches pushed ``list(path) + [neighbor]`` for every neighbor, so
+time and memory grow with V * L. On an open grid that means millions of
+list copies; the parent-pointer searches store one predecessor per node.
+Each run searches from the top-left corner to the grid center.
+
+Usage:
+    python bench_bfs_dfs.py --sizes 50 100 200
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Shortest_Path import Graph
+
+
+def open_grid(n):
+    graph = Graph()
+    for x in range(n):
+        for y in range(n):
+            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < n and 0 <= ny < n:
+                    graph.add_edge((x, y), (nx, ny))
+    return graph
+
+
+def copying_bfs(graph, start, end):
+    queue = deque([[start]])
+    visited = set()
+    while queue:
+        path = queue.popleft()
+        node = path[-1]
+        if node not in visited:
+            visited.add(node)
+            for adj in graph.adjacent_list[node]:
+                new_path = list(path)
+                new_path.append(adj)
+                if adj == end:
+                    return new_path
+                queue.append(new_path)
+    return None
+
+
+def copying_dfs(graph, start, end):
+    stack = [[start]]
+    visited = set()
+    while stack:
+        path = stack.pop()
+        node = path[-1]
+        if node == end:
+            return path
+        if node not in visited:
+            visited.add(node)
+            for neighbor in graph.adjacent_list[node]:
+                if neighbor not in visited:
+                    new_path = list(path)
+                    new_path.append(neighbor)
+                    stack.append(new_path)
+    return None
+
+
+def measure(search, graph, start, end):
+    tracemalloc.start()
+    began = time.perf_counter()
+    path = search(graph, start, end)
+    elapsed = time.perf_counter() - began
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, len(path) if path else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200])
+    args = parser.parse_args()
+
+    searches = [
+        ('bfs copy', copying_bfs),
+        ('bfs parent', Graph.bfs),
+        ('dfs copy', copying_dfs),
+        ('dfs parent', Graph.dfs),
+    ]
+    print(f"{'grid':>9} {'search':>11} {'time (s)':>10} {'peak (MB)':>10} {'path':>7}")
+    for n in args.sizes:
+        graph = open_grid(n)
+        start, end = (0, 0), (n // 2, n // 2 + 1)
+        for name, search in searches:
+            elapsed, peak, length = measure(search, graph, start, end)
+            print(f"{n:>4}x{n:<4} {name:>11} {elapsed:>10.3f} {peak / 2**20:>10.2f} {length:>7}")
+
+
+if __name__ == '__main__':
+    main()
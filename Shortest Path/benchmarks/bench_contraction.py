@@ -0,0 +1,64 @@
+"""Contraction hierarchy: preprocessing cost versus per-query speedup.
+
+Builds the hierarchy once, then answers the same random queries with
+engine.dijkstra and ContractionHierarchy.query; costs must agree and
+unpacked paths must have the same cost. Memory is the tracemalloc peak
+during the build plus the edge count of the finished hierarchy.
+
+Usage:
+    python bench_contraction.py --sizes 200 1000 --queries 200 --seed 1
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from common import fixed_graph, path_cost, random_grid, random_queries
+
+import engine
+from contraction import ContractionHierarchy
+
+
+def report(name, graph, queries):
+    tracemalloc.start()
+    began = time.perf_counter()
+    hierarchy = ContractionHierarchy(graph)
+    build_time = time.perf_counter() - began
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    began = time.perf_counter()
+    flat = [engine.dijkstra(graph, s, t)[1] for s, t in queries]
+    flat_time = time.perf_counter() - began
+
+    began = time.perf_counter()
+    answers = [hierarchy.query(s, t) for s, t in queries]
+    ch_time = time.perf_counter() - began
+
+    for cost, (path, ch_cost, _) in zip(flat, answers):
+        assert cost == ch_cost == path_cost(graph, path)
+
+    print(f"{name}: build {build_time:.1f} s, peak {peak / 2**20:.0f} MiB, "
+          f"{hierarchy.shortcuts} shortcuts, {hierarchy.edge_count()} edges")
+    print(f"  dijkstra {flat_time / len(queries) * 1e3:.2f} ms/q, "
+          f"CH {ch_time / len(queries) * 1e3:.3f} ms/q, "
+          f"speedup {flat_time / ch_time:.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[200])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    graph = fixed_graph()
+    report('fixed maze 50x50', graph, random_queries(graph, args.queries, rng))
+    for n in args.sizes:
+        graph = random_grid(n, rng, 0.25, args.seed)
+        report(f'random {n}x{n}', graph, random_queries(graph, args.queries, rng))
+
+
+if __name__ == '__main__':
+    main()
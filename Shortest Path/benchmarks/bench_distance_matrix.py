@@ -0,0 +1,67 @@
+"""Many-to-many distances: one Dijkstra per pair versus distance_matrix().
+
+The pair loop calls engine.dijkstra for every (source, target). The
+batch API runs one multi-target search per source, first in this
+process and then fanned out over a process pool reading the grid from
+shared memory. All three must agree. Needs NumPy.
+
+Usage:
+    python bench_distance_matrix.py --size 300 --sources 32 --targets 32 --processes 4 --seed 1
+"""
+import argparse
+import random
+
+from common import random_grid, timed
+
+import numpy as np
+
+import engine
+from distance_matrix import distance_matrix
+
+
+def random_cells(graph, count, rng):
+    cells = []
+    while len(cells) < count:
+        cell = (rng.randrange(graph.cols), rng.randrange(graph.rows))
+        if cell in graph:
+            cells.append(cell)
+    return cells
+
+
+def pair_loop(graph, sources, targets):
+    matrix = np.full((len(sources), len(targets)), np.inf)
+    for i, source in enumerate(sources):
+        for j, target in enumerate(targets):
+            cost = engine.dijkstra(graph, graph.index(source), graph.index(target))[1]
+            if cost is not None:
+                matrix[i, j] = cost
+    return matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=300)
+    parser.add_argument('--sources', type=int, default=32)
+    parser.add_argument('--targets', type=int, default=32)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    graph = random_grid(args.size, rng, weight_seed=args.seed)
+    sources = random_cells(graph, args.sources, rng)
+    targets = random_cells(graph, args.targets, rng)
+
+    pairs, pair_time = timed(pair_loop, graph, sources, targets)
+    serial, serial_time = timed(distance_matrix, graph, sources, targets, processes=1)
+    pooled, pool_time = timed(distance_matrix, graph, sources, targets, processes=args.processes)
+    assert np.array_equal(pairs, serial) and np.array_equal(pairs, pooled)
+
+    print(f"{args.size}x{args.size} grid, {args.sources} sources x {args.targets} targets")
+    print(f"{'per-pair loop':>22} {pair_time:>8.2f} s")
+    print(f"{'multi-target, 1 proc':>22} {serial_time:>8.2f} s")
+    print(f"{f'multi-target, {args.processes} proc':>22} {pool_time:>8.2f} s")
+
+
+if __name__ == '__main__':
+    main()
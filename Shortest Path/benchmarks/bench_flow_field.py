@@ -0,0 +1,60 @@
+"""Many agents, one goal: a search per agent versus a single FlowField.
+
+Each agent either runs its own engine.dijkstra to the goal or reads its
+next steps from one shared FlowField. The field is built with the NumPy
+wavefront on a uniform grid and with the reverse Dijkstra fallback on a
+weighted one; both must give every agent the same cost as its own
+search. Needs NumPy for the vectorized rows.
+
+Usage:
+    python bench_flow_field.py --size 300 --agents 200 --seed 1
+"""
+import argparse
+import random
+
+from common import random_grid, timed
+
+import engine
+import flow_field
+from flow_field import FlowField
+
+
+def report(name, graph, args):
+    rng = random.Random(args.seed)
+    free = [i for i in range(graph.size) if not graph.obstacles[i]]
+    goal = rng.choice(free)
+    agents = [rng.choice(free) for _ in range(args.agents)]
+
+    searches, search_time = timed(lambda: [engine.dijkstra(graph, a, goal)[1] for a in agents])
+    field, field_time = timed(FlowField, graph, graph.coords(goal))
+    paths, walk_time = timed(lambda: [field.path_from(graph.coords(a)) for a in agents])
+    for cost, agent, path in zip(searches, agents, paths):
+        assert (cost is None) == (path is None)
+        assert cost is None or cost == field.cost[agent] == sum(
+            graph.weights[graph.index(cell)] for cell in path[1:])
+
+    numpy, flow_field.np = flow_field.np, None
+    _, loop_time = timed(FlowField, graph, graph.coords(goal))
+    flow_field.np = numpy
+
+    print(f"{name}: {args.agents} agents")
+    print(f"  {'one dijkstra per agent':>28} {search_time * 1e3:>9.1f} ms")
+    print(f"  {'FlowField (NumPy)':>28} {field_time * 1e3:>9.1f} ms "
+          f"+ {walk_time * 1e3:.1f} ms to walk every path")
+    print(f"  {'FlowField (no NumPy)':>28} {loop_time * 1e3:>9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=300)
+    parser.add_argument('--agents', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    n = args.size
+    report(f'uniform {n}x{n}', random_grid(n, random.Random(args.seed)), args)
+    report(f'weighted {n}x{n}', random_grid(n, random.Random(args.seed), weight_seed=args.seed), args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Long queries on a large grid: flat A* versus HPA* over clusters.
+
+HPA* is timed twice: cold (entrance costs are built as the abstract
+search reaches them, which on weighted maps is most of the grid) and
+warm (same queries again, everything cached). Then a few
+walls are toggled, cell_changed() drops the affected clusters and the
+queries run a third time. The optimality gap is HPA* cost over the flat
+A* cost. HPA* is not optimal: see hpa.py for the bound printed last.
+
+Usage:
+    python bench_hpa.py --size 1024 --cluster 32 --queries 20 --seed 1
+"""
+import argparse
+import random
+import time
+
+from common import random_grid
+
+import engine
+from hpa import HierarchicalGrid
+
+
+def far_queries(graph, count, rng):
+    """Pairs of free cells at least half the grid apart (Manhattan)."""
+    queries = []
+    while len(queries) < count:
+        s, t = rng.randrange(graph.size), rng.randrange(graph.size)
+        (sx, sy), (tx, ty) = graph.coords(s), graph.coords(t)
+        if not graph.obstacles[s] and not graph.obstacles[t] and abs(sx - tx) + abs(sy - ty) > graph.cols:
+            queries.append((s, t))
+    return queries
+
+
+def clusters(graph, size):
+    return [(cx, cy) for cx in range((graph.cols + size - 1) // size)
+            for cy in range((graph.rows + size - 1) // size)]
+
+
+def timed_queries(search, queries):
+    began = time.perf_counter()
+    results = [search(s, t) for s, t in queries]
+    return results, (time.perf_counter() - began) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1024)
+    parser.add_argument('--cluster', type=int, default=32)
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--edits', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    graph = random_grid(args.size, rng, 0.25, args.seed)
+    queries = far_queries(graph, args.queries, rng)
+    hierarchy = HierarchicalGrid(graph, args.cluster)
+
+    flat, flat_time = timed_queries(lambda s, t: engine.astar(graph, s, t), queries)
+    cold, cold_time = timed_queries(hierarchy.find_path, queries)
+    warm, warm_time = timed_queries(hierarchy.find_path, queries)
+    built = sum(len(edges) for edges in hierarchy.intra.values())
+    entrances = sum(len(hierarchy.cluster_crossings(c)) for c in clusters(graph, args.cluster))
+
+    for _ in range(args.edits):
+        x, y = rng.randrange(graph.cols), rng.randrange(graph.rows)
+        graph.obstacles[graph.index((x, y))] ^= 1
+        hierarchy.cell_changed(x, y)
+    edited, edited_time = timed_queries(hierarchy.find_path, queries)
+
+    gaps = [h[1] / f[1] for f, h in zip(flat, warm) if f[1]]
+    assert all((f[1] is None) == (h[1] is None) for f, h in zip(flat, warm))
+    print(f"{args.size}x{args.size} grid, {args.cluster}x{args.cluster} clusters, "
+          f"{built} of {entrances} entrances built by the cold queries")
+    print(f"{'flat A*':>16} {flat_time * 1e3:>9.1f} ms/q")
+    print(f"{'HPA* cold':>16} {cold_time * 1e3:>9.1f} ms/q")
+    print(f"{'HPA* warm':>16} {warm_time * 1e3:>9.1f} ms/q")
+    print(f"{f'HPA* {args.edits} edits':>16} {edited_time * 1e3:>9.1f} ms/q")
+    if gaps:
+        print(f"optimality gap: mean {sum(gaps) / len(gaps) - 1:.1%}, max {max(gaps) - 1:.1%} "
+              f"(worst path {max(gaps):.2f}x optimal)")
+    print(f"bound: optimal + {(args.cluster + 1) * graph.max_weight()} "
+          f"(cluster + 1 times max weight) per cluster border the optimal path crosses")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Repeated A* queries on a fixed grid: Manhattan heuristic versus ALT landmarks.
+
+Landmarks are built once (farthest-point selection, forward and
+backward Dijkstra tables) and then loaded from the on-disk cache, so
+both costs are reported. Every query must return the same cost with and
+without landmarks; the interesting columns are nodes expanded and time.
+
+Usage:
+    python bench_landmarks.py --size 200 --landmarks 8 --queries 200 --seed 1
+"""
+import argparse
+import random
+import tempfile
+import time
+
+from common import fixed_graph, random_grid, random_queries
+
+import engine
+from landmarks import Landmarks
+
+
+def run(graph, queries, landmarks=None):
+    costs, expanded = [], 0
+    began = time.perf_counter()
+    for s, t in queries:
+        _, cost, count = engine.astar(graph, s, t, landmarks=landmarks)
+        costs.append(cost)
+        expanded += count
+    return costs, expanded, time.perf_counter() - began
+
+
+def report(name, graph, args, rng):
+    queries = random_queries(graph, args.queries, rng)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        began = time.perf_counter()
+        landmarks = Landmarks.load_or_build(graph, args.landmarks, cache_dir)
+        build_time = time.perf_counter() - began
+        began = time.perf_counter()
+        Landmarks.load_or_build(graph, args.landmarks, cache_dir)
+        load_time = time.perf_counter() - began
+
+    plain, plain_expanded, plain_time = run(graph, queries)
+    alt, alt_expanded, alt_time = run(graph, queries, landmarks)
+    assert plain == alt
+
+    print(f"{name}: build {build_time:.2f} s, cache load {load_time * 1e3:.1f} ms")
+    print(f"  {'heuristic':>10} {'expanded/q':>11} {'ms/q':>8}")
+    print(f"  {'Manhattan':>10} {plain_expanded / len(queries):>11.0f} "
+          f"{plain_time / len(queries) * 1e3:>8.2f}")
+    print(f"  {'ALT':>10} {alt_expanded / len(queries):>11.0f} "
+          f"{alt_time / len(queries) * 1e3:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=200)
+    parser.add_argument('--landmarks', type=int, default=8)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report('fixed maze 50x50', fixed_graph(), args, rng)
+    report(f'random {args.size}x{args.size}', random_grid(args.size, rng, 0.25, args.seed), args, rng)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Repair cost of LPA* after a single-cell edit versus a full recompute.
+
+Each edit toggles a wall on a cell of the current shortest path (the case
+that forces a replan) or on a random free cell. The repair only expands
+vertices whose distance changed; the full recompute plans from scratch.
+
+Usage:
+    python bench_lpa_star.py --sizes 50 500 --edits 20 --seed 1
+"""
+import argparse
+import random
+import time
+
+from common import random_grid
+
+from lpa_star import LPAStar
+
+
+def run(n, edits, rng):
+    graph = random_grid(n, rng, weight_seed=rng.randrange(2**31))
+    start, goal = (1, 1), (n - 2, n - 2)
+    graph.clear_obstacle(*start)
+    graph.clear_obstacle(*goal)
+    planner = LPAStar(graph, start, goal)
+    planner.compute_shortest_path()
+
+    repair_time = full_time = 0.0
+    repair_expanded = full_expanded = 0
+    for _ in range(edits):
+        path = planner.path() or [start, goal]
+        if rng.random() < 0.5 and len(path) > 2:
+            x, y = rng.choice(path[1:-1])
+        else:
+            x, y = rng.randrange(1, n - 1), rng.randrange(1, n - 1)
+            if (x, y) in (start, goal):
+                continue
+        if graph.obstacles[graph.index((x, y))]:
+            graph.clear_obstacle(x, y)
+        else:
+            graph.set_obstacle(x, y)
+
+        before = planner.expanded
+        began = time.perf_counter()
+        planner.update_cell(x, y)
+        repaired = planner.compute_shortest_path()
+        repair_time += time.perf_counter() - began
+        repair_expanded += planner.expanded - before
+
+        began = time.perf_counter()
+        fresh = LPAStar(graph, start, goal)
+        recomputed = fresh.compute_shortest_path()
+        full_time += time.perf_counter() - began
+        full_expanded += fresh.expanded
+
+        assert repaired == recomputed, (repaired, recomputed)
+
+    return repair_time / edits, full_time / edits, repair_expanded / edits, full_expanded / edits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 500])
+    parser.add_argument('--edits', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'grid':>9} {'repair ms':>10} {'full ms':>10} {'repair exp':>11} {'full exp':>10}")
+    for n in args.sizes:
+        repair, full, repair_exp, full_exp = run(n, args.edits, rng)
+        print(f"{n:>4}x{n:<4} {repair * 1000:>10.2f} {full * 1000:>10.2f} "
+              f"{repair_exp:>11.0f} {full_exp:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
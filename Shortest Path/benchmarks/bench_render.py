@@ -0,0 +1,57 @@
+"""Full-frame redraw time of the pygame grid renderers.
+
+Every frame recolors a random 1% of the cells and flushes. GridRenderer
+draws each changed cell with pygame.draw.rect; ArrayGridRenderer (needs
+NumPy) pushes the whole uint8 state buffer through one surfarray blit.
+Runs on the dummy SDL video driver, so no window is opened.
+
+Usage:
+    python bench_render.py --sizes 50 256 1024 --frames 20 --seed 1
+"""
+import argparse
+import os
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from common import timed
+
+import pygame
+
+from grid_renderer import GridRenderer, ArrayGridRenderer, np
+
+COLORS = [(236, 240, 241), (44, 62, 80), (155, 89, 182), (52, 152, 219), (41, 128, 185)]
+
+
+def run(renderer_class, screen, n, frames, rng):
+    renderer = renderer_class(screen, n, n, COLORS[0], (149, 165, 166))
+    changes = max(1, n * n // 100)
+    elapsed = 0.0
+    for _ in range(frames):
+        for _ in range(changes):
+            renderer.paint(rng.randrange(n), rng.randrange(n), rng.choice(COLORS))
+        elapsed += timed(renderer.flush)[1]
+    return elapsed / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 256, 1024])
+    parser.add_argument('--frames', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((900, 900))
+    rng = random.Random(args.seed)
+    print(f"{'grid':>11} {'rects ms':>10} {'array ms':>10}")
+    for n in args.sizes:
+        rects = run(GridRenderer, screen, n, args.frames, rng)
+        array = run(ArrayGridRenderer, screen, n, args.frames, rng) if np is not None else None
+        array_text = f"{array * 1000:>10.2f}" if array is not None else f"{'no numpy':>10}"
+        print(f"{n:>5}x{n:<5} {rects * 1000:>10.2f} {array_text}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""Run every pathfinding algorithm on a set of maps and write one row per query.
+
+Maps come from MovingAI .scen files (their .map is looked up next to the
+.scen file, or in --maps-dir), plain .map files with seeded random
+queries, and the built-in layouts: 'fixed' (fixed_maze/fixed_weights
+from V2/data.py), each obstacle pattern of Shortest_Path.py, and
+'random', which picks one of those patterns the way its button does.
+Generated layouts get seeded cell weights unless --weights uniform.
+
+Each row holds the nodes expanded, priority queue pushes as the engine
+reports them (blank for BFS/DFS style searches, which use no queue), the best wall time over --repeat
+runs, the tracemalloc peak and the optimality gap: the weighted cost
+of the returned path over the Dijkstra cost, minus one. The same
+arguments and --seed always give the same maps and queries. With
+--diagonal every map is 8-connected, which is what the published
+MovingAI optimal lengths assume.
+
+Usage:
+    python bench_suite.py --builtin fixed random spiral --queries 20 --seed 1 --format csv
+    python bench_suite.py --scen maps/arena.map.scen --max-scen 100 --diagonal --format json -o arena.json
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from common import fixed_graph, path_cost, random_queries
+
+import engine
+from grid_graph import GridGraph, seeded_weights
+from movingai import load_map, load_scenarios
+from patterns import PATTERNS
+
+FIELDS = ['map', 'query', 'algorithm', 'start', 'goal', 'cost', 'path_cost', 'optimal',
+          'published_optimal', 'gap', 'expanded', 'pushes', 'time_ms', 'peak_kib']
+
+
+def pattern_graph(name, cols, rows, rng):
+    if name == 'random':
+        name = rng.choice(list(PATTERNS))
+    graph = GridGraph(cols, rows)
+    for x, y in PATTERNS[name](cols, rows, rng):
+        graph.set_obstacle(x, y)
+    return graph
+
+
+def coord_queries(graph, count, rng):
+    """random_queries as (start, goal, None), the shape .scen queries come in."""
+    return [(graph.coords(s), graph.coords(t), None) for s, t in random_queries(graph, count, rng)]
+
+
+def workloads(args, rng):
+    """Yield (name, graph, queries) for everything asked for on the command line."""
+    for name in args.builtin:
+        if name == 'fixed':
+            graph = fixed_graph()
+        else:
+            graph = pattern_graph(name, args.cols, args.rows, rng)
+            if args.weights == 'seeded':
+                graph.weights = seeded_weights(graph.size, args.seed)
+                graph.weights_changed()
+        graph.diagonal = args.diagonal
+        yield name, graph, coord_queries(graph, args.queries, rng)
+
+    for path in args.map:
+        graph = load_map(path)
+        graph.diagonal = args.diagonal
+        yield os.path.basename(path), graph, coord_queries(graph, args.queries, rng)
+
+    for path in args.scen:
+        scenarios = load_scenarios(path)[:args.max_scen or None]
+        by_map = {}
+        for scenario in scenarios:
+            by_map.setdefault(scenario.map_name, []).append(
+                (scenario.start, scenario.goal, scenario.optimal))
+        for map_name, queries in by_map.items():
+            map_dir = args.maps_dir or os.path.dirname(path)
+            graph = load_map(os.path.join(map_dir, os.path.basename(map_name)))
+            graph.diagonal = args.diagonal
+            yield map_name, graph, queries
+
+
+def measure(graph, algorithm, start, goal, args):
+    """One search: the timed runs go first, then one more under tracemalloc."""
+    best = float('inf')
+    for _ in range(args.repeat):
+        began = time.perf_counter()
+        result = engine.find_path(graph, algorithm, start, goal, heuristic=args.heuristic)
+        best = min(best, time.perf_counter() - began)
+    tracemalloc.start()
+    engine.find_path(graph, algorithm, start, goal, heuristic=args.heuristic)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, result.pushes, best, peak
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    rows = []
+    for name, graph, queries in workloads(args, rng):
+        for number, (start, goal, published) in enumerate(queries):
+            optimal = engine.find_path(graph, 'Dijkstra', start, goal).cost
+            for algorithm in args.algorithms:
+                result, pushes, seconds, peak = measure(graph, algorithm, start, goal, args)
+                cost = path_cost(graph, result.path) if result.found else None
+                gap = None
+                if cost is not None and optimal:
+                    gap = round(cost / optimal - 1, 6)
+                elif cost is not None:
+                    gap = 0.0
+                rows.append({
+                    'map': name, 'query': number, 'algorithm': algorithm,
+                    'start': f'{start[0]},{start[1]}', 'goal': f'{goal[0]},{goal[1]}',
+                    'cost': result.cost, 'path_cost': cost, 'optimal': optimal,
+                    'published_optimal': published, 'gap': gap,
+                    'expanded': result.expanded, 'pushes': pushes,
+                    'time_ms': round(seconds * 1e3, 4), 'peak_kib': round(peak / 1024, 1),
+                })
+    return rows
+
+
+def write(rows, args):
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        if args.format == 'json':
+            json.dump(rows, out, indent=1)
+            out.write('\n')
+        else:
+            writer = csv.DictWriter(out, FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if args.output:
+            out.close()
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected 1 or more, got {value}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--builtin', nargs='*', choices=['fixed', 'random', *PATTERNS],
+                        help="built-in layouts (default: all of them unless --map/--scen)")
+    parser.add_argument('--map', nargs='*', default=[], help="MovingAI .map files, random queries")
+    parser.add_argument('--scen', nargs='*', default=[], help="MovingAI .scen files")
+    parser.add_argument('--maps-dir', help="where .scen files find their maps")
+    parser.add_argument('--max-scen', type=int, default=0, help="first N scenarios per file (0: all)")
+    parser.add_argument('--algorithms', nargs='+', choices=list(engine.ALGORITHMS),
+                        default=list(engine.ALGORITHMS))
+    parser.add_argument('--heuristic', default='Manhattan')
+    parser.add_argument('--cols', type=int, default=40, help="size of generated layouts")
+    parser.add_argument('--rows', type=int, default=25)
+    parser.add_argument('--weights', choices=['seeded', 'uniform'], default='seeded')
+    parser.add_argument('--diagonal', action='store_true',
+                        help="8-connected moves, diagonals cost sqrt(2)")
+    parser.add_argument('--queries', type=int, default=20, help="random queries per map")
+    parser.add_argument('--repeat', type=positive_int, default=1, help="timed runs per query, best is kept")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv')
+    parser.add_argument('-o', '--output')
+    args = parser.parse_args()
+    if args.builtin is None:
+        args.builtin = [] if args.map or args.scen else ['fixed', 'random', *PATTERNS]
+
+    write(run(args), args)
+
+
+if __name__ == '__main__':
+    main()
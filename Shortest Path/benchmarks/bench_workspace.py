@@ -0,0 +1,86 @@
+"""Many short Dijkstra queries: fresh per-query arrays versus the reused workspace.
+
+The fresh version allocates inf/parent arrays for every node and scans
+the weights to pick its queue before the first pop, like the old
+searches did. engine.dijkstra bumps a generation stamp in the graph's
+SearchWorkspace instead, so a query only pays for the nodes it reaches.
+Targets are a few steps from their sources and in the same component.
+
+Usage:
+    python bench_workspace.py --sizes 100 500 --queries 2000 --seed 1
+"""
+import argparse
+import random
+import time
+
+from common import random_grid
+
+import engine
+from bucket_queue import make_queue
+from connectivity import ConnectivityIndex
+
+
+def fresh_dijkstra(graph, source, target):
+    costs = [float('inf')] * graph.size
+    costs[source] = 0
+    parent = [-1] * graph.size
+    parent[source] = source
+    pq = make_queue(set(graph.weights))
+    pq.push(0, source)
+    closed = bytearray(graph.size)
+    while pq:
+        cost, node = pq.pop()
+        if node == target:
+            return cost
+        if closed[node]:
+            continue
+        closed[node] = 1
+        for neighbor, weight in graph.edges(node):
+            new_cost = cost + weight
+            if not closed[neighbor] and new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parent[neighbor] = node
+                pq.push(new_cost, neighbor)
+    return None
+
+
+def short_queries(graph, count, rng, reach=3):
+    components = ConnectivityIndex(graph)
+    queries = []
+    while len(queries) < count:
+        x, y = rng.randrange(graph.cols), rng.randrange(graph.rows)
+        tx = min(max(x + rng.randint(-reach, reach), 0), graph.cols - 1)
+        ty = min(max(y + rng.randint(-reach, reach), 0), graph.rows - 1)
+        if components.connected((x, y), (tx, ty)):
+            queries.append((graph.index((x, y)), graph.index((tx, ty))))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'grid':>9} {'fresh us/q':>11} {'workspace us/q':>15}")
+    for n in args.sizes:
+        graph = random_grid(n, rng, weight_seed=args.seed)
+        queries = short_queries(graph, args.queries, rng)
+
+        began = time.perf_counter()
+        fresh = [fresh_dijkstra(graph, s, t) for s, t in queries]
+        fresh_time = time.perf_counter() - began
+
+        began = time.perf_counter()
+        reused = [engine.dijkstra(graph, s, t)[1] for s, t in queries]
+        reused_time = time.perf_counter() - began
+
+        assert fresh == reused
+        print(f"{n:>4}x{n:<4} {fresh_time / len(queries) * 1e6:>11.1f} "
+              f"{reused_time / len(queries) * 1e6:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Helpers shared by the benchmark scripts.
+
+Importing this module puts V2/ on sys.path, so a script can import the
+pathfinding modules right after it.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'V2'))
+
+from connectivity import ConnectivityIndex
+from data import fixed_maze, fixed_weights
+from grid_graph import GridGraph
+from heuristics import SQRT2
+
+
+def fixed_graph():
+    """The fixed maze and weights from V2/data.py."""
+    graph = GridGraph(len(fixed_maze[0]), len(fixed_maze))
+    for y, row in enumerate(fixed_maze):
+        for x, wall in enumerate(row):
+            if wall:
+                graph.set_obstacle(x, y)
+            graph.weights[graph.index((x, y))] = fixed_weights[y][x]
+    graph.weights_changed()
+    return graph
+
+
+def random_grid(n, rng, wall_ratio=0.2, weight_seed=None):
+    """n x n grid with walls drawn from rng; seeded weights unless weight_seed is None."""
+    graph = GridGraph(n, n)
+    if weight_seed is not None:
+        graph.randomize_weights(weight_seed)
+    for i in range(graph.size):
+        if rng.random() < wall_ratio:
+            graph.obstacles[i] = 1
+    return graph
+
+
+def random_queries(graph, count, rng):
+    """Up to count (source, target) index pairs of distinct connected free cells."""
+    components = ConnectivityIndex(graph)
+    free = [i for i in range(graph.size) if not graph.obstacles[i]]
+    queries = []
+    for _ in range(count * 100):
+        if len(queries) == count or len(free) < 2:
+            break
+        s, t = rng.choice(free), rng.choice(free)
+        if s != t and components.connected(graph.coords(s), graph.coords(t)):
+            queries.append((s, t))
+    return queries
+
+
+def path_cost(graph, path):
+    """Weighted cost of a path of (x, y) cells; diagonal steps cost SQRT2 times the weight."""
+    cost = 0
+    for (x, y), cell in zip(path, path[1:]):
+        step = graph.weights[graph.index(cell)]
+        cost += step if x == cell[0] or y == cell[1] else step * SQRT2
+    return cost
+
+
+def timed(fn, *args, **kwargs):
+    """(fn(*args, **kwargs), seconds it took)."""
+    began = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - began
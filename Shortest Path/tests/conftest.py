@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules under test import each other as top-level modules from V2/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'V2'))
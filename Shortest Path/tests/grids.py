@@ -0,0 +1,68 @@
+"""Random weighted grids and a plain Dijkstra to check every search against."""
+import heapq
+import random
+
+from grid_graph import GridGraph
+
+INF = float('inf')
+
+# (cols, rows, diagonal): 1- and 2-column grids are where index arithmetic slips
+CASES = [(cols, rows, diagonal)
+         for cols, rows in [(1, 7), (2, 7), (7, 2), (6, 5), (9, 8)]
+         for diagonal in (False, True)]
+
+
+def case_id(case):
+    cols, rows, diagonal = case
+    return f"{cols}x{rows}-{'8' if diagonal else '4'}"
+
+
+def random_grid(cols, rows, diagonal, seed, wall_ratio=0.2, max_weight=9):
+    rng = random.Random(seed)
+    graph = GridGraph(cols, rows, diagonal=diagonal)
+    for i in range(graph.size):
+        graph.weights[i] = rng.randint(1, max_weight)
+        if rng.random() < wall_ratio:
+            graph.obstacles[i] = 1
+    graph.weights_changed()
+    return graph
+
+
+def case_grid(case, **kwargs):
+    cols, rows, diagonal = case
+    return random_grid(cols, rows, diagonal, seed=cols * 100 + rows * 2 + diagonal, **kwargs)
+
+
+def plain_dijkstra(graph, source):
+    """Cost from cell index source to every cell index (INF if unreachable)."""
+    dist = [INF] * graph.size
+    if graph.obstacles[source]:
+        return dist
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if cost > dist[node]:
+            continue
+        for neighbor, weight in graph.edges(node):
+            if cost + weight < dist[neighbor]:
+                dist[neighbor] = cost + weight
+                heapq.heappush(heap, (cost + weight, neighbor))
+    return dist
+
+
+def all_costs(graph):
+    """costs[s][t] for every pair of cell indices."""
+    return [plain_dijkstra(graph, s) for s in range(graph.size)]
+
+
+def free_cells(graph):
+    return [i for i in range(graph.size) if not graph.obstacles[i]]
+
+
+def path_cost(graph, path):
+    """Cost of a path of (x, y) cells; fails on a step that is not a legal move."""
+    cost = 0
+    for a, b in zip(path, path[1:]):
+        cost += dict(graph.edges(graph.index(a)))[graph.index(b)]
+    return cost
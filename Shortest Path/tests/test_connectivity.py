@@ -0,0 +1,31 @@
+import random
+
+import pytest
+
+from connectivity import ConnectivityIndex
+
+from .grids import CASES, INF, case_grid, case_id, plain_dijkstra
+
+
+def check(graph, components):
+    for s in range(graph.size):
+        costs = plain_dijkstra(graph, s)
+        for t in range(graph.size):
+            expected = not graph.obstacles[s] and costs[t] != INF
+            assert components.connected(graph.coords(s), graph.coords(t)) == expected
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+def test_connected_matches_dijkstra_reachability_through_edits(case):
+    graph = case_grid(case, wall_ratio=0.35)
+    components = ConnectivityIndex(graph)
+    rng = random.Random(case_id(case))
+    for _ in range(10):
+        check(graph, components)
+        x, y = rng.randrange(graph.cols), rng.randrange(graph.rows)
+        if graph.obstacles[graph.index((x, y))]:
+            graph.clear_obstacle(x, y)
+            components.cell_freed(x, y)
+        else:
+            graph.set_obstacle(x, y)
+            components.cell_blocked(x, y)
@@ -0,0 +1,21 @@
+import pytest
+
+from contraction import ContractionHierarchy
+
+from .grids import CASES, INF, all_costs, case_grid, case_id, free_cells, path_cost
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+def test_queries_match_dijkstra(case):
+    graph = case_grid(case)
+    costs = all_costs(graph)
+    hierarchy = ContractionHierarchy(graph)
+    for s in free_cells(graph):
+        for t in free_cells(graph):
+            path, cost, _ = hierarchy.query(s, t)
+            if costs[s][t] == INF:
+                assert path is None
+                continue
+            assert cost == pytest.approx(costs[s][t])
+            assert path[0] == graph.coords(s) and path[-1] == graph.coords(t)
+            assert path_cost(graph, path) == pytest.approx(costs[s][t])
@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+import engine
+from grid_graph import GridGraph
+from heuristics import SQRT2
+
+
+@pytest.mark.parametrize('cols', [1, 2, 3])
+def test_narrow_grids_agree_on_octile_cost(cols):
+    rng = random.Random(cols)
+    graph = GridGraph(cols, 6, diagonal=True)
+    for i in rng.sample(range(graph.size), graph.size // 5):
+        graph.obstacles[i] = 1
+    free = list(graph.vertices())
+    for start in free:
+        for goal in free:
+            expected = engine.find_path(graph, 'Dijkstra', start, goal).cost
+            for algorithm in ('A*', 'JPS'):
+                cost = engine.find_path(graph, algorithm, start, goal, heuristic='Octile').cost
+                assert cost == pytest.approx(expected), (algorithm, start, goal)
+
+
+def test_diagonal_step_costs_sqrt2_on_two_columns():
+    graph = GridGraph(2, 3, diagonal=True)
+    assert dict(graph.edges(1))[2] == pytest.approx(SQRT2)
+    assert dict(graph.reverse_edges(2))[1] == pytest.approx(SQRT2)
+    assert engine.find_path(graph, 'Dijkstra', (1, 0), (0, 1)).cost == pytest.approx(SQRT2)
@@ -0,0 +1,22 @@
+import pytest
+
+from .grids import CASES, all_costs, case_grid, case_id, free_cells
+
+np = pytest.importorskip('numpy')
+from distance_matrix import distance_matrix  # noqa: E402  (needs NumPy)
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+def test_matrix_matches_dijkstra(case):
+    graph = case_grid(case)
+    costs = all_costs(graph)
+    cells = [graph.coords(i) for i in range(graph.size)]
+    matrix = distance_matrix(graph, cells, cells, processes=1)
+    assert np.allclose(matrix, np.array(costs))
+
+
+def test_process_pool_matches_one_process():
+    graph = case_grid((9, 8, True))
+    cells = [graph.coords(i) for i in free_cells(graph)]
+    assert np.array_equal(distance_matrix(graph, cells, cells, processes=2),
+                          distance_matrix(graph, cells, cells, processes=1))
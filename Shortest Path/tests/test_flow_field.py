@@ -0,0 +1,34 @@
+import pytest
+
+import flow_field
+from flow_field import FlowField
+
+from .grids import CASES, INF, all_costs, case_grid, case_id, free_cells, path_cost
+
+
+def check(graph):
+    costs = all_costs(graph)
+    for goal in free_cells(graph):
+        field = FlowField(graph, graph.coords(goal))
+        for s in free_cells(graph):
+            cell = graph.coords(s)
+            assert field.cost_to_goal(cell) == pytest.approx(costs[s][goal])
+            path = field.path_from(cell)
+            if costs[s][goal] == INF:
+                assert path is None
+            else:
+                assert path[-1] == graph.coords(goal)
+                assert path_cost(graph, path) == pytest.approx(costs[s][goal])
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+@pytest.mark.parametrize('max_weight', [1, 9], ids=['uniform', 'weighted'])
+def test_field_matches_dijkstra(case, max_weight):
+    check(case_grid(case, max_weight=max_weight))
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+@pytest.mark.parametrize('max_weight', [1, 9], ids=['uniform', 'weighted'])
+def test_field_without_numpy_matches_dijkstra(case, max_weight, monkeypatch):
+    monkeypatch.setattr(flow_field, 'np', None)
+    check(case_grid(case, max_weight=max_weight))
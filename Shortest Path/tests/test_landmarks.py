@@ -0,0 +1,28 @@
+import pytest
+
+import engine
+from landmarks import Landmarks
+
+from .grids import CASES, INF, all_costs, case_grid, case_id, free_cells
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+def test_bounds_are_admissible_and_astar_stays_optimal(case):
+    graph = case_grid(case)
+    costs = all_costs(graph)
+    landmarks = Landmarks.build(graph, count=4)
+    for t in free_cells(graph):
+        h = landmarks.heuristic_to(t, graph)
+        for s in free_cells(graph):
+            if costs[s][t] == INF:
+                continue
+            assert h(s) <= costs[s][t] + 1e-9
+            assert engine.astar(graph, s, t, landmarks=landmarks)[1] == pytest.approx(costs[s][t])
+
+
+def test_cache_round_trip(tmp_path):
+    graph = case_grid((6, 5, True))
+    built = Landmarks.load_or_build(graph, 4, str(tmp_path))
+    loaded = Landmarks.load_or_build(graph, 4, str(tmp_path))
+    assert loaded.landmarks == built.landmarks
+    assert loaded.forward == built.forward and loaded.backward == built.backward
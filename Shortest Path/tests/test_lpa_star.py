@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from lpa_star import LPAStar
+
+from .grids import CASES, INF, case_grid, case_id, free_cells, path_cost, plain_dijkstra
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+def test_repairs_match_a_fresh_dijkstra_after_every_edit(case):
+    graph = case_grid(case)
+    free = free_cells(graph)
+    start, goal = graph.coords(free[0]), graph.coords(free[-1])
+    planner = LPAStar(graph, start, goal)
+    rng = random.Random(case_id(case))
+    for _ in range(40):
+        planner.compute_shortest_path()
+        expected = plain_dijkstra(graph, free[0])[free[-1]]
+        assert planner.cost == pytest.approx(expected)
+        if expected != INF:
+            assert path_cost(graph, planner.path()) == pytest.approx(expected)
+
+        x, y = rng.randrange(graph.cols), rng.randrange(graph.rows)
+        if (x, y) in (start, goal):
+            continue
+        if rng.random() < 0.3:
+            graph.set_weight(x, y, rng.randint(1, 9))
+        elif graph.obstacles[graph.index((x, y))]:
+            graph.clear_obstacle(x, y)
+        else:
+            graph.set_obstacle(x, y)
+        planner.update_cell(x, y)
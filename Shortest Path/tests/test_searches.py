@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+import engine
+from bucket_queue import BucketQueue, HeapQueue
+from heuristics import HEURISTICS
+
+from .grids import CASES, INF, all_costs, case_grid, case_id, free_cells, path_cost
+
+
+def check(graph, costs, algorithm, **options):
+    for s in free_cells(graph):
+        for t in free_cells(graph):
+            start, goal = graph.coords(s), graph.coords(t)
+            result = engine.find_path(graph, algorithm, start, goal, **options)
+            if costs[s][t] == INF:
+                assert not result.found, (algorithm, start, goal)
+                continue
+            assert result.cost == pytest.approx(costs[s][t]), (algorithm, start, goal)
+            assert result.path[0] == start and result.path[-1] == goal
+            assert path_cost(graph, result.path) == pytest.approx(costs[s][t])
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+@pytest.mark.parametrize('algorithm', engine.WEIGHTED_ALGORITHMS)
+def test_weighted_searches_match_dijkstra(case, algorithm):
+    graph = case_grid(case)
+    check(graph, all_costs(graph), algorithm)
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+@pytest.mark.parametrize('heuristic', list(HEURISTICS))
+def test_astar_heuristics_are_admissible(case, heuristic):
+    graph = case_grid(case)
+    check(graph, all_costs(graph), 'A*', heuristic=heuristic)
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+def test_jps_matches_dijkstra_on_uniform_weights(case):
+    graph = case_grid(case, max_weight=1)
+    check(graph, all_costs(graph), 'JPS')
+
+
+@pytest.mark.parametrize('case', [case for case in CASES if not case[2]], ids=case_id)
+@pytest.mark.parametrize('algorithm', ['BFS', 'Bidirectional BFS'])
+def test_step_searches_match_dijkstra_on_uniform_weights(case, algorithm):
+    graph = case_grid(case, max_weight=1)
+    check(graph, all_costs(graph), algorithm)
+
+
+@pytest.mark.parametrize('case', CASES, ids=case_id)
+def test_dfs_finds_a_legal_path_exactly_when_one_exists(case):
+    graph = case_grid(case)
+    costs = all_costs(graph)
+    for s in free_cells(graph):
+        for t in free_cells(graph):
+            result = engine.find_path(graph, 'DFS', graph.coords(s), graph.coords(t))
+            assert result.found == (costs[s][t] != INF)
+            if result.found:
+                path_cost(graph, result.path)
+
+
+@pytest.mark.parametrize('case', [case for case in CASES if not case[2]], ids=case_id)
+def test_bucket_queue_and_heap_give_the_same_costs(case, monkeypatch):
+    graph = case_grid(case)
+    assert isinstance(graph.priority_queue(), BucketQueue)
+    buckets = [[engine.dijkstra(graph, s, t)[1] for t in free_cells(graph)]
+               for s in free_cells(graph)]
+    monkeypatch.setattr(graph, 'priority_queue', HeapQueue)
+    heap = [[engine.dijkstra(graph, s, t)[1] for t in free_cells(graph)]
+            for s in free_cells(graph)]
+    assert buckets == heap
+
+
+def test_bucket_queue_pops_the_cheapest_queued_cost():
+    rng = random.Random(7)
+    queue, queued = BucketQueue(15), {}
+    current = 0
+    for _ in range(2000):
+        if queued and rng.random() < 0.4:
+            cost, item = queue.pop()
+            assert cost == queued.pop(item) == min([cost, *queued.values()])
+            current = cost
+        else:
+            # Dijkstra only ever pushes costs within max_weight of the last pop
+            item, cost = rng.randrange(50), current + rng.randint(0, 15)
+            queue.push(cost, item)
+            queued[item] = min(cost, queued.get(item, INF))
+        assert len(queue) == len(queued)